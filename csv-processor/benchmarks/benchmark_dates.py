@@ -0,0 +1,166 @@
+"""Benchmark for csv-processor date standardization and ignore-case dedup.
+
+Writes a synthetic CSV, loads it, and compares the original row-by-row
+implementations (per-value ``strptime`` loop and ``map`` with a Python
+lambda) with the vectorized ``CSVProcessor`` code paths, reporting rows
+per second for each.
+
+Usage:
+    python benchmarks/benchmark_dates.py [--rows 5000000] [--skip-reference]
+"""
+
+import argparse
+import logging
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.main import CSVProcessor  # noqa: E402
+
+CONFIG_PATH = Path(__file__).resolve().parent.parent / "config.yaml"
+
+INPUT_FORMATS = [
+    "%Y-%m-%d",
+    "%m/%d/%Y",
+    "%d/%m/%Y",
+    "%Y/%m/%d",
+    "%B %d, %Y",
+]
+TARGET_FORMAT = "%Y-%m-%d"
+NAMES = ["Alice", "alice", "BOB", "Bob", "Carol", "carol", "DAVE", "dave"]
+
+
+def reference_try_parse_date(value: str, formats: List[str]) -> Optional[datetime]:
+    """Original scalar parser: try each format in turn with strptime."""
+    for fmt in formats:
+        try:
+            return datetime.strptime(value.strip(), fmt)
+        except (ValueError, AttributeError):
+            continue
+    return None
+
+
+def reference_standardize(values: pd.Series) -> Tuple[list, int, int]:
+    """Original row loop from ``_standardize_dates`` (handle_invalid: skip)."""
+    converted_values = []
+    standardized = 0
+    invalid = 0
+    for _, value in values.items():
+        if pd.isna(value):
+            converted_values.append(value)
+            continue
+        parsed_date = reference_try_parse_date(str(value), INPUT_FORMATS)
+        if parsed_date:
+            converted_values.append(parsed_date.strftime(TARGET_FORMAT))
+            standardized += 1
+        else:
+            converted_values.append(None)
+            invalid += 1
+    return converted_values, standardized, invalid
+
+
+def reference_ignore_case(df: pd.DataFrame) -> pd.DataFrame:
+    """Original ignore-case duplicate removal (``applymap`` + lambda)."""
+    df_lower = df.map(lambda x: str(x).lower() if pd.notna(x) else x)
+    return df[~df_lower.duplicated(keep="first")]
+
+
+def write_synthetic_csv(path: Path, rows: int, seed: int = 42) -> None:
+    """Write a CSV with a mixed-format date column and case-varied names."""
+    rng = random.Random(seed)
+    base = datetime(1990, 1, 1).toordinal()
+    days = [base + rng.randrange(15000) for _ in range(1000)]
+    date_pool = []
+    for ordinal in days:
+        day = datetime.fromordinal(ordinal)
+        date_pool.extend(day.strftime(fmt) for fmt in INPUT_FORMATS)
+    date_pool.extend(["not a date", "2020-02-30", ""])
+
+    frame = pd.DataFrame(
+        {
+            "id": [rng.randrange(rows // 4 + 1) for _ in range(rows)],
+            "name": [rng.choice(NAMES) for _ in range(rows)],
+            "date": [rng.choice(date_pool) for _ in range(rows)],
+        }
+    )
+    frame.to_csv(path, index=False)
+
+
+def make_processor(csv_path: Path) -> CSVProcessor:
+    """Create a processor with the benchmark settings and load the CSV."""
+    processor = CSVProcessor(config_path=str(CONFIG_PATH))
+    logging.getLogger().setLevel(logging.WARNING)
+    processor.config["date_standardization"].update(
+        {
+            "date_columns": ["date"],
+            "input_formats": INPUT_FORMATS,
+            "target_format": TARGET_FORMAT,
+            "handle_invalid_dates": "skip",
+        }
+    )
+    processor.config["duplicate_removal"].update(
+        {"method": "ignore_case", "case_sensitive": False, "keep": "first"}
+    )
+    processor.config.setdefault("reporting", {})["include_invalid_dates"] = False
+    processor.config["reporting"]["include_duplicates"] = False
+    processor.load_csv(str(csv_path))
+    return processor
+
+
+def main() -> None:
+    """Run the benchmark and print a rows-per-second table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--rows", type=int, default=5_000_000, help="Synthetic rows to generate"
+    )
+    parser.add_argument(
+        "--skip-reference",
+        action="store_true",
+        help="Only time the vectorized code paths",
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        csv_path = Path(temp_dir) / "synthetic.csv"
+        start = time.perf_counter()
+        write_synthetic_csv(csv_path, args.rows)
+        print(f"Wrote {args.rows:,} rows in {time.perf_counter() - start:.1f}s")
+
+        processor = make_processor(csv_path)
+        df = processor.df.copy()
+        results = []
+
+        if not args.skip_reference:
+            start = time.perf_counter()
+            reference_standardize(df["date"])
+            results.append(("dates: strptime loop", time.perf_counter() - start))
+
+        start = time.perf_counter()
+        processor._standardize_dates()
+        results.append(("dates: vectorized", time.perf_counter() - start))
+
+        if not args.skip_reference:
+            start = time.perf_counter()
+            reference_ignore_case(df)
+            results.append(("ignore case: map", time.perf_counter() - start))
+
+        processor.df = df.copy()
+        start = time.perf_counter()
+        processor._remove_duplicates()
+        results.append(("ignore case: str.lower", time.perf_counter() - start))
+
+    print(f"{args.rows:,} rows")
+    for label, elapsed in results:
+        print(f"  {label:<24} {elapsed:8.2f}s  {args.rows / elapsed:>12,.0f} rows/s")
+
+
+if __name__ == "__main__":
+    main()
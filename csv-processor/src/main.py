@@ -11,17 +11,231 @@ import os
 import re
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 import yaml
 from dotenv import load_dotenv
+from pandas.api.types import is_object_dtype, is_string_dtype
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.parquet as pq
+
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
 
 # Load environment variables
 load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+# Two independent 16-byte keys for pandas row hashing; together they give
+# 128-bit row digests, so cross-chunk duplicate detection never collides in
+# practice
+ROW_DIGEST_KEYS = ("csvprocessor-row", "csvprocessor-dup")
+
+# Placeholder for missing values when computing row digests
+MISSING_VALUE_TOKEN = "\x00<NA>"
+
+# Text recognized as booleans when inferring columnar output types
+BOOLEAN_TEXT = ["true", "false"]
+
+# Numbers recognized when inferring columnar output types: plain decimals
+# without leading zeros, so integers render back to the same text
+INTEGER_TEXT_PATTERN = r"^-?(?:0|[1-9][0-9]*)$"
+FLOAT_TEXT_PATTERN = r"^-?(?:0|[1-9][0-9]*)(?:\.[0-9]+)?(?:[eE][-+]?[0-9]+)?$"
+
+# Output format implied by each output file extension (output.format: auto)
+OUTPUT_FORMATS = {
+    ".csv": "csv",
+    ".parquet": "parquet",
+    ".pq": "parquet",
+    ".feather": "feather",
+    ".arrow": "feather",
+}
+
+
+class ColumnarWriter:
+    """Write DataFrame chunks to a Parquet or Feather (Arrow IPC) file.
+
+    Each written chunk becomes one Parquet row group or one Arrow record
+    batch, so output can be produced incrementally. All chunks are
+    converted with the same schema, keeping column types stable; columns
+    can be widened to text later, which rewrites the data written so far.
+    """
+
+    def __init__(
+        self,
+        file_path: Path,
+        file_format: str,
+        schema: "pa.Schema",
+        compression: Optional[str] = None,
+    ) -> None:
+        """Open the output file.
+
+        Args:
+            file_path: Path to output file.
+            file_format: "parquet" or "feather".
+            schema: Arrow schema every chunk is converted to.
+            compression: Codec name, or None for the format default
+                (snappy for Parquet, uncompressed for Feather so the file
+                can be memory-mapped).
+        """
+        self.file_path = Path(file_path)
+        self.file_format = file_format
+        self.compression = compression
+        self.schema = schema
+        self._open()
+
+    def _open(self) -> None:
+        """Open a writer for the current schema at the output path."""
+        if self.file_format == "parquet":
+            self._writer = pq.ParquetWriter(
+                str(self.file_path),
+                self.schema,
+                compression=self.compression or "snappy",
+            )
+        else:
+            options = pa.ipc.IpcWriteOptions(compression=self.compression)
+            self._writer = pa.ipc.new_file(
+                str(self.file_path), self.schema, options=options
+            )
+
+    def _written_tables(self, file_path: Path) -> Iterator["pa.Table"]:
+        """Yield the row groups / record batches of a finished file.
+
+        Args:
+            file_path: Path to a file written by this class.
+
+        Yields:
+            One table per row group or record batch.
+        """
+        if self.file_format == "parquet":
+            parquet_file = pq.ParquetFile(str(file_path))
+            for index in range(parquet_file.num_row_groups):
+                yield parquet_file.read_row_group(index)
+        else:
+            with pa.memory_map(str(file_path)) as source:
+                reader = pa.ipc.open_file(source)
+                for index in range(reader.num_record_batches):
+                    yield pa.Table.from_batches([reader.get_batch(index)])
+
+    def widen(self, columns: List[str]) -> None:
+        """Change columns to text, converting everything written so far.
+
+        Existing values are rendered the way pandas renders them, so text
+        written before and after widening looks the same.
+
+        Args:
+            columns: Names of the columns to store as strings.
+        """
+        columns = [
+            name
+            for name in columns
+            if not pa.types.is_string(self.schema.field(name).type)
+        ]
+        if not columns:
+            return
+
+        self._writer.close()
+        previous_path = self.file_path.with_name(self.file_path.name + ".widen")
+        os.replace(self.file_path, previous_path)
+        for name in columns:
+            index = self.schema.get_field_index(name)
+            self.schema = self.schema.set(index, pa.field(name, pa.string()))
+        self._open()
+
+        try:
+            for table in self._written_tables(previous_path):
+                for name in columns:
+                    index = table.schema.get_field_index(name)
+                    values = table.column(index).to_pandas(integer_object_nulls=True)
+                    text = values.astype(str).where(values.notna(), None)
+                    table = table.set_column(
+                        index, name, pa.array(text, type=pa.string())
+                    )
+                self._writer.write_table(table.cast(self.schema))
+        finally:
+            previous_path.unlink()
+        logger.debug(f"Stored column(s) {columns} as text in {self.file_path}")
+
+    def write(self, df: pd.DataFrame) -> None:
+        """Append a chunk as one row group / record batch.
+
+        Args:
+            df: DataFrame with the columns of the writer's schema.
+        """
+        table = pa.Table.from_pandas(df, schema=self.schema, preserve_index=False)
+        self._writer.write_table(table)
+
+    def close(self) -> None:
+        """Finish the file footer and close it."""
+        self._writer.close()
+
+
+class RowDigestSet:
+    """Set of 128-bit row digests stored as sorted NumPy runs.
+
+    Each distinct row costs 16 bytes. New digests are appended as a sorted
+    run, and runs are merged while the previous run is at most twice as
+    large, so there are O(log n) runs to search and each digest is merged
+    O(log n) times.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty set."""
+        self._runs: List[np.ndarray] = []
+
+    def __len__(self) -> int:
+        """Return the number of digests in the set."""
+        return sum(len(run) for run in self._runs)
+
+    def _contains(self, keys: np.ndarray) -> np.ndarray:
+        """Check which keys are already in the set.
+
+        Args:
+            keys: Digests to look up.
+
+        Returns:
+            Boolean array, True where the key is in the set.
+        """
+        found = np.zeros(len(keys), dtype=bool)
+        for run in self._runs:
+            positions = np.minimum(np.searchsorted(run, keys), len(run) - 1)
+            found |= run[positions] == keys
+        return found
+
+    def add(self, keys: np.ndarray) -> np.ndarray:
+        """Add digests and report which ones were not in the set before.
+
+        Args:
+            keys: Row digests (dtype S16), in row order.
+
+        Returns:
+            Boolean array, True for the first occurrence of each digest
+            that was not already in the set.
+        """
+        unique, first = np.unique(keys, return_index=True)
+        is_new = ~self._contains(unique)
+        unique, first = unique[is_new], first[is_new]
+
+        new_rows = np.zeros(len(keys), dtype=bool)
+        new_rows[first] = True
+
+        if len(unique):
+            self._runs.append(unique)
+            while len(self._runs) > 1 and len(self._runs[-2]) <= 2 * len(self._runs[-1]):
+                last = self._runs.pop()
+                merged = np.concatenate([self._runs.pop(), last])
+                merged.sort()
+                self._runs.append(merged)
+
+        return new_rows
+
 
 class CSVProcessor:
     """Processes CSV files with cleaning and validation."""
@@ -40,6 +254,9 @@ class CSVProcessor:
         self._setup_logging()
         self.df: Optional[pd.DataFrame] = None
         self.original_df: Optional[pd.DataFrame] = None
+        self.date_columns: Optional[List[str]] = None
+        self.column_stats: Dict[str, Dict[str, Any]] = {}
+        self.chunked = False
         self.report_lines: List[str] = []
         self.stats = {
             "original_rows": 0,
@@ -193,10 +410,14 @@ class CSVProcessor:
         else:
             # ignore_case method
             if not dup_config.get("case_sensitive", True):
-                # Convert to lowercase for comparison
-                df_lower = self.df.applymap(
-                    lambda x: str(x).lower() if pd.notna(x) else x
-                )
+                # Convert text columns to lowercase for comparison
+                df_lower = self.df.copy()
+                for col in df_lower.columns:
+                    values = df_lower[col]
+                    if is_object_dtype(values) or is_string_dtype(values):
+                        df_lower[col] = (
+                            values.astype(str).str.lower().where(values.notna())
+                        )
                 self.df = self.df[~df_lower.duplicated(keep=keep)]
 
         removed = original_count - len(self.df)
@@ -213,6 +434,10 @@ class CSVProcessor:
                     duplicates = self.original_df[
                         self.original_df.duplicated(keep=False)
                     ]
+                elif method == "ignore_case":
+                    duplicates = self.original_df.loc[
+                        df_lower.index[df_lower.duplicated(keep=False)]
+                    ]
                 else:
                     columns = dup_config.get("columns", [])
                     duplicates = self.original_df[
@@ -233,19 +458,12 @@ class CSVProcessor:
         input_formats = date_config.get("input_formats", [])
         handle_invalid = date_config.get("handle_invalid_dates", "skip")
 
-        # Auto-detect date columns if not specified
+        # Auto-detect date columns if not specified (once, so every chunk of a
+        # chunked run converts the same columns)
         if not date_columns:
-            date_columns = []
-            for col in self.df.columns:
-                # Try to parse a sample of values
-                sample = self.df[col].dropna().head(10)
-                if len(sample) > 0:
-                    date_count = 0
-                    for value in sample:
-                        if self._try_parse_date(str(value), input_formats):
-                            date_count += 1
-                    if date_count >= len(sample) * 0.7:  # 70% are dates
-                        date_columns.append(col)
+            if self.date_columns is None:
+                self.date_columns = self._detect_date_columns(input_formats)
+            date_columns = self.date_columns
 
         standardized = 0
         invalid = 0
@@ -255,29 +473,21 @@ class CSVProcessor:
                 logger.warning(f"Date column not found: {col}")
                 continue
 
-            original_values = self.df[col].copy()
-            converted_values = []
+            original_values = self.df[col]
+            converted = self._convert_dates(
+                original_values, input_formats, target_format
+            )
+            invalid_mask = original_values.notna() & converted.isna()
+            standardized += int(converted.notna().sum())
 
-            for idx, value in self.df[col].items():
-                if pd.isna(value):
-                    converted_values.append(value)
-                    continue
+            if handle_invalid == "keep_original":
+                converted = converted.where(~invalid_mask, original_values)
+            else:  # skip or set_null
+                invalid += int(invalid_mask.sum())
 
-                parsed_date = self._try_parse_date(str(value), input_formats)
-                if parsed_date:
-                    converted_values.append(parsed_date.strftime(target_format))
-                    standardized += 1
-                else:
-                    if handle_invalid == "skip":
-                        converted_values.append(None)
-                        invalid += 1
-                    elif handle_invalid == "keep_original":
-                        converted_values.append(value)
-                    else:  # set_null
-                        converted_values.append(None)
-                        invalid += 1
-
-            self.df[col] = converted_values
+            # Missing values stay as they were
+            converted = converted.where(original_values.notna(), original_values)
+            self.df[col] = converted.tolist()
 
         self.stats["dates_standardized"] = standardized
         self.stats["invalid_dates"] = invalid
@@ -301,6 +511,81 @@ class CSVProcessor:
                                 f"  Row {idx + 1}, Column '{col}': {row[col]}"
                             )
 
+    def _detect_date_columns(self, input_formats: List[str]) -> List[str]:
+        """Detect columns whose sampled values are mostly dates.
+
+        Args:
+            input_formats: Date formats to try.
+
+        Returns:
+            Names of detected date columns.
+        """
+        date_columns = []
+        for col in self.df.columns:
+            # Try to parse a sample of values
+            sample = self.df[col].dropna().head(10)
+            if len(sample) > 0:
+                date_count = 0
+                for value in sample:
+                    if self._try_parse_date(str(value), input_formats):
+                        date_count += 1
+                if date_count >= len(sample) * 0.7:  # 70% are dates
+                    date_columns.append(col)
+        return date_columns
+
+    def _convert_dates(
+        self, values: pd.Series, formats: List[str], target_format: str
+    ) -> pd.Series:
+        """Parse date strings and reformat them in the target format.
+
+        Each distinct value is parsed once. Formats are tried in order with
+        a vectorized ``pd.to_datetime`` pass over only the values no earlier
+        format matched. Values still unmatched afterwards (typically invalid
+        dates) are retried with ``_try_parse_date`` so dates pandas cannot
+        represent are not lost.
+
+        Args:
+            values: Column values; missing values are left unconverted.
+            formats: Date format strings to try, in order of preference.
+            target_format: Output date format.
+
+        Returns:
+            Series aligned with values holding formatted dates, or None
+            where the value is missing or no format matched.
+        """
+        present = values.notna().to_numpy()
+        text = values[present].astype(str).str.strip()
+        codes, uniques = pd.factorize(text)
+        uniques = pd.Series(uniques, dtype=object)
+        formatted = np.full(len(uniques), None, dtype=object)
+        pending = np.arange(len(uniques))
+
+        for fmt in formats:
+            if len(pending) == 0:
+                break
+            try:
+                parsed = pd.to_datetime(
+                    uniques.iloc[pending], format=fmt, errors="coerce"
+                )
+            except ValueError:
+                # Format pandas cannot vectorize; left to the fallback below
+                continue
+            matched = parsed.notna().to_numpy()
+            if matched.any():
+                formatted[pending[matched]] = (
+                    parsed[matched].dt.strftime(target_format).to_numpy()
+                )
+                pending = pending[~matched]
+
+        for index in pending:
+            parsed_date = self._try_parse_date(uniques.iloc[index], formats)
+            if parsed_date is not None:
+                formatted[index] = parsed_date.strftime(target_format)
+
+        converted = np.full(len(values), None, dtype=object)
+        converted[present] = formatted[codes]
+        return pd.Series(converted, index=values.index, dtype=object)
+
     def _try_parse_date(self, value: str, formats: List[str]) -> Optional[datetime]:
         """Try to parse date string using multiple formats.
 
@@ -356,8 +641,8 @@ class CSVProcessor:
             if removed > 0:
                 logger.info(f"Removed {removed} empty row(s)")
 
-        # Remove empty columns
-        if clean_config.get("remove_empty_columns", False):
+        # Remove empty columns (not per chunk: chunks must keep the same columns)
+        if clean_config.get("remove_empty_columns", False) and not self.chunked:
             before = len(self.df.columns)
             self.df = self.df.dropna(axis=1, how="all")
             removed = before - len(self.df.columns)
@@ -421,14 +706,15 @@ class CSVProcessor:
                 if col in self.df.columns:
                     min_val = range_config.get("min")
                     max_val = range_config.get("max")
+                    values = pd.to_numeric(self.df[col], errors="coerce")
                     if min_val is not None:
-                        below_min = (self.df[col] < min_val).sum()
+                        below_min = (values < min_val).sum()
                         if below_min > 0:
                             errors.append(
                                 f"Column '{col}': {below_min} value(s) below minimum {min_val}"
                             )
                     if max_val is not None:
-                        above_max = (self.df[col] > max_val).sum()
+                        above_max = (values > max_val).sum()
                         if above_max > 0:
                             errors.append(
                                 f"Column '{col}': {above_max} value(s) above maximum {max_val}"
@@ -442,6 +728,53 @@ class CSVProcessor:
             for error in errors:
                 self._add_report_line(f"  - {error}")
 
+    def _update_column_stats(self) -> None:
+        """Add the current DataFrame to the running column statistics.
+
+        Counts, minimum, maximum and sum are accumulated so statistics can be
+        reported for chunked runs without keeping every chunk in memory.
+        """
+        for col in self.df.columns:
+            series = self.df[col]
+            col_stats = self.column_stats.setdefault(
+                col,
+                {
+                    "dtypes": [],
+                    "non_null": 0,
+                    "null": 0,
+                    "numeric": True,
+                    "min": None,
+                    "max": None,
+                    "sum": 0.0,
+                },
+            )
+            non_null = int(series.notna().sum())
+            dtype = str(series.dtype)
+            # All-null chunks get placeholder dtypes; only record them if
+            # nothing better is known
+            if dtype not in col_stats["dtypes"] and (
+                non_null or not col_stats["dtypes"]
+            ):
+                col_stats["dtypes"].append(dtype)
+            col_stats["non_null"] += non_null
+            col_stats["null"] += len(series) - non_null
+
+            if self.chunked and series.dtype not in ["int64", "float64"]:
+                # Chunks are read as text; treat fully numeric columns as numbers
+                numbers = pd.to_numeric(series, errors="coerce")
+                if int(numbers.notna().sum()) == non_null:
+                    series = numbers
+
+            if series.dtype not in ["int64", "float64"]:
+                col_stats["numeric"] = False
+            elif col_stats["numeric"] and non_null:
+                low, high = series.min(), series.max()
+                if col_stats["min"] is None or low < col_stats["min"]:
+                    col_stats["min"] = low
+                if col_stats["max"] is None or high > col_stats["max"]:
+                    col_stats["max"] = high
+                col_stats["sum"] += float(series.sum())
+
     def _generate_report(self) -> None:
         """Generate validation report file."""
         report_config = self.config.get("reporting", {})
@@ -472,17 +805,20 @@ class CSVProcessor:
                 f.write("\n")
 
             if report_config.get("include_statistics", True):
+                if not self.column_stats and self.df is not None:
+                    self._update_column_stats()
                 f.write("Column Statistics\n")
                 f.write("-" * 60 + "\n")
-                for col in self.df.columns:
+                for col, col_stats in self.column_stats.items():
                     f.write(f"\nColumn: {col}\n")
-                    f.write(f"  Data Type: {self.df[col].dtype}\n")
-                    f.write(f"  Non-null Count: {self.df[col].notna().sum()}\n")
-                    f.write(f"  Null Count: {self.df[col].isnull().sum()}\n")
-                    if self.df[col].dtype in ["int64", "float64"]:
-                        f.write(f"  Min: {self.df[col].min()}\n")
-                        f.write(f"  Max: {self.df[col].max()}\n")
-                        f.write(f"  Mean: {self.df[col].mean():.2f}\n")
+                    f.write(f"  Data Type: {'/'.join(col_stats['dtypes'])}\n")
+                    f.write(f"  Non-null Count: {col_stats['non_null']}\n")
+                    f.write(f"  Null Count: {col_stats['null']}\n")
+                    if col_stats["numeric"] and col_stats["non_null"]:
+                        mean = col_stats["sum"] / col_stats["non_null"]
+                        f.write(f"  Min: {col_stats['min']}\n")
+                        f.write(f"  Max: {col_stats['max']}\n")
+                        f.write(f"  Mean: {mean:.2f}\n")
                 f.write("\n")
 
             # Write detailed report lines
@@ -503,6 +839,13 @@ class CSVProcessor:
 
         logger.info("Starting CSV processing")
 
+        chunk_size = self.config.get("processing", {}).get("chunk_size", 0)
+        if chunk_size:
+            output_file = self.config["files"].get("output_file")
+            if not output_file:
+                raise ValueError("Output file must be specified for chunked processing")
+            return self.process_chunked(input_file, output_file, chunk_size)
+
         # Load CSV
         self.load_csv(input_file)
 
@@ -513,6 +856,7 @@ class CSVProcessor:
         self._validate_data()
 
         self.stats["final_rows"] = len(self.df)
+        self._update_column_stats()
 
         # Generate report
         self._generate_report()
@@ -522,6 +866,359 @@ class CSVProcessor:
 
         return self.stats
 
+    def _duplicate_key(self) -> Optional[Tuple[List[str], bool]]:
+        """Resolve the columns and case handling used to detect duplicates.
+
+        Returns:
+            Tuple of (columns to compare, whether to lowercase values), or
+            None if duplicate removal is disabled or has nothing to compare.
+        """
+        dup_config = self.config.get("duplicate_removal", {})
+        if not dup_config.get("enabled", True):
+            return None
+
+        method = dup_config.get("method", "all_columns")
+        if method == "all_columns":
+            return list(self.df.columns), False
+        if method == "specific_columns":
+            columns = dup_config.get("columns", [])
+            valid_columns = [col for col in columns if col in self.df.columns]
+            if not valid_columns:
+                logger.warning("No valid columns specified for duplicate removal")
+                return None
+            return valid_columns, False
+        if not dup_config.get("case_sensitive", True):
+            return list(self.df.columns), True
+        return None
+
+    def _row_digests(
+        self, frame: pd.DataFrame, columns: List[str], lowercase: bool = False
+    ) -> np.ndarray:
+        """Calculate a 128-bit digest of each row.
+
+        Values are canonicalized first so that a row hashes the same way in
+        every chunk, whatever dtype pandas inferred for that chunk: numbers
+        are compared as floats and everything else as text.
+
+        Args:
+            frame: Rows to digest.
+            columns: Columns included in the digest.
+            lowercase: Whether to compare text case-insensitively.
+
+        Returns:
+            One 16-byte digest per row (dtype S16).
+        """
+        canonical = {}
+        for col in columns:
+            values = frame[col]
+            numbers = pd.to_numeric(values, errors="coerce")
+            text = values.astype(str)
+            if lowercase:
+                text = text.str.lower()
+            text = text.where(numbers.isna(), numbers.astype("float64").astype(str))
+            canonical[col] = text.where(values.notna(), MISSING_VALUE_TOKEN)
+
+        canonical_frame = pd.DataFrame(canonical, index=frame.index)
+        digests = np.empty(len(frame), dtype=[("high", ">u8"), ("low", ">u8")])
+        for field, key in zip(("high", "low"), ROW_DIGEST_KEYS):
+            digests[field] = pd.util.hash_pandas_object(
+                canonical_frame, index=False, hash_key=key
+            ).to_numpy()
+        return digests.view("S16")
+
+    def _last_occurrences(
+        self, csv_path: Path, chunk_size: int
+    ) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """Find the last row index of every distinct row (for keep: last).
+
+        Args:
+            csv_path: Input CSV file.
+            chunk_size: Rows per chunk.
+
+        Returns:
+            Tuple of (sorted distinct digests, index of each one's last
+            occurrence), 24 bytes per distinct row, or None if duplicate
+            removal has nothing to compare.
+        """
+        digest_chunks = []
+        row_chunks = []
+        for chunk in pd.read_csv(
+            csv_path, encoding="utf-8", chunksize=chunk_size, dtype=str
+        ):
+            self.df = chunk
+            key = self._duplicate_key()
+            if key is None:
+                return None
+            digest_chunks.append(self._row_digests(chunk, *key))
+            row_chunks.append(chunk.index.to_numpy(dtype=np.int64))
+
+        if not digest_chunks:
+            return None
+
+        digests = np.concatenate(digest_chunks)
+        rows = np.concatenate(row_chunks)
+        order = np.argsort(digests, kind="stable")
+        digests, rows = digests[order], rows[order]
+
+        # Within a run of equal digests, rows are in file order; keep the last
+        last = np.append(digests[1:] != digests[:-1], True)
+        return digests[last], rows[last]
+
+    def _drop_duplicate_rows(
+        self,
+        seen: RowDigestSet,
+        last_rows: Optional[Tuple[np.ndarray, np.ndarray]] = None,
+    ) -> None:
+        """Remove rows of the current chunk that duplicate any earlier row.
+
+        Args:
+            seen: Digests of rows kept so far; updated in place.
+            last_rows: For keep: last, the sorted digests and the index of
+                each one's last occurrence. Rows other than that occurrence
+                are dropped.
+        """
+        key = self._duplicate_key()
+        if key is None:
+            return
+
+        digests = self._row_digests(self.df, *key)
+        if last_rows is not None:
+            last_digests, last_indexes = last_rows
+            positions = np.searchsorted(last_digests, digests)
+            keep_mask = last_indexes[positions] == self.df.index.to_numpy()
+        else:
+            keep_mask = seen.add(digests)
+
+        mask = pd.Series(keep_mask, index=self.df.index, dtype=bool)
+        duplicates = self.df[~mask]
+        self.df = self.df[mask]
+        self.stats["duplicates_removed"] = len(duplicates)
+
+        if len(duplicates) > 0:
+            self._add_report_line(f"Duplicates Removed: {len(duplicates)} row(s)")
+            if self.config.get("reporting", {}).get("include_duplicates", True):
+                self._add_report_line("\nDuplicate Rows Details:")
+                for idx, row in duplicates.iterrows():
+                    self._add_report_line(f"  Row {idx + 1}: {dict(row)}")
+
+    @staticmethod
+    def _cast_text(
+        values: pd.Series, data_type: "pa.DataType"
+    ) -> Optional[pd.Series]:
+        """Convert a text column to an Arrow type.
+
+        Booleans must be spelled true/false (any case) and numbers must be
+        plain decimals without leading zeros, so identifiers such as "00501"
+        stay text and integers render back to the same text if the column
+        is widened later.
+
+        Args:
+            values: Column read as text.
+            data_type: Boolean, int64, float64 or string.
+
+        Returns:
+            Arrow-backed Series, or None if a present value does not fit.
+        """
+        text = pa.array(values, type=pa.string(), from_pandas=True)
+        if pa.types.is_boolean(data_type):
+            text = pc.utf8_lower(text)
+            valid = pc.or_(
+                pc.is_in(text, value_set=pa.array(BOOLEAN_TEXT)), pc.is_null(text)
+            )
+        elif pa.types.is_integer(data_type):
+            valid = pc.match_substring_regex(text, INTEGER_TEXT_PATTERN)
+        elif pa.types.is_floating(data_type):
+            valid = pc.match_substring_regex(text, FLOAT_TEXT_PATTERN)
+        else:
+            valid = None
+        # min_count=0: an empty or all-missing column fits any type
+        if valid is not None and not pc.all(valid, min_count=0).as_py():
+            return None
+        try:
+            typed = text.cast(data_type)
+        except (pa.ArrowInvalid, pa.ArrowNotImplementedError):
+            return None
+        return pd.Series(
+            typed,
+            index=values.index,
+            dtype=pd.ArrowDtype(data_type),
+            name=values.name,
+        )
+
+    @classmethod
+    def _text_column_type(cls, values: pd.Series) -> "pa.DataType":
+        """Infer the Arrow type of a text column from its values.
+
+        Args:
+            values: Column read as text.
+
+        Returns:
+            The first of boolean, int64 and float64 that every present
+            value converts to, otherwise string.
+        """
+        if values.notna().any():
+            for data_type in (pa.bool_(), pa.int64(), pa.float64()):
+                if cls._cast_text(values, data_type) is not None:
+                    return data_type
+        return pa.string()
+
+    @classmethod
+    def _cast_text_columns(
+        cls, df: pd.DataFrame, schema: "pa.Schema"
+    ) -> Tuple[pd.DataFrame, List[str]]:
+        """Convert text columns to the types of a columnar schema.
+
+        Args:
+            df: Chunk with every column read as text.
+            schema: Target schema from ColumnarWriter.
+
+        Returns:
+            Tuple of (converted DataFrame, names of columns with values
+            that do not fit their type; those are left as text).
+        """
+        converted = df.copy()
+        failed = []
+        for field in schema:
+            if pa.types.is_string(field.type):
+                continue
+            typed = cls._cast_text(df[field.name], field.type)
+            if typed is None:
+                failed.append(field.name)
+            else:
+                converted[field.name] = typed
+        return converted, failed
+
+    def process_chunked(
+        self, input_file: str, output_file: str, chunk_size: int
+    ) -> Dict[str, int]:
+        """Process a CSV file in chunks, writing output incrementally.
+
+        Only one chunk (plus its copy for reporting) is held in memory.
+        Values are read as text so every chunk has the same dtypes and
+        CSV output values match the input. Parquet/Feather column types are
+        inferred from the first chunk; a column that a later chunk cannot
+        be cast to is widened to text, rewriting the output written so
+        far. Duplicates across chunks are found
+        through sorted arrays of 128-bit row digests, which cost 16 bytes per
+        distinct row (24 with keep: last) on top of the chunk, so memory
+        still grows slowly with the number of distinct rows. Date columns
+        are auto-detected
+        on the first chunk, and remove_empty_columns is ignored because it
+        cannot be decided per chunk.
+
+        Args:
+            input_file: Path to input CSV file.
+            output_file: Path to output file (CSV, Parquet or Feather).
+            chunk_size: Rows per chunk.
+
+        Returns:
+            Dictionary with processing statistics.
+
+        Raises:
+            FileNotFoundError: If input file doesn't exist.
+            pd.errors.EmptyDataError: If input file is empty.
+        """
+        csv_path = Path(input_file)
+        if not csv_path.exists():
+            raise FileNotFoundError(f"CSV file not found: {input_file}")
+
+        output_path = Path(output_file)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        output_format = self._output_format(output_file)
+        writer: Optional[ColumnarWriter] = None
+
+        if self.config.get("data_cleaning", {}).get("remove_empty_columns", False):
+            logger.warning("remove_empty_columns is ignored in chunked mode")
+
+        logger.info(f"Processing {input_file} in chunks of {chunk_size} rows")
+
+        dup_config = self.config.get("duplicate_removal", {})
+        last_rows = None
+        if dup_config.get("enabled", True) and dup_config.get("keep") == "last":
+            last_rows = self._last_occurrences(csv_path, chunk_size)
+
+        totals = {key: 0 for key in self.stats}
+        seen = RowDigestSet()
+        chunks = 0
+        self.chunked = True
+
+        try:
+            for chunk in pd.read_csv(
+                csv_path, encoding="utf-8", chunksize=chunk_size, dtype=str
+            ):
+                chunks += 1
+                self.df = chunk
+                self.original_df = chunk.copy()
+                self.stats = {key: 0 for key in totals}
+                self.stats["original_rows"] = len(chunk)
+                report_start = len(self.report_lines)
+
+                self._drop_duplicate_rows(seen, last_rows)
+                self._standardize_dates()
+                self._clean_data()
+                self._validate_data()
+
+                if output_format == "csv":
+                    self.df.to_csv(
+                        output_path,
+                        mode="w" if chunks == 1 else "a",
+                        header=chunks == 1,
+                        index=False,
+                        encoding="utf-8",
+                    )
+                else:
+                    if writer is None:
+                        # Column types are inferred from the first chunk;
+                        # columns that later chunks cannot be cast to are
+                        # widened to text
+                        schema = pa.schema(
+                            [
+                                (str(col), self._text_column_type(self.df[col]))
+                                for col in self.df.columns
+                            ]
+                        )
+                        writer = ColumnarWriter(
+                            output_path,
+                            output_format,
+                            schema,
+                            self.config.get("output", {}).get("compression"),
+                        )
+                    typed, failed = self._cast_text_columns(self.df, writer.schema)
+                    if failed:
+                        writer.widen(failed)
+                    writer.write(typed)
+                self.stats["final_rows"] = len(self.df)
+                self._update_column_stats()
+
+                for key in totals:
+                    totals[key] += int(self.stats[key])
+
+                if len(self.report_lines) > report_start:
+                    self.report_lines.insert(
+                        report_start,
+                        f"\nChunk {chunks} (rows {chunk.index[0] + 1}-"
+                        f"{chunk.index[-1] + 1}):",
+                    )
+                logger.debug(f"Chunk {chunks}: {self.stats}")
+        except pd.errors.EmptyDataError:
+            raise pd.errors.EmptyDataError(f"CSV file is empty: {input_file}")
+        finally:
+            if writer is not None:
+                writer.close()
+            self.chunked = False
+            self.df = None
+            self.original_df = None
+
+        self.stats = totals
+        self._generate_report()
+
+        logger.info(
+            f"Processed {chunks} chunk(s); output saved to: {output_path}"
+        )
+        logger.info(f"Statistics: {self.stats}")
+
+        return self.stats
+
     def save_csv(self, file_path: str) -> None:
         """Save processed DataFrame to CSV file.
 
@@ -534,6 +1231,79 @@ class CSVProcessor:
         self.df.to_csv(output_path, index=False, encoding="utf-8")
         logger.info(f"Processed CSV saved to: {output_path}")
 
+    def save_columnar(self, file_path: str, file_format: str = "parquet") -> None:
+        """Save processed DataFrame to a Parquet or Feather file.
+
+        Column dtypes are kept, and the rows are written in slices of
+        output.row_group_size (one Parquet row group or Arrow record batch
+        each), so readers can load or memory-map the file without parsing.
+
+        Args:
+            file_path: Path to output file.
+            file_format: "parquet" or "feather".
+
+        Raises:
+            ImportError: If pyarrow is not installed.
+        """
+        if not HAS_PYARROW:
+            raise ImportError(f"pyarrow is required for {file_format} output")
+
+        output_path = Path(file_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+
+        output_config = self.config.get("output", {})
+        row_group_size = max(1, int(output_config.get("row_group_size", 100000)))
+        schema = pa.Schema.from_pandas(self.df, preserve_index=False)
+
+        writer = ColumnarWriter(
+            output_path, file_format, schema, output_config.get("compression")
+        )
+        try:
+            for start in range(0, len(self.df), row_group_size):
+                writer.write(self.df.iloc[start : start + row_group_size])
+        finally:
+            writer.close()
+
+        logger.info(f"Processed data saved as {file_format} to: {output_path}")
+
+    def save_output(self, file_path: str) -> None:
+        """Save processed DataFrame in the configured output format.
+
+        Args:
+            file_path: Path to output file.
+
+        Raises:
+            ValueError: If the configured output format is unknown.
+            ImportError: If a columnar format is requested without pyarrow.
+        """
+        output_format = self._output_format(file_path)
+        if output_format == "csv":
+            self.save_csv(file_path)
+        else:
+            self.save_columnar(file_path, output_format)
+
+    def _output_format(self, file_path: str) -> str:
+        """Resolve output.format, inferring it from the extension on "auto".
+
+        Args:
+            file_path: Path to output file.
+
+        Returns:
+            "csv", "parquet" or "feather".
+
+        Raises:
+            ValueError: If the configured output format is unknown.
+            ImportError: If a columnar format is requested without pyarrow.
+        """
+        output_format = self.config.get("output", {}).get("format", "auto")
+        if output_format == "auto":
+            output_format = OUTPUT_FORMATS.get(Path(file_path).suffix.lower(), "csv")
+        if output_format not in ("csv", "parquet", "feather"):
+            raise ValueError(f"Unknown output format: {output_format}")
+        if output_format != "csv" and not HAS_PYARROW:
+            raise ImportError(f"pyarrow is required for {output_format} output")
+        return output_format
+
 
 def main() -> int:
     """Main entry point for CSV processor."""
@@ -556,7 +1326,19 @@ def main() -> int:
     parser.add_argument(
         "-o",
         "--output",
-        help="Output CSV file path (overrides config)",
+        help="Output file path (overrides config)",
+    )
+    parser.add_argument(
+        "--format",
+        choices=["auto", "csv", "parquet", "feather"],
+        help="Output format; auto picks it from the output file extension "
+        "(overrides config)",
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        help="Process the input in chunks of this many rows, writing output "
+        "incrementally (overrides config)",
     )
 
     args = parser.parse_args()
@@ -568,15 +1350,21 @@ def main() -> int:
             processor.config["files"]["input_file"] = args.input
         if args.output:
             processor.config["files"]["output_file"] = args.output
+        if args.format:
+            processor.config.setdefault("output", {})["format"] = args.format
+        if args.chunk_size is not None:
+            processing_config = processor.config.setdefault("processing", {})
+            processing_config["chunk_size"] = args.chunk_size
 
         stats = processor.process()
 
-        # Save output
+        # Save output (chunked runs have already written it)
         output_file = processor.config["files"]["output_file"]
-        if output_file:
-            processor.save_csv(output_file)
-        else:
-            logger.warning("Output file not specified, skipping save")
+        if processor.df is not None:
+            if output_file:
+                processor.save_output(output_file)
+            else:
+                logger.warning("Output file not specified, skipping save")
 
         # Print summary
         print("\n" + "=" * 50)
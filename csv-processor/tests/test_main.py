@@ -5,11 +5,12 @@ import tempfile
 from pathlib import Path
 from unittest.mock import patch
 
+import numpy as np
 import pandas as pd
 import pytest
 import yaml
 
-from src.main import CSVProcessor
+from src.main import CSVProcessor, RowDigestSet
 
 
 @pytest.fixture
@@ -147,6 +148,49 @@ def test_standardize_dates(config_file, sample_csv):
                 assert "-" in str(value)  # Should be YYYY-MM-DD format
 
 
+def test_standardize_dates_handle_invalid(config_file):
+    """Test format order, missing values and invalid date handling."""
+    processor = CSVProcessor(config_path=str(config_file))
+    values = ["2024-02-07", "02/07/2024", "13/07/2024", None, "invalid", " 2024-02-07 "]
+
+    processor.df = pd.DataFrame({"date": values})
+    processor.original_df = processor.df.copy()
+    processor._standardize_dates()
+
+    assert processor.df["date"].tolist()[:3] == [
+        "2024-02-07",
+        "2024-02-07",
+        "2024-07-13",
+    ]
+    assert pd.isna(processor.df["date"][3]) and pd.isna(processor.df["date"][4])
+    assert processor.df["date"][5] == "2024-02-07"
+    assert processor.stats["dates_standardized"] == 4
+    assert processor.stats["invalid_dates"] == 1
+
+    processor.config["date_standardization"]["handle_invalid_dates"] = "keep_original"
+    processor.df = pd.DataFrame({"date": values})
+    processor._standardize_dates()
+
+    assert processor.df["date"][4] == "invalid"
+    assert processor.stats["invalid_dates"] == 0
+
+
+def test_remove_duplicates_ignore_case(config_file):
+    """Test case-insensitive duplicate removal on text columns."""
+    processor = CSVProcessor(config_path=str(config_file))
+    processor.config["duplicate_removal"].update(
+        {"method": "ignore_case", "case_sensitive": False}
+    )
+    processor.df = pd.DataFrame(
+        {"name": ["John", "JOHN", "john", None, None], "age": [30, 30, 31, 5, 5]}
+    )
+    processor.original_df = processor.df.copy()
+    processor._remove_duplicates()
+
+    assert processor.df.index.tolist() == [0, 2, 3]
+    assert processor.stats["duplicates_removed"] == 2
+
+
 def test_try_parse_date(config_file):
     """Test date parsing with multiple formats."""
     processor = CSVProcessor(config_path=str(config_file))
@@ -234,3 +278,139 @@ def test_generate_report(config_file, sample_csv, temp_dir):
         content = f.read()
         assert "Processing Summary" in content
         assert "Original Rows" in content
+
+
+def test_process_chunked_matches_full_load(config_file, sample_csv, temp_dir):
+    """Test chunked processing produces the same output as a full load."""
+    with open(sample_csv, "a", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["Jane Smith", "02/07/2024", "25", "jane@example.com"])
+        writer.writerow(["Ann", "2024-03-01", "", "ann@example.com"])
+        writer.writerow(["John Doe", "2024-02-07", "30", "john@example.com"])
+
+    processor = CSVProcessor(config_path=str(config_file))
+    processor.process()
+    expected_path = Path(temp_dir) / "expected.csv"
+    processor.save_csv(str(expected_path))
+    expected_stats = dict(processor.stats)
+
+    chunked = CSVProcessor(config_path=str(config_file))
+    output_path = Path(temp_dir) / "chunked.csv"
+    stats = chunked.process_chunked(str(sample_csv), str(output_path), chunk_size=2)
+
+    # Compare parsed values: a full load writes "30.0" for an integer column
+    # with gaps, while chunked mode keeps the input text "30"
+    expected = pd.read_csv(expected_path)
+    result = pd.read_csv(output_path)
+    pd.testing.assert_frame_equal(result, expected)
+    assert stats["duplicates_removed"] == expected_stats["duplicates_removed"] == 3
+    assert stats["original_rows"] == 7
+    assert stats["final_rows"] == 4
+
+
+def test_row_digests_ignore_chunk_dtypes(config_file):
+    """Test that row digests do not depend on the dtype pandas inferred."""
+    processor = CSVProcessor(config_path=str(config_file))
+    numeric = pd.DataFrame({"id": [1.0, 2.0], "name": ["a", None]})
+    text = pd.DataFrame({"id": ["1", "2"], "name": ["a", None]})
+
+    assert np.array_equal(
+        processor._row_digests(numeric, ["id", "name"]),
+        processor._row_digests(text, ["id", "name"]),
+    )
+
+
+def test_row_digest_set_tracks_seen_rows():
+    """Test that only the first occurrence of each digest is reported new."""
+    seen = RowDigestSet()
+    for start in range(0, 40, 8):
+        keys = np.array(
+            [bytes([n % 13]) * 16 for n in range(start, start + 8)], dtype="S16"
+        )
+        new = seen.add(keys)
+        assert new.tolist() == [start <= n < 13 for n in range(start, start + 8)]
+
+    assert len(seen) == 13
+
+
+@pytest.mark.parametrize("extension", ["parquet", "feather"])
+def test_save_output_columnar(config_file, sample_csv, temp_dir, extension):
+    """Test Parquet/Feather output keeps dtypes and streams chunked runs."""
+    pytest.importorskip("pyarrow")
+    processor = CSVProcessor(config_path=str(config_file))
+    processor.config["output"] = {"format": "auto", "row_group_size": 1}
+    processor.process()
+    output_path = Path(temp_dir) / f"output.{extension}"
+    processor.save_output(str(output_path))
+
+    read = pd.read_parquet if extension == "parquet" else pd.read_feather
+    result = read(output_path)
+    pd.testing.assert_frame_equal(result, processor.df.reset_index(drop=True))
+
+    chunked = CSVProcessor(config_path=str(config_file))
+    chunked_path = Path(temp_dir) / f"chunked.{extension}"
+    chunked.process_chunked(str(sample_csv), str(chunked_path), chunk_size=2)
+    assert read(chunked_path)["name"].tolist() == result["name"].tolist()
+
+
+@pytest.mark.parametrize("extension", ["parquet", "feather"])
+def test_process_chunked_columnar_types(config_file, temp_dir, extension):
+    """Test chunked columnar output infers types and widens failed casts."""
+    pytest.importorskip("pyarrow")
+    csv_path = Path(temp_dir) / "typed.csv"
+    with open(csv_path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["id", "score", "active", "code"])
+        writer.writerow(["1", "2.5", "true", "7"])
+        writer.writerow(["2", "3", "False", "8"])
+        writer.writerow(["3", "4.5", "true", "9b"])
+
+    processor = CSVProcessor(config_path=str(config_file))
+    output_path = Path(temp_dir) / f"typed.{extension}"
+    processor.process_chunked(str(csv_path), str(output_path), chunk_size=2)
+
+    read = pd.read_parquet if extension == "parquet" else pd.read_feather
+    result = read(output_path)
+    assert result["id"].tolist() == [1, 2, 3]
+    assert result["score"].tolist() == [2.5, 3.0, 4.5]
+    assert result["active"].tolist() == [True, False, True]
+    assert result["code"].tolist() == ["7", "8", "9b"]
+    assert list(Path(temp_dir).glob("*.widen")) == []
+
+
+def test_process_chunked_columnar_keeps_types_for_empty_chunks(
+    config_file, temp_dir
+):
+    """Test a chunk emptied by duplicate removal does not widen typed columns."""
+    pytest.importorskip("pyarrow")
+    csv_path = Path(temp_dir) / "dupes.csv"
+    with open(csv_path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["id", "num"])
+        writer.writerows([["1", "10"], ["2", "20"], ["1", "10"], ["2", "20"]])
+        writer.writerow(["3", "30"])
+
+    processor = CSVProcessor(config_path=str(config_file))
+    output_path = Path(temp_dir) / "dupes.parquet"
+    processor.process_chunked(str(csv_path), str(output_path), chunk_size=2)
+
+    result = pd.read_parquet(output_path)
+    assert pd.api.types.is_integer_dtype(result["num"])
+    assert result["num"].tolist() == [10, 20, 30]
+
+
+def test_output_format(config_file):
+    """Test output format resolution from config and file extension."""
+    processor = CSVProcessor(config_path=str(config_file))
+
+    assert processor._output_format("out.csv") == "csv"
+    assert processor._output_format("out.txt") == "csv"
+
+    processor.config["output"] = {"format": "xml"}
+    with pytest.raises(ValueError):
+        processor._output_format("out.csv")
+
+    processor.config["output"] = {"format": "parquet"}
+    with patch("src.main.HAS_PYARROW", False):
+        with pytest.raises(ImportError):
+            processor._output_format("out.csv")
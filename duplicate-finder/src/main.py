@@ -13,11 +13,20 @@ import logging
 import logging.handlers
 import os
 import re
+import sqlite3
 import sys
 from collections import defaultdict
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Dict, Iterator, List, Optional, Set, Tuple
 
 import yaml
 from dotenv import load_dotenv
@@ -28,6 +37,249 @@ load_dotenv()
 logger = logging.getLogger(__name__)
 
 
+def _hash_file(file_path: Path, algorithm: str, chunk_size: int) -> Optional[str]:
+    """Hash a complete file.
+
+    Module-level so that it can be shipped to a process pool.
+
+    Args:
+        file_path: Path to file.
+        algorithm: hashlib algorithm name.
+        chunk_size: Read size in bytes.
+
+    Returns:
+        Hexadecimal hash string or None if error.
+    """
+    try:
+        hash_obj = hashlib.new(algorithm)
+
+        with open(file_path, "rb") as f:
+            while chunk := f.read(chunk_size):
+                hash_obj.update(chunk)
+
+        return hash_obj.hexdigest()
+
+    except (IOError, OSError) as e:
+        logger.error(f"Error calculating hash for {file_path}: {e}")
+        return None
+
+
+def _hash_file_ends(
+    file_path: Path, file_size: int, algorithm: str, partial_size: int
+) -> Optional[str]:
+    """Hash the first and last partial_size bytes of a file.
+
+    Module-level so that it can be shipped to a process pool.
+
+    Args:
+        file_path: Path to file.
+        file_size: Size of the file in bytes.
+        algorithm: hashlib algorithm name.
+        partial_size: Number of bytes to hash at each end.
+
+    Returns:
+        Hexadecimal hash string or None if error.
+    """
+    try:
+        hash_obj = hashlib.new(algorithm)
+
+        with open(file_path, "rb") as f:
+            hash_obj.update(f.read(partial_size))
+            if file_size > partial_size:
+                f.seek(max(file_size - partial_size, partial_size))
+                hash_obj.update(f.read(partial_size))
+
+        return hash_obj.hexdigest()
+
+    except (IOError, OSError) as e:
+        logger.error(f"Error calculating partial hash for {file_path}: {e}")
+        return None
+
+
+@dataclass
+class FileRecord:
+    """Path plus the stat fields needed by the hashing stages."""
+
+    path: Path
+    size: int
+    mtime: float
+    mtime_ns: int
+    device: int
+    inode: int
+
+    @classmethod
+    def from_stat(cls, path: Path, stat: os.stat_result) -> "FileRecord":
+        """Build a record from a stat result.
+
+        Args:
+            path: Path to file.
+            stat: Stat result of the file.
+
+        Returns:
+            FileRecord instance.
+        """
+        return cls(
+            path=path,
+            size=stat.st_size,
+            mtime=stat.st_mtime,
+            mtime_ns=stat.st_mtime_ns,
+            device=stat.st_dev,
+            inode=stat.st_ino,
+        )
+
+
+class HashCache:
+    """Persistent digest cache keyed on (device, inode, size, mtime_ns, algorithm).
+
+    A cached digest is only returned while the file's size and modification
+    time still match the values recorded when it was hashed.
+    """
+
+    def __init__(self, database_path: Path) -> None:
+        """Initialize HashCache.
+
+        Args:
+            database_path: Path to SQLite database file.
+        """
+        self.database_path = database_path
+        self.database_path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.database_path))
+        self._uncommitted = 0
+        self._init_database()
+
+    def _init_database(self) -> None:
+        """Initialize database schema."""
+        cursor = self.conn.cursor()
+
+        cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS file_hashes (
+                device INTEGER NOT NULL,
+                inode INTEGER NOT NULL,
+                algorithm TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                mtime_ns INTEGER NOT NULL,
+                digest TEXT NOT NULL,
+                path TEXT NOT NULL,
+                PRIMARY KEY (device, inode, algorithm)
+            )
+            """
+        )
+
+        self.conn.commit()
+        logger.debug(f"Hash cache initialized at {self.database_path}")
+
+    def get(self, record: FileRecord, algorithm: str) -> Optional[str]:
+        """Look up a cached digest.
+
+        Args:
+            record: Current state of the file.
+            algorithm: Hash key (algorithm name, optionally with a variant suffix).
+
+        Returns:
+            Cached digest, or None if missing or stale.
+        """
+        row = self.conn.execute(
+            """
+            SELECT digest FROM file_hashes
+            WHERE device = ? AND inode = ? AND algorithm = ?
+              AND size = ? AND mtime_ns = ?
+            """,
+            (record.device, record.inode, algorithm, record.size, record.mtime_ns),
+        ).fetchone()
+
+        return row[0] if row else None
+
+    def put(self, record: FileRecord, algorithm: str, digest: str) -> None:
+        """Store a digest, replacing any stale entry for the same file.
+
+        Args:
+            record: File state the digest was computed against.
+            algorithm: Hash key (algorithm name, optionally with a variant suffix).
+            digest: Hexadecimal digest.
+        """
+        self.conn.execute(
+            """
+            INSERT OR REPLACE INTO file_hashes
+            (device, inode, algorithm, size, mtime_ns, digest, path)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            """,
+            (
+                record.device,
+                record.inode,
+                algorithm,
+                record.size,
+                record.mtime_ns,
+                digest,
+                str(record.path),
+            ),
+        )
+
+        self._uncommitted += 1
+        if self._uncommitted >= 1000:
+            self.commit()
+
+    def prune(
+        self,
+        roots: List[Path],
+        seen: Set[Tuple[int, int, int, int]],
+        recursive: bool = True,
+    ) -> int:
+        """Remove entries under the scanned roots for files this walk did not see.
+
+        The walk has already stat'ed every file under the roots, so an entry
+        whose (device, inode, size, mtime_ns) is not in ``seen`` belongs to a
+        file that is gone or has changed. Entries outside the roots are left
+        alone and no file is stat'ed again.
+
+        Args:
+            roots: Directories that were walked.
+            seen: (device, inode, size, mtime_ns) of every file found by the walk.
+            recursive: Whether the roots were walked recursively.
+
+        Returns:
+            Number of entries removed.
+        """
+        stale = []
+
+        for root in roots:
+            prefix = str(root)
+            if not prefix.endswith(os.sep):
+                prefix += os.sep
+
+            rows = self.conn.execute(
+                """
+                SELECT device, inode, algorithm, size, mtime_ns, path FROM file_hashes
+                WHERE substr(path, 1, ?) = ?
+                """,
+                (len(prefix), prefix),
+            )
+
+            for device, inode, algorithm, size, mtime_ns, path in rows:
+                if not recursive and os.sep in path[len(prefix):]:
+                    continue
+                if (device, inode, size, mtime_ns) not in seen:
+                    stale.append((device, inode, algorithm))
+
+        self.conn.executemany(
+            "DELETE FROM file_hashes WHERE device = ? AND inode = ? AND algorithm = ?",
+            stale,
+        )
+        self.commit()
+
+        return len(stale)
+
+    def commit(self) -> None:
+        """Commit pending writes."""
+        self.conn.commit()
+        self._uncommitted = 0
+
+    def close(self) -> None:
+        """Commit pending writes and close the database."""
+        self.commit()
+        self.conn.close()
+
+
 class DuplicateFinder:
     """Finds duplicate files by comparing file hashes."""
 
@@ -42,6 +294,10 @@ class DuplicateFinder:
         self.min_file_size = config.get("min_file_size", 0)
         self.max_file_size = config.get("max_file_size", 0)
         self.chunk_size = config.get("chunk_size", 8192)
+        self.partial_hash_size = config.get("partial_hash_size", 65536)
+        self.workers = max(1, int(config.get("workers", 1)))
+        self.worker_type = config.get("worker_type", "thread").lower()
+        self.max_inflight_bytes = config.get("max_inflight_bytes", 268435456)
         self.exclude_patterns = [
             re.compile(pattern) for pattern in config.get("exclude_patterns", [])
         ]
@@ -50,11 +306,34 @@ class DuplicateFinder:
         ]
         self.recommendations_config = config.get("recommendations", {})
 
+        cache_config = config.get("hash_cache", {})
+        self.prune_hash_cache = cache_config.get("prune", True)
+        self.hash_cache: Optional[HashCache] = None
+        if cache_config.get("enabled", False):
+            self.hash_cache = HashCache(Path(cache_config.get("file", "hash_cache.db")))
+
+        self.stats = {
+            "files_scanned": 0,
+            "bytes_scanned": 0,
+            "unique_size_files": 0,
+            "bytes_skipped_by_size": 0,
+            "partial_hashed_files": 0,
+            "bytes_skipped_by_partial_hash": 0,
+            "full_hashed_files": 0,
+            "bytes_full_hashed": 0,
+            "cache_hits": 0,
+            "cache_pruned": 0,
+        }
+
         # Validate hash algorithm
         if self.hash_algorithm not in ("md5", "sha1", "sha256"):
             logger.warning(f"Invalid hash algorithm: {self.hash_algorithm}, using md5")
             self.hash_algorithm = "md5"
 
+        if self.worker_type not in ("thread", "process"):
+            logger.warning(f"Invalid worker type: {self.worker_type}, using thread")
+            self.worker_type = "thread"
+
     def should_exclude_file(self, file_path: Path) -> bool:
         """Check if file should be excluded from scanning.
 
@@ -64,23 +343,28 @@ class DuplicateFinder:
         Returns:
             True if file should be excluded, False otherwise.
         """
-        filename = file_path.name
-
-        # Check exclude patterns
-        for pattern in self.exclude_patterns:
-            if pattern.search(filename):
-                return True
+        if self._is_excluded_name(file_path.name):
+            return True
 
         # Check file size limits
         try:
-            file_size = file_path.stat().st_size
-            if self.min_file_size > 0 and file_size < self.min_file_size:
-                return True
-            if self.max_file_size > 0 and file_size > self.max_file_size:
-                return True
+            return self._is_excluded_size(file_path.stat().st_size)
         except (OSError, IOError):
             return True
 
+    def _is_excluded_name(self, filename: str) -> bool:
+        """Check if a file name matches an exclude pattern."""
+        for pattern in self.exclude_patterns:
+            if pattern.search(filename):
+                return True
+        return False
+
+    def _is_excluded_size(self, file_size: int) -> bool:
+        """Check if a file size falls outside the configured limits."""
+        if self.min_file_size > 0 and file_size < self.min_file_size:
+            return True
+        if self.max_file_size > 0 and file_size > self.max_file_size:
+            return True
         return False
 
     def should_exclude_directory(self, dir_path: Path) -> bool:
@@ -92,48 +376,210 @@ class DuplicateFinder:
         Returns:
             True if directory should be excluded, False otherwise.
         """
-        dirname = dir_path.name
+        return self._is_excluded_dirname(dir_path.name)
 
+    def _is_excluded_dirname(self, dirname: str) -> bool:
+        """Check if a directory name matches an exclude pattern."""
         for pattern in self.exclude_directories:
             if pattern.search(dirname):
                 return True
-
         return False
 
-    def calculate_file_hash(self, file_path: Path) -> Optional[str]:
-        """Calculate hash of a file.
+    def _cache_key(self, partial: bool = False) -> str:
+        """Return the hash cache key for the full or partial digest."""
+        if partial:
+            return f"{self.hash_algorithm}:ends:{self.partial_hash_size}"
+        return self.hash_algorithm
+
+    def _cached_hash(
+        self, file_path: Path, record: Optional[FileRecord], partial: bool
+    ) -> Tuple[Optional[FileRecord], Optional[str]]:
+        """Look up a digest in the hash cache.
+
+        Args:
+            file_path: Path to file.
+            record: File record, or None to stat the file here.
+            partial: Look up the partial digest instead of the full one.
+
+        Returns:
+            Tuple of (file record or None if unavailable, cached digest or None).
+        """
+        if self.hash_cache is None:
+            return record, None
+
+        if record is None:
+            try:
+                record = FileRecord.from_stat(file_path, file_path.stat())
+            except (OSError, IOError):
+                return None, None
+
+        digest = self.hash_cache.get(record, self._cache_key(partial))
+        if digest:
+            self.stats["cache_hits"] += 1
+        return record, digest
+
+    def calculate_file_hash(
+        self, file_path: Path, record: Optional[FileRecord] = None
+    ) -> Optional[str]:
+        """Calculate hash of a file, consulting the hash cache if enabled.
 
         Args:
             file_path: Path to file.
+            record: File record, used as the cache key if given.
 
         Returns:
             Hexadecimal hash string or None if error.
         """
-        try:
-            hash_obj = hashlib.new(self.hash_algorithm)
+        record, digest = self._cached_hash(file_path, record, partial=False)
+        if digest:
+            return digest
 
-            with open(file_path, "rb") as f:
-                while chunk := f.read(self.chunk_size):
-                    hash_obj.update(chunk)
+        digest = _hash_file(file_path, self.hash_algorithm, self.chunk_size)
+        if digest and record is not None and self.hash_cache is not None:
+            self.hash_cache.put(record, self._cache_key(), digest)
+        return digest
 
-            return hash_obj.hexdigest()
+    def calculate_partial_hash(
+        self,
+        file_path: Path,
+        file_size: int,
+        record: Optional[FileRecord] = None,
+    ) -> Optional[str]:
+        """Calculate hash of the first and last partial_hash_size bytes of a file.
 
-        except (IOError, OSError) as e:
-            logger.error(f"Error calculating hash for {file_path}: {e}")
-            return None
+        Args:
+            file_path: Path to file.
+            file_size: Size of the file in bytes.
+            record: File record, used as the cache key if given.
 
-    def find_files(self, directories: List[Path], recursive: bool = True) -> List[Path]:
-        """Find all files in directories.
+        Returns:
+            Hexadecimal hash string or None if error.
+        """
+        record, digest = self._cached_hash(file_path, record, partial=True)
+        if digest:
+            return digest
+
+        digest = _hash_file_ends(
+            file_path, file_size, self.hash_algorithm, self.partial_hash_size
+        )
+        if digest and record is not None and self.hash_cache is not None:
+            self.hash_cache.put(record, self._cache_key(partial=True), digest)
+        return digest
+
+    def _hash_files(
+        self, records: List[FileRecord], partial: bool = False
+    ) -> List[Optional[str]]:
+        """Hash a batch of files, using a worker pool when workers > 1.
+
+        Results are returned in the order of records regardless of the
+        order in which workers finish, and submission is throttled so that
+        no more than max_inflight_bytes are being read at once.
 
         Args:
-            directories: List of directories to scan.
-            recursive: Whether to scan recursively.
+            records: File records to hash.
+            partial: Hash only the head and tail of each file.
 
         Returns:
-            List of file paths.
+            List of hash strings (None on error), aligned with records.
         """
-        files = []
+        total = len(records)
+
+        if self.workers <= 1:
+            results = []
+            for i, record in enumerate(records, 1):
+                if not partial and i % 100 == 0:
+                    logger.info(f"Processing file {i}/{total}...")
+                if partial:
+                    results.append(
+                        self.calculate_partial_hash(record.path, record.size, record)
+                    )
+                else:
+                    results.append(self.calculate_file_hash(record.path, record))
+            return results
+
+        results: List[Optional[str]] = [None] * total
+        pending: Dict[Future, Tuple[int, int]] = {}
+        inflight_bytes = 0
+        completed = 0
+
+        def collect(done: Set[Future]) -> None:
+            nonlocal inflight_bytes, completed
+            for future in done:
+                index, job_bytes = pending.pop(future)
+                results[index] = future.result()
+                if results[index] and self.hash_cache is not None:
+                    self.hash_cache.put(
+                        records[index], self._cache_key(partial), results[index]
+                    )
+                inflight_bytes -= job_bytes
+                completed += 1
+                if not partial and completed % 100 == 0:
+                    logger.info(f"Processing file {completed}/{total}...")
+
+        if self.worker_type == "process":
+            executor_class = ProcessPoolExecutor
+        else:
+            executor_class = ThreadPoolExecutor
+
+        with executor_class(max_workers=self.workers) as executor:
+            for index, record in enumerate(records):
+                # Cache lookups and writes stay on this thread; workers only hash
+                _, results[index] = self._cached_hash(record.path, record, partial)
+                if results[index]:
+                    completed += 1
+                    if not partial and completed % 100 == 0:
+                        logger.info(f"Processing file {completed}/{total}...")
+                    continue
+
+                if partial:
+                    job_bytes = min(record.size, 2 * self.partial_hash_size)
+                else:
+                    job_bytes = record.size
+
+                while pending and (
+                    inflight_bytes + job_bytes > self.max_inflight_bytes
+                    or len(pending) >= self.workers * 2
+                ):
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    collect(done)
+
+                if partial:
+                    future = executor.submit(
+                        _hash_file_ends,
+                        record.path,
+                        record.size,
+                        self.hash_algorithm,
+                        self.partial_hash_size,
+                    )
+                else:
+                    future = executor.submit(
+                        _hash_file, record.path, self.hash_algorithm, self.chunk_size
+                    )
+
+                pending[future] = (index, job_bytes)
+                inflight_bytes += job_bytes
 
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                collect(done)
+
+        return results
+
+    def iter_files(
+        self, directories: List[Path], recursive: bool = True
+    ) -> Iterator[FileRecord]:
+        """Walk directories with os.scandir and yield records for candidate files.
+
+        Stat results from each DirEntry are reused, and excluded directories
+        are pruned before they are descended into.
+
+        Args:
+            directories: List of directories to scan.
+            recursive: Whether to scan recursively.
+
+        Yields:
+            FileRecord for each file that is not excluded.
+        """
         for directory in directories:
             directory = directory.resolve()
 
@@ -145,16 +591,50 @@ class DuplicateFinder:
                 logger.debug(f"Excluding directory: {directory}")
                 continue
 
-            if recursive:
-                file_paths = directory.rglob("*")
-            else:
-                file_paths = directory.glob("*")
+            stack = [str(directory)]
+            while stack:
+                current = stack.pop()
+                try:
+                    with os.scandir(current) as entries:
+                        for entry in entries:
+                            try:
+                                if entry.is_dir(follow_symlinks=False):
+                                    if recursive and not self._is_excluded_dirname(
+                                        entry.name
+                                    ):
+                                        stack.append(entry.path)
+                                    continue
+
+                                if not entry.is_file() or self._is_excluded_name(entry.name):
+                                    continue
+
+                                stat = entry.stat()
+                                # DirEntry.stat() leaves st_ino/st_dev at 0 on Windows
+                                if not stat.st_ino:
+                                    stat = os.stat(entry.path)
+                            except OSError as e:
+                                logger.debug(f"Cannot access {entry.path}: {e}")
+                                continue
+
+                            if self._is_excluded_size(stat.st_size):
+                                continue
+
+                            yield FileRecord.from_stat(Path(entry.path), stat)
+
+                except OSError as e:
+                    logger.warning(f"Cannot scan directory {current}: {e}")
 
-            for file_path in file_paths:
-                if file_path.is_file() and not self.should_exclude_file(file_path):
-                    files.append(file_path)
+    def find_files(self, directories: List[Path], recursive: bool = True) -> List[Path]:
+        """Find all files in directories.
 
-        return files
+        Args:
+            directories: List of directories to scan.
+            recursive: Whether to scan recursively.
+
+        Returns:
+            List of file paths.
+        """
+        return [record.path for record in self.iter_files(directories, recursive)]
 
     def find_duplicates(
         self, directories: List[Path], recursive: bool = True
@@ -169,29 +649,97 @@ class DuplicateFinder:
             Dictionary mapping hash to list of file info dictionaries.
         """
         logger.info("Finding files...")
-        files = self.find_files(directories, recursive)
-        logger.info(f"Found {len(files)} file(s) to check")
 
+        # Stage 1: group by size; a file with a unique size cannot be a duplicate
+        size_to_files: Dict[int, List[FileRecord]] = defaultdict(list)
+
+        for record in self.iter_files(directories, recursive):
+            self.stats["files_scanned"] += 1
+            self.stats["bytes_scanned"] += record.size
+            size_to_files[record.size].append(record)
+
+        logger.info(f"Found {self.stats['files_scanned']} file(s) to check")
+
+        candidates: List[List[FileRecord]] = []
+        for size, group in size_to_files.items():
+            if len(group) > 1:
+                candidates.append(group)
+            else:
+                self.stats["unique_size_files"] += 1
+                self.stats["bytes_skipped_by_size"] += size
+
+        logger.info(
+            f"Size grouping skipped {self.stats['unique_size_files']} file(s) "
+            f"({self.stats['bytes_skipped_by_size']} bytes)"
+        )
+
+        # Stage 2: hash the head and tail of same-size files; files small
+        # enough to be read completely by this stage go straight to stage 3
+        full_hash_candidates: List[FileRecord] = []
+        partial_groups: List[List[FileRecord]] = []
+        for group in candidates:
+            if group[0].size <= 2 * self.partial_hash_size:
+                full_hash_candidates.extend(group)
+            else:
+                partial_groups.append(group)
+
+        partial_records = [record for group in partial_groups for record in group]
+        partial_hashes = iter(self._hash_files(partial_records, partial=True))
+        self.stats["partial_hashed_files"] += len(partial_records)
+
+        for group in partial_groups:
+            size = group[0].size
+            partial_to_files: Dict[str, List[FileRecord]] = defaultdict(list)
+            for record in group:
+                partial_hash = next(partial_hashes)
+                if partial_hash:
+                    partial_to_files[partial_hash].append(record)
+
+            for partial_group in partial_to_files.values():
+                if len(partial_group) > 1:
+                    full_hash_candidates.extend(partial_group)
+                else:
+                    self.stats["bytes_skipped_by_partial_hash"] += (
+                        size - 2 * self.partial_hash_size
+                    )
+
+        logger.info(
+            f"Partial hashing skipped "
+            f"{self.stats['bytes_skipped_by_partial_hash']} bytes"
+        )
+
+        # Stage 3: full hash of files that still collide
         hash_to_files: Dict[str, List[Dict]] = defaultdict(list)
 
-        for i, file_path in enumerate(files, 1):
-            if i % 100 == 0:
-                logger.info(f"Processing file {i}/{len(files)}...")
+        file_hashes = self._hash_files(full_hash_candidates)
 
-            file_hash = self.calculate_file_hash(file_path)
+        for record, file_hash in zip(full_hash_candidates, file_hashes):
+            self.stats["full_hashed_files"] += 1
+            self.stats["bytes_full_hashed"] += record.size
 
             if file_hash:
-                try:
-                    stat = file_path.stat()
-                    file_info = {
-                        "path": str(file_path),
-                        "size": stat.st_size,
-                        "modified": datetime.fromtimestamp(stat.st_mtime).isoformat(),
-                        "hash": file_hash,
-                    }
-                    hash_to_files[file_hash].append(file_info)
-                except (OSError, IOError) as e:
-                    logger.error(f"Error getting file info for {file_path}: {e}")
+                file_info = {
+                    "path": str(record.path),
+                    "size": record.size,
+                    "modified": datetime.fromtimestamp(record.mtime).isoformat(),
+                    "hash": file_hash,
+                }
+                hash_to_files[file_hash].append(file_info)
+
+        if self.hash_cache is not None:
+            if self.prune_hash_cache:
+                seen = {
+                    (record.device, record.inode, record.size, record.mtime_ns)
+                    for group in size_to_files.values()
+                    for record in group
+                }
+                roots = [directory.resolve() for directory in directories]
+                self.stats["cache_pruned"] = self.hash_cache.prune(roots, seen, recursive)
+            self.hash_cache.commit()
+            logger.info(
+                f"Hash cache: {self.stats['cache_hits']} hit(s), "
+                f"{self.stats['cache_pruned']} stale entr(ies) pruned"
+            )
 
         # Filter to only duplicates (groups with more than one file)
         duplicates = {
@@ -482,6 +1030,22 @@ def main() -> None:
         choices=["md5", "sha1", "sha256"],
         help="Hash algorithm (overrides config)",
     )
+    parser.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        help="Number of parallel hashing workers (overrides config)",
+    )
+    parser.add_argument(
+        "--worker-type",
+        choices=["thread", "process"],
+        help="Use a thread or process pool for hashing (overrides config)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Do not use the persistent hash cache",
+    )
     parser.add_argument(
         "-c",
         "--config",
@@ -508,6 +1072,20 @@ def main() -> None:
             config["report_format"] = args.format
         if args.hash:
             config["hash_algorithm"] = args.hash
+        if args.workers:
+            config["workers"] = args.workers
+        if args.worker_type:
+            config["worker_type"] = args.worker_type
+        if args.no_cache:
+            config.setdefault("hash_cache", {})["enabled"] = False
+
+        # Hash cache path is relative to the configuration file's directory
+        cache_config = config.get("hash_cache", {})
+        if cache_config.get("enabled", False):
+            config_dir = (args.config or Path(__file__).parent.parent / "config.yaml").parent
+            cache_file = Path(cache_config.get("file", "hash_cache.db"))
+            if not cache_file.is_absolute():
+                cache_config["file"] = str(config_dir / cache_file)
 
         # Get directories to scan
         directories = [Path(d).resolve() for d in config.get("scan_directories", [])]
@@ -520,11 +1098,16 @@ def main() -> None:
         print(f"Scanning directories: {', '.join(str(d) for d in directories)}")
         print(f"Recursive: {recursive}")
         print(f"Hash algorithm: {config.get('hash_algorithm', 'md5')}")
+        print(f"Workers: {config.get('workers', 1)}")
         print()
 
         # Find duplicates
         finder = DuplicateFinder(config)
-        duplicates = finder.find_duplicates(directories, recursive)
+        try:
+            duplicates = finder.find_duplicates(directories, recursive)
+        finally:
+            if finder.hash_cache is not None:
+                finder.hash_cache.close()
 
         if not duplicates:
             print("No duplicate files found!")
@@ -551,6 +1134,18 @@ def main() -> None:
         print(f"Duplicate groups found: {total_groups}")
         print(f"Total duplicate files: {total_files}")
         print(f"Space that could be freed: {total_space / (1024 * 1024):.2f} MB")
+        print(
+            f"Bytes skipped by size grouping: "
+            f"{finder.stats['bytes_skipped_by_size'] / (1024 * 1024):.2f} MB"
+        )
+        print(
+            f"Bytes skipped by partial hashing: "
+            f"{finder.stats['bytes_skipped_by_partial_hash'] / (1024 * 1024):.2f} MB"
+        )
+        print(
+            f"Bytes fully hashed: "
+            f"{finder.stats['bytes_full_hashed'] / (1024 * 1024):.2f} MB"
+        )
         print(f"Report saved to: {report_path}")
         print("=" * 60)
 
@@ -322,3 +322,176 @@ def test_find_files_non_recursive(sample_config, temp_dir):
     files = finder.find_files([temp_dir], recursive=False)
 
     assert len(files) == 1  # Only file in root directory
+
+
+def test_find_duplicates_skips_unique_sizes(sample_config, temp_dir):
+    """Test that files with a unique size are never hashed."""
+    (temp_dir / "file1.txt").write_text("duplicate content")
+    (temp_dir / "file2.txt").write_text("duplicate content")
+    (temp_dir / "file3.txt").write_text("a much longer and unique content")
+
+    finder = DuplicateFinder(sample_config)
+    with patch.object(
+        finder, "calculate_file_hash", wraps=finder.calculate_file_hash
+    ) as mock_hash:
+        duplicates = finder.find_duplicates([temp_dir], recursive=False)
+
+    assert len(duplicates) == 1
+    assert mock_hash.call_count == 2
+    assert finder.stats["unique_size_files"] == 1
+    assert finder.stats["bytes_skipped_by_size"] == len("a much longer and unique content")
+
+
+def test_find_duplicates_partial_hash_prunes_candidates(sample_config, temp_dir):
+    """Test that same-size files with different heads are not fully hashed."""
+    sample_config["partial_hash_size"] = 16
+
+    (temp_dir / "file1.bin").write_bytes(b"A" * 100)
+    (temp_dir / "file2.bin").write_bytes(b"A" * 100)
+    (temp_dir / "file3.bin").write_bytes(b"B" + b"A" * 99)
+
+    finder = DuplicateFinder(sample_config)
+    duplicates = finder.find_duplicates([temp_dir], recursive=False)
+
+    assert len(duplicates) == 1
+    assert len(list(duplicates.values())[0]) == 2
+    assert finder.stats["partial_hashed_files"] == 3
+    assert finder.stats["full_hashed_files"] == 2
+    assert finder.stats["bytes_skipped_by_partial_hash"] == 100 - 2 * 16
+
+
+def test_find_duplicates_partial_hash_same_ends(sample_config, temp_dir):
+    """Test that files matching at head and tail are still fully compared."""
+    sample_config["partial_hash_size"] = 16
+
+    (temp_dir / "file1.bin").write_bytes(b"A" * 50 + b"X" + b"A" * 49)
+    (temp_dir / "file2.bin").write_bytes(b"A" * 50 + b"Y" + b"A" * 49)
+
+    finder = DuplicateFinder(sample_config)
+    duplicates = finder.find_duplicates([temp_dir], recursive=False)
+
+    assert len(duplicates) == 0
+    assert finder.stats["full_hashed_files"] == 2
+
+
+@pytest.mark.parametrize("worker_type", ["thread", "process"])
+def test_find_duplicates_parallel_matches_sequential(sample_config, temp_dir, worker_type):
+    """Test that parallel hashing produces the same result as sequential."""
+    sample_config["partial_hash_size"] = 16
+    for i in range(6):
+        (temp_dir / f"a{i}.bin").write_bytes(b"A" * 100)
+        (temp_dir / f"b{i}.bin").write_bytes(b"B" * 10)
+    (temp_dir / "c.bin").write_bytes(b"C" + b"A" * 99)
+
+    sequential = DuplicateFinder(sample_config).find_duplicates(
+        [temp_dir], recursive=False
+    )
+
+    sample_config["workers"] = 4
+    sample_config["worker_type"] = worker_type
+    sample_config["max_inflight_bytes"] = 150
+    parallel = DuplicateFinder(sample_config).find_duplicates(
+        [temp_dir], recursive=False
+    )
+
+    assert parallel == sequential
+    assert len(parallel) == 2
+
+
+def test_hash_cache_reuses_digests(sample_config, temp_dir):
+    """Test that a warm run serves digests from the hash cache."""
+    data_dir = temp_dir / "data"
+    data_dir.mkdir()
+    (data_dir / "file1.txt").write_text("duplicate content")
+    (data_dir / "file2.txt").write_text("duplicate content")
+    sample_config["hash_cache"] = {"enabled": True, "file": str(temp_dir / "cache.db")}
+
+    finder = DuplicateFinder(sample_config)
+    first = finder.find_duplicates([data_dir], recursive=False)
+    finder.hash_cache.close()
+    assert finder.stats["cache_hits"] == 0
+
+    finder = DuplicateFinder(sample_config)
+    with patch("src.main._hash_file") as mock_hash:
+        second = finder.find_duplicates([data_dir], recursive=False)
+    finder.hash_cache.close()
+
+    assert second == first
+    assert finder.stats["cache_hits"] == 2
+    mock_hash.assert_not_called()
+
+
+def test_hash_cache_ignores_modified_files(sample_config, temp_dir):
+    """Test that stale cache entries are not used and are pruned."""
+    data_dir = temp_dir / "data"
+    data_dir.mkdir()
+    file1 = data_dir / "file1.txt"
+    file2 = data_dir / "file2.txt"
+    file1.write_text("duplicate content")
+    file2.write_text("duplicate content")
+    sample_config["hash_cache"] = {"enabled": True, "file": str(temp_dir / "cache.db")}
+
+    finder = DuplicateFinder(sample_config)
+    finder.find_duplicates([data_dir], recursive=False)
+    finder.hash_cache.close()
+
+    file2.write_text("modified  content")
+    os.utime(file2, ns=(0, 1_000_000_000))
+
+    finder = DuplicateFinder(sample_config)
+    duplicates = finder.find_duplicates([data_dir], recursive=False)
+    finder.hash_cache.close()
+
+    assert len(duplicates) == 0
+    assert finder.stats["cache_hits"] == 1
+
+    file2.unlink()
+
+    finder = DuplicateFinder(sample_config)
+    finder.find_duplicates([data_dir], recursive=False)
+    finder.hash_cache.close()
+
+    assert finder.stats["cache_pruned"] == 1
+
+
+def test_hash_cache_prune_keeps_entries_outside_roots(sample_config, temp_dir):
+    """Test that pruning only touches entries under the scanned directories."""
+    dir_a = temp_dir / "a"
+    dir_b = temp_dir / "b"
+    for directory in (dir_a, dir_b):
+        directory.mkdir()
+        (directory / "file1.txt").write_text("duplicate content")
+        (directory / "file2.txt").write_text("duplicate content")
+    sample_config["hash_cache"] = {"enabled": True, "file": str(temp_dir / "cache.db")}
+
+    finder = DuplicateFinder(sample_config)
+    finder.find_duplicates([dir_a, dir_b], recursive=False)
+    finder.hash_cache.close()
+
+    (dir_a / "file2.txt").unlink()
+
+    finder = DuplicateFinder(sample_config)
+    finder.find_duplicates([dir_a], recursive=False)
+    count = finder.hash_cache.conn.execute("SELECT COUNT(*) FROM file_hashes").fetchone()[0]
+    finder.hash_cache.close()
+
+    assert finder.stats["cache_pruned"] == 1
+    assert count == 3
+
+
+def test_iter_files_prunes_excluded_directories(sample_config, temp_dir):
+    """Test that excluded subdirectories are never descended into."""
+    sample_config["exclude_directories"] = ["^node_modules$"]
+    excluded = temp_dir / "node_modules"
+    excluded.mkdir()
+    (excluded / "package.js").write_text("content")
+    (temp_dir / "file1.txt").write_text("content")
+
+    finder = DuplicateFinder(sample_config)
+    with patch("src.main.os.scandir", wraps=os.scandir) as mock_scandir:
+        records = list(finder.iter_files([temp_dir], recursive=True))
+
+    assert [record.path.name for record in records] == ["file1.txt"]
+    assert records[0].size == len("content")
+    assert mock_scandir.call_count == 1
+
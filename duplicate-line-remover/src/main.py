@@ -4,14 +4,21 @@ This module provides functionality to remove duplicate lines from text files
 while preserving line order, with options to ignore case and whitespace differences.
 """
 
+import hashlib
+import heapq
 import logging
 import logging.handlers
+import math
 import os
 import re
 import shutil
+import struct
+import tempfile
+from array import array
 from datetime import datetime
+from itertools import islice
 from pathlib import Path
-from typing import List, Optional, Set, Tuple
+from typing import Hashable, Iterator, List, Optional, Set, TextIO, Tuple
 
 import yaml
 from dotenv import load_dotenv
@@ -21,6 +28,95 @@ load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+# Deduplication modes: exact keeps every normalized line in memory, digest
+# keeps fixed-size line digests and streams output, spilling to disk past
+# the memory budget, and probabilistic streams output through a fixed-size
+# Bloom filter
+DEDUP_MODES = ("exact", "digest", "probabilistic")
+
+# Supported line digest sizes in bits, with their size in bytes
+DIGEST_SIZES = {64: 8, 128: 16}
+
+# Approximate memory per digest held in a Python set (int object plus set
+# slot), used to turn processing.memory_budget_mb into a digest count
+DIGEST_ENTRY_BYTES = {64: 70, 128: 78}
+
+# Approximate memory per record while resolving one on-disk partition
+# (digest and line number held in a dict)
+PARTITION_ENTRY_BYTES = 150
+
+# Upper bound on partition files open at once during external dedup
+MAX_PARTITIONS = 1024
+
+# Line number recorded for digests already kept before spilling to disk
+SPILLED_LINE = -1
+
+MASK_64 = (1 << 64) - 1
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over 128-bit line digests.
+
+    Sized for an expected number of items and target false-positive rate.
+    Bit positions come from double hashing the two 64-bit halves of each
+    digest, so no extra hashing is needed per probe. Supports ``in`` and
+    ``add`` like a set.
+    """
+
+    def __init__(self, expected_items: int, false_positive_rate: float) -> None:
+        """Initialize BloomFilter.
+
+        Args:
+            expected_items: Number of distinct items the filter is sized for.
+            false_positive_rate: Target false-positive rate at that size.
+
+        Raises:
+            ValueError: If the rate is not between 0 and 1.
+        """
+        if not 0 < false_positive_rate < 1:
+            raise ValueError(
+                f"false_positive_rate must be between 0 and 1, got {false_positive_rate}"
+            )
+        expected_items = max(1, int(expected_items))
+        bits = -expected_items * math.log(false_positive_rate) / math.log(2) ** 2
+        self.size = max(8, math.ceil(bits))
+        self.hash_count = max(1, round(self.size / expected_items * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+        self.items = 0
+
+    def _positions(self, digest: int) -> range:
+        """Return the bit positions of a 128-bit digest, before wrapping.
+
+        Positions form an arithmetic progression, so the caller only needs
+        to reduce each one modulo the filter size.
+        """
+        first = digest & MASK_64
+        second = (digest >> 64) | 1
+        return range(first, first + self.hash_count * second, second)
+
+    def __contains__(self, digest: int) -> bool:
+        """Return True if the digest may have been added."""
+        bits = self.bits
+        size = self.size
+        for position in self._positions(digest):
+            position %= size
+            if not bits[position >> 3] & (1 << (position & 7)):
+                return False
+        return True
+
+    def add(self, digest: int) -> None:
+        """Add a digest to the filter."""
+        bits = self.bits
+        size = self.size
+        for position in self._positions(digest):
+            position %= size
+            bits[position >> 3] |= 1 << (position & 7)
+        self.items += 1
+
+    def estimated_false_positive_rate(self) -> float:
+        """Estimate the current false-positive rate from the items added."""
+        return (1 - math.exp(-self.hash_count * self.items / self.size)) ** self.hash_count
+
 
 class DuplicateLineRemover:
     """Removes duplicate lines from text files with various options."""
@@ -156,13 +252,15 @@ class DuplicateLineRemover:
 
         return normalized
 
-    def _should_preserve_line(self, line: str, normalized: str, seen: Set[str]) -> bool:
+    def _should_preserve_line(
+        self, line: str, normalized: Hashable, seen: Set[Hashable]
+    ) -> bool:
         """Check if line should be preserved (not a duplicate).
 
         Args:
             line: Original line.
-            normalized: Normalized line for comparison.
-            seen: Set of seen normalized lines.
+            normalized: Normalized line (or its digest) for comparison.
+            seen: Set of seen normalized lines (or digests).
 
         Returns:
             True if line should be preserved, False if duplicate.
@@ -231,6 +329,288 @@ class DuplicateLineRemover:
             logger.error(f"Error reading file {input_path}: {e}")
             raise
 
+    def _dedup_mode(self) -> str:
+        """Return the configured deduplication mode.
+
+        Raises:
+            ValueError: If processing.mode is not a known mode.
+        """
+        mode = self.config.get("processing", {}).get("mode", "exact")
+        if mode not in DEDUP_MODES:
+            raise ValueError(
+                f"Unknown processing mode: {mode} (expected one of {DEDUP_MODES})"
+            )
+        return mode
+
+    def _line_digest(self, normalized: str, digest_bits: int) -> int:
+        """Calculate a fixed-size digest of a normalized line.
+
+        Args:
+            normalized: Normalized line.
+            digest_bits: Digest size, 64 or 128 bits.
+
+        Returns:
+            Digest as an unsigned integer.
+        """
+        digest = hashlib.blake2b(
+            normalized.encode("utf-8", "surrogatepass"),
+            digest_size=DIGEST_SIZES[digest_bits],
+        ).digest()
+        return int.from_bytes(digest, "little")
+
+    def _stream_unique_lines(self, input_path: Path, output: TextIO) -> Tuple[int, int]:
+        """Write the first occurrence of each line to output as it is read.
+
+        Only line digests are kept in memory. Once they would exceed
+        processing.memory_budget_mb, the rest of the file is deduplicated
+        on disk by _external_dedup, which keeps first-occurrence order. In
+        probabilistic mode the digests go into a Bloom filter sized from
+        processing.expected_lines instead, so memory is constant but a
+        unique line is dropped with probability false_positive_rate.
+
+        Args:
+            input_path: Path to input file.
+            output: Text stream receiving the kept lines.
+
+        Returns:
+            Tuple of (unique_lines_kept, duplicates_removed_count).
+
+        Raises:
+            ValueError: If processing.digest_bits is not 64 or 128.
+        """
+        processing = self.config.get("processing", {})
+        digest_bits = int(processing.get("digest_bits", 128))
+        if digest_bits not in DIGEST_SIZES:
+            raise ValueError(f"digest_bits must be 64 or 128, got {digest_bits}")
+        budget = int(float(processing.get("memory_budget_mb", 512)) * 1024 * 1024)
+        max_digests = max(1, budget // DIGEST_ENTRY_BYTES[digest_bits])
+        input_encoding = self.config.get("file_handling", {}).get(
+            "input_encoding", "utf-8"
+        )
+
+        bloom_filter = None
+        if self._dedup_mode() == "probabilistic":
+            bloom_filter = BloomFilter(
+                processing.get("expected_lines", 10000000),
+                float(processing.get("false_positive_rate", 0.0001)),
+            )
+            # Both bit-position hashes are taken from a 128-bit digest
+            digest_bits = 128
+            logger.debug(
+                f"Bloom filter: {bloom_filter.size} bits, "
+                f"{bloom_filter.hash_count} hash functions"
+            )
+
+        seen = bloom_filter if bloom_filter is not None else set()
+        kept = 0
+        duplicates_removed = 0
+        chars_read = 0
+
+        with open(input_path, "r", encoding=input_encoding) as f:
+            for index, line in enumerate(f):
+                chars_read += len(line)
+                has_newline = line.endswith("\n")
+                line_content = line.rstrip("\n\r") if has_newline else line
+                digest = self._line_digest(self._normalize_line(line_content), digest_bits)
+
+                if self._should_preserve_line(line_content, digest, seen):
+                    output.write(line_content + "\n" if has_newline else line_content)
+                    kept += 1
+                else:
+                    duplicates_removed += 1
+
+                if bloom_filter is None and len(seen) > max_digests:
+                    logger.warning(
+                        f"{len(seen)} line digests exceed the memory budget; "
+                        f"continuing {input_path} with on-disk deduplication"
+                    )
+                    # Estimate the remaining lines from the average line length
+                    remaining_chars = max(0, input_path.stat().st_size - chars_read)
+                    estimated_lines = len(seen) + remaining_chars * (index + 1) // max(
+                        1, chars_read
+                    )
+                    external_kept, external_removed = self._external_dedup(
+                        input_path, f, index + 1, seen, output, estimated_lines
+                    )
+                    return kept + external_kept, duplicates_removed + external_removed
+
+        if bloom_filter is not None:
+            rate = bloom_filter.estimated_false_positive_rate()
+            self.stats["estimated_false_positive_rate"] = max(
+                rate, self.stats.get("estimated_false_positive_rate", 0.0)
+            )
+            logger.info(
+                f"Bloom filter holds {bloom_filter.items} lines; estimated "
+                f"false-positive rate {rate:.2e}"
+            )
+            if bloom_filter.items > int(processing.get("expected_lines", 10000000)):
+                logger.warning(
+                    f"{input_path} has more unique lines than expected_lines "
+                    f"({bloom_filter.items}); raise it to keep the configured "
+                    f"false-positive rate"
+                )
+
+        return kept, duplicates_removed
+
+    def _external_dedup(
+        self,
+        input_path: Path,
+        lines: TextIO,
+        start_index: int,
+        seen: Set[int],
+        output: TextIO,
+        estimated_lines: int,
+    ) -> Tuple[int, int]:
+        """Deduplicate the rest of a file with hash-partitioned files on disk.
+
+        Every digest in seen (lines already written) and a (digest, line
+        number) record for each remaining line are appended to one of
+        several partition files, chosen by digest, so equal lines always
+        meet in the same partition. Each partition is then resolved on its
+        own, keeping the first line number of each digest not already
+        seen. The kept line numbers of all partitions are merged in order
+        and a second pass over the input writes those lines, so output keeps
+        first-occurrence order. Memory is bounded by the largest partition.
+
+        Args:
+            input_path: Path to input file (read again for the second pass).
+            lines: Open input stream positioned at line start_index.
+            start_index: Number of the next line to read.
+            seen: Digests of lines already written; emptied here.
+            output: Text stream receiving the kept lines.
+            estimated_lines: Estimated digests in seen plus remaining lines,
+                used to choose the number of partitions.
+
+        Returns:
+            Tuple of (unique_lines_kept, duplicates_removed_count) for the
+            lines from start_index on.
+        """
+        processing = self.config.get("processing", {})
+        digest_bits = int(processing.get("digest_bits", 128))
+        budget = int(float(processing.get("memory_budget_mb", 512)) * 1024 * 1024)
+        input_encoding = self.config.get("file_handling", {}).get(
+            "input_encoding", "utf-8"
+        )
+        partitions = math.ceil(estimated_lines * PARTITION_ENTRY_BYTES / max(1, budget))
+        partitions = min(MAX_PARTITIONS, max(2, partitions))
+        record = struct.Struct("<QQq" if digest_bits == 128 else "<Qq")
+
+        def pack(digest: int, index: int) -> bytes:
+            if digest_bits == 128:
+                return record.pack(digest >> 64, digest & MASK_64, index)
+            return record.pack(digest, index)
+
+        with tempfile.TemporaryDirectory(
+            prefix="dedup-", dir=processing.get("temp_dir")
+        ) as temp_dir:
+            partition_paths = [
+                Path(temp_dir) / f"partition-{number:04d}.bin"
+                for number in range(partitions)
+            ]
+            logger.info(f"Spilling line digests to {partitions} partition(s)")
+
+            partition_files = [open(path, "wb") for path in partition_paths]
+            try:
+                for digest in seen:
+                    partition_files[digest % partitions].write(
+                        pack(digest, SPILLED_LINE)
+                    )
+                seen.clear()
+
+                remaining = 0
+                for index, line in enumerate(lines, start_index):
+                    remaining += 1
+                    line_content = line.rstrip("\n\r") if line.endswith("\n") else line
+                    digest = self._line_digest(
+                        self._normalize_line(line_content), digest_bits
+                    )
+                    partition_files[digest % partitions].write(pack(digest, index))
+            finally:
+                for partition_file in partition_files:
+                    partition_file.close()
+
+            # Resolve each partition to the line numbers it keeps; records
+            # were appended in line order, so dict insertion order is sorted
+            kept_paths = []
+            for path in partition_paths:
+                first_seen = {}
+                for fields in record.iter_unpack(path.read_bytes()):
+                    first_seen.setdefault(fields[:-1], fields[-1])
+                kept_path = path.with_suffix(".kept")
+                with open(kept_path, "wb") as kept_file:
+                    array(
+                        "q", (index for index in first_seen.values() if index >= 0)
+                    ).tofile(kept_file)
+                path.unlink()
+                kept_paths.append(kept_path)
+
+            kept = 0
+            next_kept = heapq.merge(*(self._read_line_numbers(p) for p in kept_paths))
+            target = next(next_kept, None)
+            with open(input_path, "r", encoding=input_encoding) as f:
+                for index, line in enumerate(islice(f, start_index, None), start_index):
+                    if target is None:
+                        break
+                    if index == target:
+                        has_newline = line.endswith("\n")
+                        line_content = line.rstrip("\n\r") if has_newline else line
+                        output.write(
+                            line_content + "\n" if has_newline else line_content
+                        )
+                        kept += 1
+                        target = next(next_kept, None)
+
+        return kept, remaining - kept
+
+    @staticmethod
+    def _read_line_numbers(path: Path, block_size: int = 65536) -> Iterator[int]:
+        """Yield the line numbers stored in a kept-lines file, in order."""
+        with open(path, "rb") as f:
+            while True:
+                block = array("q")
+                block.frombytes(f.read(block_size * block.itemsize))
+                if not block:
+                    return
+                yield from block
+
+    def _process_file_streaming(self, input_path: Path) -> Tuple[int, int]:
+        """Deduplicate a file in digest mode, streaming kept lines to output.
+
+        Output goes to a temporary file next to the output path, which
+        replaces it once the input is fully read, so overwrite_original is
+        safe.
+
+        Args:
+            input_path: Path to input file.
+
+        Returns:
+            Tuple of (unique_lines_kept, duplicates_removed_count).
+        """
+        output_path = self._get_output_path(input_path)
+        create_output = self.config.get("output", {}).get("create_output_file", True)
+        output_encoding = self.config.get("file_handling", {}).get(
+            "output_encoding", "utf-8"
+        )
+        temp_path = output_path.with_name(f".{output_path.name}.tmp")
+
+        try:
+            with open(
+                temp_path if create_output else os.devnull,
+                "w",
+                encoding=output_encoding,
+            ) as output:
+                unique_lines, duplicates_removed = self._stream_unique_lines(
+                    input_path, output
+                )
+            self._create_backup(input_path)
+            if create_output:
+                os.replace(temp_path, output_path)
+        finally:
+            if temp_path.exists():
+                temp_path.unlink()
+
+        return unique_lines, duplicates_removed
+
     def _create_backup(self, file_path: Path) -> Optional[Path]:
         """Create backup of file.
 
@@ -293,6 +673,21 @@ class DuplicateLineRemover:
         logger.info(f"Processing file: {input_path}")
 
         try:
+            if self._dedup_mode() != "exact":
+                unique_lines, duplicates_removed = self._process_file_streaming(
+                    input_path
+                )
+                total_lines = unique_lines + duplicates_removed
+                self.stats["total_lines_read"] += total_lines
+                self.stats["duplicate_lines_removed"] += duplicates_removed
+                self.stats["unique_lines_kept"] += unique_lines
+                logger.info(
+                    f"Processed {input_path}: {total_lines} lines -> {unique_lines} "
+                    f"unique ({duplicates_removed} duplicates removed)"
+                )
+                self.stats["files_processed"] += 1
+                return True
+
             # Remove duplicates
             deduplicated_lines, duplicates_removed = self._remove_duplicates(input_path)
 
@@ -389,6 +784,11 @@ class DuplicateLineRemover:
                 f.write(f"Duplicate Lines Removed: {self.stats['duplicate_lines_removed']}\n")
                 f.write(f"Unique Lines Kept: {self.stats['unique_lines_kept']}\n")
                 f.write(f"Files Failed: {self.stats['files_failed']}\n")
+                if "estimated_false_positive_rate" in self.stats:
+                    f.write(
+                        "Estimated False-Positive Rate: "
+                        f"{self.stats['estimated_false_positive_rate']:.2e}\n"
+                    )
 
                 if self.stats["total_lines_read"] > 0:
                     duplicate_percent = (
@@ -408,6 +808,7 @@ class DuplicateLineRemover:
             f.write(f"Preserve Empty Lines: {processing.get('preserve_empty_lines', True)}\n")
             f.write(f"Trim Lines: {processing.get('trim_lines', False)}\n")
             f.write(f"Normalize Whitespace: {processing.get('normalize_whitespace', False)}\n")
+            f.write(f"Mode: {processing.get('mode', 'exact')}\n")
 
         logger.info(f"Report generated: {report_path}")
 
@@ -450,6 +851,23 @@ def main() -> int:
         "--directory",
         help="Process all matching files in directory",
     )
+    parser.add_argument(
+        "--mode",
+        choices=DEDUP_MODES,
+        help="Deduplication mode (overrides config)",
+    )
+    parser.add_argument(
+        "--memory-budget",
+        type=float,
+        metavar="MB",
+        help="Memory budget for line digests in digest mode (overrides config)",
+    )
+    parser.add_argument(
+        "--expected-lines",
+        type=int,
+        help="Expected unique lines, used to size the Bloom filter in "
+        "probabilistic mode (overrides config)",
+    )
 
     args = parser.parse_args()
 
@@ -461,6 +879,12 @@ def main() -> int:
             remover.config["processing"]["ignore_case"] = True
         if args.ignore_whitespace:
             remover.config["processing"]["ignore_whitespace"] = True
+        if args.mode:
+            remover.config["processing"]["mode"] = args.mode
+        if args.memory_budget is not None:
+            remover.config["processing"]["memory_budget_mb"] = args.memory_budget
+        if args.expected_lines is not None:
+            remover.config["processing"]["expected_lines"] = args.expected_lines
         if args.output:
             remover.config["file_handling"]["overwrite_original"] = False
             remover.config["output"]["output_suffix"] = ""
@@ -473,12 +897,25 @@ def main() -> int:
             if args.output:
                 # Custom output path
                 output_path = Path(args.output)
-                # Process and write to custom output
-                deduplicated_lines, _ = remover._remove_duplicates(input_path)
                 file_config = remover.config.get("file_handling", {})
                 output_encoding = file_config.get("output_encoding", "utf-8")
-                with open(output_path, "w", encoding=output_encoding) as f:
-                    f.writelines(deduplicated_lines)
+                if remover._dedup_mode() != "exact":
+                    # Stream kept lines straight to the custom output
+                    with open(output_path, "w", encoding=output_encoding) as f:
+                        unique_lines, duplicates_removed = remover._stream_unique_lines(
+                            input_path, f
+                        )
+                else:
+                    # Process and write to custom output
+                    deduplicated_lines, duplicates_removed = remover._remove_duplicates(
+                        input_path
+                    )
+                    unique_lines = len(deduplicated_lines)
+                    with open(output_path, "w", encoding=output_encoding) as f:
+                        f.writelines(deduplicated_lines)
+                remover.stats["total_lines_read"] += unique_lines + duplicates_removed
+                remover.stats["duplicate_lines_removed"] += duplicates_removed
+                remover.stats["unique_lines_kept"] += unique_lines
                 remover.stats["files_processed"] += 1
             else:
                 remover.process_file(input_path)
@@ -498,6 +935,11 @@ def main() -> int:
         print(f"Duplicate Lines Removed: {remover.stats['duplicate_lines_removed']}")
         print(f"Unique Lines Kept: {remover.stats['unique_lines_kept']}")
         print(f"Files Failed: {remover.stats['files_failed']}")
+        if "estimated_false_positive_rate" in remover.stats:
+            print(
+                "Estimated False-Positive Rate: "
+                f"{remover.stats['estimated_false_positive_rate']:.2e}"
+            )
 
         if remover.stats["total_lines_read"] > 0:
             duplicate_percent = (
@@ -7,7 +7,7 @@ from unittest.mock import patch
 import pytest
 import yaml
 
-from src.main import DuplicateLineRemover
+from src.main import BloomFilter, DuplicateLineRemover
 
 
 @pytest.fixture
@@ -205,3 +205,89 @@ def test_process_file_empty_lines(config_file, temp_dir):
     # Should preserve first empty line
     assert len(lines) == 3  # line1, empty, line2
     assert duplicates == 1  # One duplicate empty line removed
+
+
+@pytest.mark.parametrize("budget_mb", [512, 0.0001])
+def test_digest_mode_matches_exact(config_file, temp_dir, budget_mb):
+    """Test digest mode, in memory and spilled to disk, matches exact mode."""
+    test_file = Path(temp_dir) / "test.txt"
+    lines = [f"line {i % 7}" if i % 3 else f"Line {i % 11}" for i in range(200)]
+    test_file.write_text("\n".join(lines + ["", "", "line 1"]))
+
+    outputs = []
+    for mode in ("exact", "digest"):
+        remover = DuplicateLineRemover(config_path=str(config_file))
+        remover.config["processing"].update(
+            mode=mode, ignore_case=True, memory_budget_mb=budget_mb
+        )
+        assert remover.process_file(test_file)
+        output = Path(str(test_file) + ".deduplicated").read_text()
+        outputs.append((output, remover.stats))
+
+    assert outputs[1] == outputs[0]
+    assert outputs[1][1]["unique_lines_kept"] == 12
+
+
+def test_external_dedup_preserves_first_occurrence_order(config_file, temp_dir):
+    """Test on-disk dedup keeps first occurrences in input order."""
+    remover = DuplicateLineRemover(config_path=str(config_file))
+    remover.config["processing"].update(mode="digest", memory_budget_mb=0.0001)
+
+    test_file = Path(temp_dir) / "test.txt"
+    lines = [f"{i * 7919 % 500}" for i in range(3000)]
+    test_file.write_text("\n".join(lines) + "\n")
+
+    with patch.object(
+        remover, "_external_dedup", wraps=remover._external_dedup
+    ) as external_dedup:
+        assert remover.process_file(test_file)
+    external_dedup.assert_called_once()
+
+    output = Path(str(test_file) + ".deduplicated").read_text().splitlines()
+    assert output == list(dict.fromkeys(lines))
+    assert remover.stats["duplicate_lines_removed"] == 2500
+
+
+def test_probabilistic_mode(config_file, temp_dir):
+    """Test probabilistic mode removes duplicates and reports its error rate."""
+    remover = DuplicateLineRemover(config_path=str(config_file))
+    remover.config["processing"].update(
+        mode="probabilistic", expected_lines=1000, false_positive_rate=0.001
+    )
+
+    test_file = Path(temp_dir) / "test.txt"
+    lines = [f"{i * 7919 % 500}" for i in range(3000)]
+    test_file.write_text("\n".join(lines) + "\n")
+
+    assert remover.process_file(test_file)
+    output = Path(str(test_file) + ".deduplicated").read_text().splitlines()
+    assert output == list(dict.fromkeys(lines))
+    assert remover.stats["duplicate_lines_removed"] == 2500
+    assert 0 < remover.stats["estimated_false_positive_rate"] < 0.001
+
+
+def test_bloom_filter():
+    """Test Bloom filter sizing and membership."""
+    bloom_filter = BloomFilter(1000, 0.01)
+    assert bloom_filter.size == 9586
+    assert bloom_filter.hash_count == 7
+
+    bloom_filter.add(12345 << 64 | 678)
+    assert (12345 << 64 | 678) in bloom_filter
+    assert 99 not in bloom_filter
+    assert bloom_filter.items == 1
+
+    with pytest.raises(ValueError):
+        BloomFilter(1000, 0)
+
+
+def test_unknown_mode_fails(config_file, temp_dir):
+    """Test an unknown deduplication mode is reported as a failure."""
+    remover = DuplicateLineRemover(config_path=str(config_file))
+    remover.config["processing"]["mode"] = "fuzzy"
+
+    test_file = Path(temp_dir) / "test.txt"
+    test_file.write_text("a\na\n")
+
+    assert not remover.process_file(test_file)
+    assert remover.stats["files_failed"] == 1
@@ -10,12 +10,14 @@ import hashlib
 import logging
 import logging.handlers
 import os
+import random
+import sqlite3
 import sys
 from collections import defaultdict
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
 import yaml
 from dotenv import load_dotenv
@@ -25,6 +27,21 @@ load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+# Mersenne prime used as the modulus of the MinHash permutations
+MINHASH_PRIME = (1 << 61) - 1
+
+# Slack applied to similarity bounds so floating point rounding never prunes
+# a pair that the exact similarity calculation would accept
+BOUND_EPSILON = 1e-9
+
+# Most a pair can score from the file/subdirectory count and depth terms
+# alone; pairs with no extension or subdirectory name overlap never share an
+# LSH bucket, so thresholds at or below this are compared exhaustively
+COUNT_DEPTH_WEIGHT = 0.5
+
+# Read size used when digesting file contents
+DIGEST_CHUNK_SIZE = 1024 * 1024
+
 
 @dataclass
 class DirectoryStructure:
@@ -39,6 +56,228 @@ class DirectoryStructure:
     subdirectory_names: Set[str] = field(default_factory=set)
     structure_hash: str = ""
     total_size: int = 0
+    content_hash: str = ""
+
+
+class DigestStore:
+    """Persistent file digest cache keyed on path, validated by size and mtime.
+
+    A cached digest is only returned while the file's size and modification
+    time still match the values recorded when it was read, so unchanged
+    files are never read again on later runs.
+    """
+
+    def __init__(self, database_path: Path) -> None:
+        """Initialize DigestStore.
+
+        Args:
+            database_path: Path to SQLite database file.
+        """
+        self.database_path = database_path
+        self.database_path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.database_path))
+        self.conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS file_digests (
+                path TEXT PRIMARY KEY,
+                size INTEGER NOT NULL,
+                mtime_ns INTEGER NOT NULL,
+                digest TEXT NOT NULL
+            )
+            """
+        )
+        self.conn.commit()
+        self._uncommitted = 0
+
+    def get(self, path: str, size: int, mtime_ns: int) -> Optional[str]:
+        """Look up a cached digest.
+
+        Args:
+            path: File path.
+            size: Current file size.
+            mtime_ns: Current modification time in nanoseconds.
+
+        Returns:
+            Cached digest, or None if missing or stale.
+        """
+        row = self.conn.execute(
+            "SELECT digest FROM file_digests WHERE path = ? AND size = ? "
+            "AND mtime_ns = ?",
+            (path, size, mtime_ns),
+        ).fetchone()
+        return row[0] if row else None
+
+    def put(self, path: str, size: int, mtime_ns: int, digest: str) -> None:
+        """Store a digest, replacing any stale entry for the same path.
+
+        Args:
+            path: File path.
+            size: File size the digest was computed against.
+            mtime_ns: Modification time the digest was computed against.
+            digest: Hexadecimal digest.
+        """
+        self.conn.execute(
+            "INSERT OR REPLACE INTO file_digests (path, size, mtime_ns, digest) "
+            "VALUES (?, ?, ?, ?)",
+            (path, size, mtime_ns, digest),
+        )
+        self._uncommitted += 1
+        if self._uncommitted >= 1000:
+            self.commit()
+
+    def commit(self) -> None:
+        """Commit pending writes."""
+        self.conn.commit()
+        self._uncommitted = 0
+
+    def close(self) -> None:
+        """Commit pending writes and close the database."""
+        self.commit()
+        self.conn.close()
+
+
+class MinHashLSH:
+    """Locality-sensitive hash index over token sets.
+
+    Each set gets a MinHash signature of ``num_perm`` values, split into
+    ``bands`` bands. Sets whose signatures agree on every value of at least
+    one band share a bucket and become candidate pairs, so pairs with high
+    Jaccard similarity are found without comparing every pair.
+    """
+
+    def __init__(self, num_perm: int = 64, bands: int = 32, seed: int = 1) -> None:
+        """Initialize MinHashLSH.
+
+        Args:
+            num_perm: Number of hash permutations per signature.
+            bands: Number of bands; must divide num_perm.
+            seed: Seed for the permutation coefficients.
+
+        Raises:
+            ValueError: If bands does not divide num_perm.
+        """
+        if bands <= 0 or num_perm % bands:
+            raise ValueError(
+                f"lsh_bands ({bands}) must divide minhash_permutations ({num_perm})"
+            )
+
+        rng = random.Random(seed)
+        self.rows = num_perm // bands
+        self.bands = bands
+        self.coefficients = [
+            (rng.randrange(1, MINHASH_PRIME), rng.randrange(MINHASH_PRIME))
+            for _ in range(num_perm)
+        ]
+        self.buckets: List[Dict[Tuple[int, ...], List[int]]] = [
+            defaultdict(list) for _ in range(bands)
+        ]
+        self.signatures: Dict[int, Tuple[int, ...]] = {}
+        self._token_hashes: Dict[str, List[int]] = {}
+
+    def _hash_token(self, token: str) -> List[int]:
+        """Return the permuted hash values of a token (cached).
+
+        Args:
+            token: Token to hash.
+
+        Returns:
+            One hash value per permutation.
+        """
+        values = self._token_hashes.get(token)
+        if values is None:
+            digest = hashlib.blake2b(token.encode("utf-8"), digest_size=8).digest()
+            base = int.from_bytes(digest, "little")
+            values = [(a * base + b) % MINHASH_PRIME for a, b in self.coefficients]
+            self._token_hashes[token] = values
+        return values
+
+    def signature(self, tokens: Iterable[str]) -> Tuple[int, ...]:
+        """Calculate the MinHash signature of a token set.
+
+        Args:
+            tokens: Non-empty token set.
+
+        Returns:
+            Minimum hash value for each permutation.
+        """
+        return tuple(
+            min(column) for column in zip(*(self._hash_token(t) for t in tokens))
+        )
+
+    def add(self, key: int, tokens: Set[str]) -> None:
+        """Index a token set under an integer key. Empty sets are ignored.
+
+        Args:
+            key: Identifier returned in candidate pairs.
+            tokens: Token set to index.
+        """
+        if not tokens:
+            return
+
+        sig = self.signature(tokens)
+        self.signatures[key] = sig
+        for band in range(self.bands):
+            start = band * self.rows
+            self.buckets[band][sig[start : start + self.rows]].append(key)
+
+    def collides(self, key1: int, key2: int, bands: Optional[int] = None) -> bool:
+        """Check whether two keys share a bucket.
+
+        Args:
+            key1: First key.
+            key2: Second key.
+            bands: Only look at bands before this one (default: all bands).
+
+        Returns:
+            True if both keys are indexed and share a bucket in those bands.
+        """
+        sig1 = self.signatures.get(key1)
+        sig2 = self.signatures.get(key2)
+        if sig1 is None or sig2 is None:
+            return False
+
+        for band in range(self.bands if bands is None else bands):
+            start = band * self.rows
+            if sig1[start : start + self.rows] == sig2[start : start + self.rows]:
+                return True
+        return False
+
+    def candidate_pairs(
+        self,
+        sort_key: Optional[Callable[[int], Any]] = None,
+        in_window: Optional[Callable[[int, int], bool]] = None,
+    ) -> Iterator[Tuple[int, int]]:
+        """Yield key pairs that share at least one bucket, one bucket at a time.
+
+        Each pair is yielded once, from the first band it collides in, so no
+        set of pairs is built. With ``sort_key`` and ``in_window``, bucket
+        members are sorted by ``sort_key`` and each key is paired with the
+        keys after it only until ``in_window(key, other)`` returns False,
+        which must then stay False for every later key.
+
+        Args:
+            sort_key: Optional key function ordering bucket members.
+            in_window: Optional check that a later member can still pair.
+
+        Yields:
+            (smaller key, larger key) pairs.
+        """
+        # Identical sets fill the same bucket in every band; expand it once
+        expanded: Set[Tuple[int, ...]] = set()
+        for band, buckets in enumerate(self.buckets):
+            for keys in buckets.values():
+                if len(keys) < 2 or tuple(keys) in expanded:
+                    continue
+                expanded.add(tuple(keys))
+
+                ordered = sorted(keys, key=sort_key) if sort_key else keys
+                for n, key1 in enumerate(ordered):
+                    for key2 in ordered[n + 1 :]:
+                        if in_window is not None and not in_window(key1, key2):
+                            break
+                        if band and self.collides(key1, key2, band):
+                            continue
+                        yield min(key1, key2), max(key1, key2)
 
 
 class StructureAnalyzer:
@@ -53,6 +292,8 @@ class StructureAnalyzer:
         self.config = config
         self.analysis_config = config.get("analysis", {})
         self.filter_config = config.get("filtering", {})
+        self.content_hashing = self.analysis_config.get("content_hashing", False)
+        self.digest_store: Optional[DigestStore] = None
 
     def should_exclude_directory(self, dir_path: Path) -> bool:
         """Check if directory should be excluded from analysis.
@@ -121,59 +362,220 @@ class StructureAnalyzer:
         Returns:
             DirectoryStructure object.
         """
-        structure = DirectoryStructure(
-            path=dir_path,
-            depth=0,
-            file_count=0,
-            subdirectory_count=0,
-        )
-
         if not dir_path.exists() or not dir_path.is_dir():
-            return structure
+            return DirectoryStructure(
+                path=dir_path,
+                depth=0,
+                file_count=0,
+                subdirectory_count=0,
+            )
+
+        return self.analyze_tree(dir_path)[0]
+
+    def analyze_tree(self, root: Path) -> List[DirectoryStructure]:
+        """Analyze a directory and all of its subdirectories in one walk.
+
+        Each directory is listed once. Depth and structure hash are filled
+        in post-order from the already analyzed children, so the cost is
+        linear in the size of the tree. Symlinked subdirectories are
+        counted but not followed.
+
+        Args:
+            root: Directory to analyze.
+
+        Returns:
+            DirectoryStructure for root and every non-excluded subdirectory,
+            in top-down order (root first).
+        """
+        ordered: List[DirectoryStructure] = []
+        analyzed: Dict[Path, DirectoryStructure] = {}
+        children: Dict[Path, List[Path]] = {}
+        file_digests: Dict[Path, Dict[str, str]] = {}
+        stack: List[Tuple[Path, bool]] = [(root, False)]
+
+        if self.content_hashing:
+            self._open_digest_store()
 
         try:
-            items = list(dir_path.iterdir())
-            max_depth = 0
+            while stack:
+                dir_path, expanded = stack.pop()
+
+                if not expanded:
+                    structure, subdirectories, digests = self._scan_directory(
+                        dir_path
+                    )
+                    ordered.append(structure)
+                    analyzed[dir_path] = structure
+                    children[dir_path] = subdirectories
+                    file_digests[dir_path] = digests
+                    stack.append((dir_path, True))
+                    stack.extend((sub, False) for sub in reversed(subdirectories))
+                    continue
+
+                structure = analyzed[dir_path]
+                child_hashes = {}
+                child_contents = {}
+                for sub in children.pop(dir_path):
+                    child = analyzed[sub]
+                    structure.depth = max(structure.depth, child.depth + 1)
+                    child_hashes[sub.name] = child.structure_hash
+                    child_contents[sub.name] = child.content_hash
+                structure.structure_hash = self._calculate_structure_hash(
+                    structure, child_hashes
+                )
+                if self.content_hashing:
+                    structure.content_hash = self._calculate_content_hash(
+                        structure, file_digests.pop(dir_path), child_contents
+                    )
+        finally:
+            if self.digest_store is not None:
+                self.digest_store.close()
+                self.digest_store = None
+
+        return ordered
+
+    def _open_digest_store(self) -> None:
+        """Open the digest cache configured by ``analysis.digest_cache``."""
+        cache_file = self.analysis_config.get("digest_cache", "")
+        if cache_file:
+            self.digest_store = DigestStore(Path(cache_file))
+
+    def _file_digest(self, entry: os.DirEntry) -> str:
+        """Return the SHA-256 digest of a file, using the digest cache.
 
-            for item in items:
-                if item.is_file():
-                    if not self.should_exclude_file(item):
-                        structure.file_count += 1
-                        structure.file_names.add(item.name)
-                        structure.file_extensions.add(item.suffix.lower())
+        Args:
+            entry: Directory entry of the file.
 
-                        try:
-                            structure.total_size += item.stat().st_size
-                        except (OSError, PermissionError):
-                            pass
+        Returns:
+            Hexadecimal digest, or an empty string if the file is unreadable.
+        """
+        try:
+            stat = entry.stat()
+            if self.digest_store is not None:
+                cached = self.digest_store.get(
+                    entry.path, stat.st_size, stat.st_mtime_ns
+                )
+                if cached is not None:
+                    return cached
+
+            hash_obj = hashlib.sha256()
+            with open(entry.path, "rb") as f:
+                while chunk := f.read(DIGEST_CHUNK_SIZE):
+                    hash_obj.update(chunk)
+            digest = hash_obj.hexdigest()
+        except (OSError, PermissionError) as e:
+            logger.warning(f"Cannot read file {entry.path}: {e}")
+            return ""
+
+        if self.digest_store is not None:
+            self.digest_store.put(entry.path, stat.st_size, stat.st_mtime_ns, digest)
+        return digest
+
+    def _calculate_content_hash(
+        self,
+        structure: DirectoryStructure,
+        file_digests: Dict[str, str],
+        child_contents: Dict[str, str],
+    ) -> str:
+        """Calculate a merkle hash of a directory's names and file contents.
+
+        Args:
+            structure: DirectoryStructure being hashed.
+            file_digests: Digests of the directory's files, keyed by name.
+            child_contents: Content hashes of the subdirectories, keyed by
+                name (symlinked subdirectories are absent).
 
-                elif item.is_dir():
-                    if not self.should_exclude_directory(item):
-                        structure.subdirectory_count += 1
-                        structure.subdirectory_names.add(item.name)
+        Returns:
+            Content hash, or an empty string if any file below the
+            directory could not be read.
+        """
+        entries = []
+        for name in sorted(file_digests):
+            if not file_digests[name]:
+                return ""
+            entries.append(f"file:{name}:{file_digests[name]}")
+        for name in sorted(structure.subdirectory_names):
+            if name not in child_contents:
+                entries.append(f"link:{name}")
+            elif not child_contents[name]:
+                return ""
+            else:
+                entries.append(f"dir:{name}:{child_contents[name]}")
 
-                        # Recursively analyze subdirectory
-                        sub_structure = self.analyze_directory_structure(item)
-                        max_depth = max(max_depth, sub_structure.depth + 1)
+        hash_obj = hashlib.sha256()
+        hash_obj.update("\n".join(entries).encode("utf-8"))
+        return hash_obj.hexdigest()
 
-            structure.depth = max_depth
+    def _scan_directory(
+        self, dir_path: Path
+    ) -> Tuple[DirectoryStructure, List[Path], Dict[str, str]]:
+        """List one directory and record its direct files and subdirectories.
 
-            # Calculate structure hash based on arrangement
-            structure.structure_hash = self._calculate_structure_hash(structure)
+        Args:
+            dir_path: Directory to list.
 
+        Returns:
+            Tuple of (structure without hash, subdirectories to descend into,
+            file digests keyed by name when content hashing is enabled).
+            Depth is 1 if the directory has symlinked subdirectories, else 0.
+        """
+        structure = DirectoryStructure(
+            path=dir_path,
+            depth=0,
+            file_count=0,
+            subdirectory_count=0,
+        )
+        subdirectories: List[Path] = []
+        digests: Dict[str, str] = {}
+
+        try:
+            with os.scandir(dir_path) as entries:
+                for entry in entries:
+                    item = Path(entry.path)
+                    try:
+                        if entry.is_file():
+                            if self.should_exclude_file(item):
+                                continue
+                            structure.file_count += 1
+                            structure.file_names.add(entry.name)
+                            structure.file_extensions.add(item.suffix.lower())
+                            try:
+                                structure.total_size += entry.stat().st_size
+                            except (OSError, PermissionError):
+                                pass
+                            if self.content_hashing:
+                                digests[entry.name] = self._file_digest(entry)
+                        elif entry.is_dir():
+                            if self.should_exclude_directory(item):
+                                continue
+                            structure.subdirectory_count += 1
+                            structure.subdirectory_names.add(entry.name)
+                            if entry.is_symlink():
+                                structure.depth = 1
+                            else:
+                                subdirectories.append(item)
+                    except OSError:
+                        continue
         except (OSError, PermissionError) as e:
             logger.warning(
                 f"Cannot analyze directory {dir_path}: {e}",
                 extra={"directory": str(dir_path), "error": str(e)},
             )
 
-        return structure
+        return structure, subdirectories, digests
 
-    def _calculate_structure_hash(self, structure: DirectoryStructure) -> str:
+    def _calculate_structure_hash(
+        self,
+        structure: DirectoryStructure,
+        child_hashes: Optional[Dict[str, str]] = None,
+    ) -> str:
         """Calculate hash representing directory structure.
 
         Args:
             structure: DirectoryStructure to hash.
+            child_hashes: Optional structure hashes of the subdirectories,
+                keyed by name. Including them makes the hash a merkle hash
+                of the whole subtree.
 
         Returns:
             Hash string representing the structure.
@@ -189,6 +591,9 @@ class StructureAnalyzer:
         normalized.append(
             f"subdirs:{','.join(sorted(structure.subdirectory_names))}"
         )
+        if child_hashes:
+            children = [f"{name}={child_hashes[name]}" for name in sorted(child_hashes)]
+            normalized.append(f"children:{','.join(children)}")
 
         # Create hash
         hash_obj = hashlib.md5()
@@ -252,6 +657,77 @@ class StructureAnalyzer:
 
         return sum(scores) if scores else 0.0
 
+    def max_similarity(self, structure: DirectoryStructure) -> float:
+        """Upper bound of calculate_similarity against any different hash.
+
+        A term where this structure has no files, subdirectories,
+        extensions or depth is either left out or scores zero, whatever
+        the other structure looks like.
+
+        Args:
+            structure: Directory structure.
+
+        Returns:
+            Sum of the weights of the terms this structure can score.
+        """
+        bound = 0.0
+        if structure.file_count > 0:
+            bound += 0.2
+        if structure.subdirectory_count > 0:
+            bound += 0.2
+        if structure.file_extensions:
+            bound += 0.3
+        if structure.subdirectory_names:
+            bound += 0.2
+        if structure.depth > 0:
+            bound += 0.1
+        return bound
+
+    def similarity_upper_bound(
+        self, structure1: DirectoryStructure, structure2: DirectoryStructure
+    ) -> float:
+        """Upper bound of calculate_similarity for structures with different hashes.
+
+        Count and depth terms are exact; each set term is bounded by the
+        ratio of the set sizes, the highest Jaccard similarity two sets of
+        those sizes can have.
+
+        Args:
+            structure1: First directory structure.
+            structure2: Second directory structure.
+
+        Returns:
+            Value no lower than calculate_similarity for the pair.
+        """
+
+        def ratio(value1: int, value2: int) -> float:
+            return min(value1, value2) / max(value1, value2)
+
+        bound = 0.0
+        if structure1.file_count > 0 or structure2.file_count > 0:
+            bound += ratio(structure1.file_count, structure2.file_count) * 0.2
+        if structure1.subdirectory_count > 0 or structure2.subdirectory_count > 0:
+            bound += (
+                ratio(structure1.subdirectory_count, structure2.subdirectory_count)
+                * 0.2
+            )
+        if structure1.file_extensions or structure2.file_extensions:
+            bound += (
+                ratio(len(structure1.file_extensions), len(structure2.file_extensions))
+                * 0.3
+            )
+        if structure1.subdirectory_names or structure2.subdirectory_names:
+            bound += (
+                ratio(
+                    len(structure1.subdirectory_names),
+                    len(structure2.subdirectory_names),
+                )
+                * 0.2
+            )
+        if structure1.depth > 0 or structure2.depth > 0:
+            bound += ratio(structure1.depth, structure2.depth) * 0.1
+        return bound
+
 
 class DuplicateStructureFinder:
     """Finds duplicate directory structures."""
@@ -349,39 +825,159 @@ class DuplicateStructureFinder:
         Returns:
             List of tuples (structure1, structure2, similarity_score).
         """
-        # Find all directories
-        directories = self.find_directories(search_dir)
-        logger.info(f"Found {len(directories)} directories to analyze")
+        if not search_dir.exists():
+            logger.error(f"Search directory does not exist: {search_dir}")
+            return []
+
+        # Analyze the whole tree in a single bottom-up walk
+        tree = self.analyzer.analyze_tree(search_dir)
+        logger.info(f"Found {len(tree)} directories to analyze")
 
-        # Analyze each directory
-        structures: List[DirectoryStructure] = []
-        for directory in directories:
-            structure = self.analyzer.analyze_directory_structure(directory)
-            if structure.file_count > 0 or structure.subdirectory_count > 0:
-                structures.append(structure)
+        include_root = self.search_config.get("include_root", False)
+        structures = [
+            structure
+            for structure in tree
+            if (include_root or structure.path != search_dir)
+            and (structure.file_count > 0 or structure.subdirectory_count > 0)
+        ]
 
         logger.info(f"Analyzed {len(structures)} directory structures")
 
-        # Find duplicates
-        duplicates = []
+        return self.compare_structures(structures)
+
+    def compare_structures(
+        self, structures: List[DirectoryStructure]
+    ) -> List[Tuple[DirectoryStructure, DirectoryStructure, float]]:
+        """Find pairs of structures at or above the similarity threshold.
+
+        With ``comparison.prefilter`` enabled (the default), structures are
+        grouped by ``structure_hash``: every pair inside a group is an exact
+        match, and because calculate_similarity only looks at hashed
+        features, groups are compared through one representative each.
+        Representative pairs come from MinHash/LSH over file extensions and
+        subdirectory names, and pairs whose count ratios cannot reach the
+        threshold are dropped before scoring. LSH can miss pairs with low
+        set overlap; disable the prefilter to compare every pair. At
+        thresholds of COUNT_DEPTH_WEIGHT and below, pairs with no set
+        overlap at all can match, so every pair is compared regardless.
+
+        Args:
+            structures: Analyzed directory structures.
+
+        Returns:
+            List of tuples (structure1, structure2, similarity_score).
+        """
         similarity_threshold = self.comparison_config.get(
             "similarity_threshold", 0.8
         )
 
-        # Compare all pairs
-        for i, structure1 in enumerate(structures):
-            for structure2 in structures[i + 1 :]:
-                similarity = self.analyzer.calculate_similarity(
-                    structure1, structure2
-                )
+        prefilter = self.comparison_config.get("prefilter", True)
+        if prefilter and similarity_threshold <= COUNT_DEPTH_WEIGHT + BOUND_EPSILON:
+            logger.info(
+                f"Similarity threshold {similarity_threshold} is reachable without "
+                "extension or subdirectory name overlap; comparing every pair"
+            )
+            prefilter = False
+
+        if prefilter:
+            matches = self._prefiltered_matches(structures, similarity_threshold)
+        else:
+            matches = []
+            for i, structure1 in enumerate(structures):
+                for j in range(i + 1, len(structures)):
+                    similarity = self.analyzer.calculate_similarity(
+                        structure1, structures[j]
+                    )
+                    if similarity >= similarity_threshold:
+                        matches.append((i, j, similarity))
+
+        # Sort by similarity (highest first), then in discovery order
+        matches.sort(key=lambda match: (-match[2], match[0], match[1]))
+
+        return [(structures[i], structures[j], sim) for i, j, sim in matches]
+
+    def _prefiltered_matches(
+        self, structures: List[DirectoryStructure], threshold: float
+    ) -> List[Tuple[int, int, float]]:
+        """Find matching index pairs using hash groups and MinHash/LSH.
 
-                if similarity >= similarity_threshold:
-                    duplicates.append((structure1, structure2, similarity))
+        Args:
+            structures: Analyzed directory structures.
+            threshold: Similarity threshold.
 
-        # Sort by similarity (highest first)
-        duplicates.sort(key=lambda x: x[2], reverse=True)
+        Returns:
+            List of (index1, index2, similarity) with index1 < index2.
+        """
+        groups: Dict[str, List[int]] = defaultdict(list)
+        for index, structure in enumerate(structures):
+            groups[structure.structure_hash].append(index)
+        members = list(groups.values())
+
+        matches: List[Tuple[int, int, float]] = []
+        for group in members:
+            for n, i in enumerate(group):
+                matches.extend((i, j, 1.0) for j in group[n + 1 :])
+
+        num_perm = self.comparison_config.get("minhash_permutations", 64)
+        bands = self.comparison_config.get("lsh_bands", 32)
+        extension_index = MinHashLSH(num_perm, bands)
+        subdirectory_index = MinHashLSH(num_perm, bands)
+        representatives = [structures[group[0]] for group in members]
+        max_similarities = [
+            self.analyzer.max_similarity(representative)
+            for representative in representatives
+        ]
+        for key, representative in enumerate(representatives):
+            if max_similarities[key] + BOUND_EPSILON < threshold:
+                continue
+            extension_index.add(key, representative.file_extensions)
+            subdirectory_index.add(key, representative.subdirectory_names)
+
+        def file_count(key: int) -> int:
+            return representatives[key].file_count
+
+        def in_window(key1: int, key2: int) -> bool:
+            # Members are sorted by file count, so key2 has at least as many
+            # files as key1 and the file count ratio only falls further on.
+            # All other terms score at most what key1 can score without it.
+            count1 = representatives[key1].file_count
+            if count1 == 0:
+                return True
+            rest = max_similarities[key1] - 0.2
+            bound = 0.2 * count1 / representatives[key2].file_count + rest
+            return bound + BOUND_EPSILON >= threshold
+
+        candidates = 0
+        compared = 0
+        for index in (extension_index, subdirectory_index):
+            for key1, key2 in index.candidate_pairs(file_count, in_window):
+                if index is subdirectory_index and extension_index.collides(key1, key2):
+                    continue
+
+                candidates += 1
+                structure1 = representatives[key1]
+                structure2 = representatives[key2]
+                bound = self.analyzer.similarity_upper_bound(structure1, structure2)
+                if bound + BOUND_EPSILON < threshold:
+                    continue
+
+                compared += 1
+                similarity = self.analyzer.calculate_similarity(structure1, structure2)
+                if similarity < threshold:
+                    continue
+
+                for i in members[key1]:
+                    for j in members[key2]:
+                        matches.append((min(i, j), max(i, j), similarity))
+
+        total_pairs = len(members) * (len(members) - 1) // 2
+        logger.info(
+            f"Grouped {len(structures)} structures into {len(members)} distinct "
+            f"hashes; scored {compared} of {total_pairs} hash pairs "
+            f"({candidates} LSH candidates)"
+        )
 
-        return duplicates
+        return matches
 
     def generate_report(
         self, duplicates: List[Tuple[DirectoryStructure, DirectoryStructure, float]]
@@ -419,6 +1015,9 @@ class DuplicateStructureFinder:
         lines.append("-" * 80)
         lines.append(f"High similarity (90%+): {len(high_similarity)} pairs")
         lines.append(f"Medium similarity (70-90%): {len(medium_similarity)} pairs")
+        if self.analyzer.content_hashing:
+            exact_copies = [d for d in duplicates if self._same_content(d[0], d[1])]
+            lines.append(f"Exact copies (identical content): {len(exact_copies)} pairs")
         lines.append("")
 
         # Detailed report
@@ -441,9 +1040,22 @@ class DuplicateStructureFinder:
             lines.append(f"    Extensions: {', '.join(sorted(struct2.file_extensions))}")
             lines.append(f"    Total size: {self._format_size(struct2.total_size)}")
 
+            if self.analyzer.content_hashing:
+                if self._same_content(struct1, struct2):
+                    lines.append("  Content: identical")
+                elif struct1.content_hash and struct2.content_hash:
+                    lines.append("  Content: different")
+                else:
+                    lines.append("  Content: unknown (unreadable files)")
+
             # Recommendations
             lines.append("  Recommendation:")
-            if similarity >= 0.95:
+            if self._same_content(struct1, struct2):
+                lines.append(
+                    "    These directories are exact copies - safe to "
+                    "consolidate."
+                )
+            elif similarity >= 0.95:
                 lines.append(
                     "    Consider consolidating these directories - they are "
                     "nearly identical."
@@ -464,6 +1076,22 @@ class DuplicateStructureFinder:
 
         return "\n".join(lines)
 
+    def _same_content(
+        self, structure1: DirectoryStructure, structure2: DirectoryStructure
+    ) -> bool:
+        """Check whether two directories have identical names and contents.
+
+        Args:
+            structure1: First directory structure.
+            structure2: Second directory structure.
+
+        Returns:
+            True if both content hashes are known and equal.
+        """
+        return bool(structure1.content_hash) and (
+            structure1.content_hash == structure2.content_hash
+        )
+
     def _format_size(self, size_bytes: int) -> str:
         """Format file size in human-readable format.
 
@@ -483,6 +1111,10 @@ class DuplicateStructureFinder:
 def load_config(config_path: Path) -> Dict:
     """Load configuration from YAML file.
 
+    A relative ``analysis.digest_cache`` path is resolved against the
+    directory of the configuration file, so the same cache is used
+    whatever the working directory.
+
     Args:
         config_path: Path to configuration file.
 
@@ -498,11 +1130,17 @@ def load_config(config_path: Path) -> Dict:
 
     try:
         with open(config_path, "r") as f:
-            config = yaml.safe_load(f)
-        return config or {}
+            config = yaml.safe_load(f) or {}
     except yaml.YAMLError as e:
         raise yaml.YAMLError(f"Invalid YAML in config file: {e}") from e
 
+    analysis_config = config.get("analysis") or {}
+    cache_file = analysis_config.get("digest_cache", "")
+    if cache_file and not Path(cache_file).is_absolute():
+        analysis_config["digest_cache"] = str(config_path.resolve().parent / cache_file)
+
+    return config
+
 
 def main() -> None:
     """Main entry point for the application."""
@@ -529,6 +1167,11 @@ def main() -> None:
         type=Path,
         help="Output file path (default: stdout)",
     )
+    parser.add_argument(
+        "--content",
+        action="store_true",
+        help="Hash file contents to tell exact copies from look-alikes",
+    )
     parser.add_argument(
         "-v",
         "--verbose",
@@ -554,6 +1197,9 @@ def main() -> None:
     if args.directory:
         config.setdefault("search", {})["directory"] = str(args.directory)
 
+    if args.content:
+        config.setdefault("analysis", {})["content_hashing"] = True
+
     finder = DuplicateStructureFinder(config)
 
     # Get search directory
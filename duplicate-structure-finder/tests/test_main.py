@@ -1,6 +1,7 @@
 """Unit tests for Duplicate Structure Finder application."""
 
 import os
+import random
 import shutil
 import tempfile
 from pathlib import Path
@@ -8,8 +9,10 @@ from pathlib import Path
 import pytest
 
 from src.main import (
+    DigestStore,
     DirectoryStructure,
     DuplicateStructureFinder,
+    MinHashLSH,
     StructureAnalyzer,
     load_config,
 )
@@ -88,6 +91,62 @@ class TestStructureAnalyzer:
         assert "subdir" in structure.subdirectory_names
         assert structure.structure_hash != ""
 
+    def test_analyze_tree(self, analyzer, temp_dir):
+        """Test single-pass analysis of a directory tree."""
+        for name in ("copy1", "copy2"):
+            nested = temp_dir / name / "src" / "pkg"
+            nested.mkdir(parents=True)
+            (temp_dir / name / "readme.md").write_text("content")
+            (nested / "module.py").write_text("code")
+            (temp_dir / name / "docs").mkdir()
+            (temp_dir / name / "docs" / "index.md").write_text("content")
+        (temp_dir / "copy2" / "src" / "pkg" / "extra.txt").write_text("content")
+        (temp_dir / ".git").mkdir()
+
+        structures = analyzer.analyze_tree(temp_dir)
+        by_path = {s.path.relative_to(temp_dir).as_posix(): s for s in structures}
+
+        assert structures[0].path == temp_dir
+        assert set(by_path) == {
+            ".", "copy1", "copy1/src", "copy1/src/pkg", "copy1/docs",
+            "copy2", "copy2/src", "copy2/src/pkg", "copy2/docs",
+        }
+        assert by_path["."].depth == 3
+        assert by_path["copy1"].depth == 2
+        docs1, docs2 = by_path["copy1/docs"], by_path["copy2/docs"]
+        assert docs1.structure_hash == docs2.structure_hash
+        assert by_path["copy2/src/pkg"].file_count == 2
+        # A difference two levels down changes the merkle hash of the ancestor
+        assert by_path["copy1"].structure_hash != by_path["copy2"].structure_hash
+
+    def test_content_hashing(self, config, temp_dir):
+        """Test that content hashes separate exact copies from look-alikes."""
+        tree = temp_dir / "tree"
+        for name, text in (("copy1", "same"), ("copy2", "same"), ("lookalike", "diff")):
+            (tree / name / "src").mkdir(parents=True)
+            (tree / name / "src" / "main.py").write_text(text)
+
+        cache_file = temp_dir / "digests.db"
+        config["analysis"].update(content_hashing=True, digest_cache=str(cache_file))
+        analyzer = StructureAnalyzer(config)
+        by_name = {s.path.name: s for s in analyzer.analyze_tree(tree)}
+
+        assert by_name["copy1"].content_hash == by_name["copy2"].content_hash
+        assert by_name["copy1"].content_hash != by_name["lookalike"].content_hash
+        assert by_name["copy1"].structure_hash == by_name["lookalike"].structure_hash
+
+        # Same size and mtime: the cached digest is reused without reading
+        main_file = tree / "lookalike" / "src" / "main.py"
+        stat = main_file.stat()
+        main_file.write_text("same")
+        os.utime(main_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        store = DigestStore(cache_file)
+        assert store.get(str(main_file), stat.st_size, stat.st_mtime_ns) is not None
+        store.close()
+
+        by_name = {s.path.name: s for s in analyzer.analyze_tree(tree)}
+        assert by_name["copy1"].content_hash != by_name["lookalike"].content_hash
+
     def test_calculate_structure_hash(self, analyzer):
         """Test structure hash calculation."""
         structure1 = DirectoryStructure(
@@ -151,6 +210,68 @@ class TestStructureAnalyzer:
         assert similarity2 < similarity  # Should be less similar
 
 
+    def test_similarity_upper_bound(self, analyzer):
+        """Test that the prefilter bounds never undercut the real score."""
+        rng = random.Random(0)
+        structures = []
+        for n in range(60):
+            extensions = set(rng.sample([".txt", ".pdf", ".py"], rng.randint(0, 3)))
+            names = set(rng.sample(["src", "docs", "tests"], rng.randint(0, 3)))
+            structure = DirectoryStructure(
+                path=Path(f"/test{n}"),
+                depth=rng.randint(1, 3) if names else 0,
+                file_count=len(extensions) + rng.randint(0, 2),
+                subdirectory_count=len(names),
+                file_extensions=extensions,
+                subdirectory_names=names,
+            )
+            structure.structure_hash = analyzer._calculate_structure_hash(structure)
+            structures.append(structure)
+
+        for structure1 in structures:
+            for structure2 in structures:
+                if structure1.structure_hash == structure2.structure_hash:
+                    continue
+                similarity = analyzer.calculate_similarity(structure1, structure2)
+                bound = analyzer.similarity_upper_bound(structure1, structure2)
+                assert bound >= similarity
+                assert analyzer.max_similarity(structure1) >= similarity
+
+
+class TestMinHashLSH:
+    """Test cases for MinHashLSH class."""
+
+    def test_identical_sets_are_candidates(self):
+        """Test that identical sets share a bucket and disjoint sets do not."""
+        index = MinHashLSH(num_perm=16, bands=8)
+        index.add(0, {".txt", ".pdf"})
+        index.add(1, {".pdf", ".txt"})
+        index.add(2, {".jpg"})
+        index.add(3, set())
+
+        assert list(index.candidate_pairs()) == [(0, 1)]
+
+    def test_candidate_pairs_window(self):
+        """Test that pairs are yielded once and the window stops the scan."""
+        index = MinHashLSH(num_perm=16, bands=8)
+        for key in range(4):
+            index.add(key, {".py"})
+        sizes = {0: 1, 1: 2, 2: 10, 3: 3}
+
+        pairs = list(index.candidate_pairs())
+        assert sorted(pairs) == [(i, j) for i in range(4) for j in range(i + 1, 4)]
+
+        windowed = index.candidate_pairs(
+            sort_key=sizes.get, in_window=lambda k1, k2: sizes[k2] <= 2 * sizes[k1]
+        )
+        assert sorted(windowed) == [(0, 1), (1, 3)]
+
+    def test_invalid_bands(self):
+        """Test that bands must divide the permutation count."""
+        with pytest.raises(ValueError):
+            MinHashLSH(num_perm=10, bands=4)
+
+
 class TestDuplicateStructureFinder:
     """Test cases for DuplicateStructureFinder class."""
 
@@ -208,6 +329,64 @@ class TestDuplicateStructureFinder:
         duplicates = finder.find_duplicate_structures(temp_dir)
         assert len(duplicates) >= 1
 
+    def test_compare_structures_prefilter(self, finder):
+        """Test that the prefilter finds the same pairs as comparing all pairs."""
+        specs = [
+            (3, {".txt", ".py"}, {"src", "docs"}, 1),
+            (3, {".txt", ".py"}, {"src", "docs"}, 1),
+            (4, {".txt", ".py"}, {"src", "docs"}, 1),
+            (3, {".txt", ".py"}, {"src", "tests"}, 2),
+            (2, {".jpg"}, set(), 0),
+            (2, {".jpg"}, set(), 0),
+            (5, {".jpg"}, set(), 0),
+            (1, {".csv"}, {"raw"}, 1),
+        ]
+        structures = []
+        for n, (files, extensions, names, depth) in enumerate(specs):
+            structure = DirectoryStructure(
+                path=Path(f"/dir{n}"),
+                depth=depth,
+                file_count=files,
+                subdirectory_count=len(names),
+                file_extensions=extensions,
+                subdirectory_names=names,
+            )
+            structure.structure_hash = finder.analyzer._calculate_structure_hash(
+                structure
+            )
+            structures.append(structure)
+
+        finder.comparison_config["prefilter"] = False
+        expected = finder.compare_structures(structures)
+        finder.comparison_config["prefilter"] = True
+        result = finder.compare_structures(structures)
+
+        assert result == expected
+        assert (structures[4], structures[5], 1.0) in result
+
+    def test_compare_structures_prefilter_low_threshold(self, finder):
+        """Test that pairs matching on counts and depth alone are found."""
+        structures = []
+        for n, (extension, name) in enumerate([(".txt", "src"), (".jpg", "img")]):
+            structure = DirectoryStructure(
+                path=Path(f"/dir{n}"),
+                depth=1,
+                file_count=3,
+                subdirectory_count=1,
+                file_extensions={extension},
+                subdirectory_names={name},
+            )
+            structure.structure_hash = finder.analyzer._calculate_structure_hash(
+                structure
+            )
+            structures.append(structure)
+
+        finder.comparison_config["similarity_threshold"] = 0.5
+        finder.comparison_config["prefilter"] = True
+        result = finder.compare_structures(structures)
+
+        assert result == [(structures[0], structures[1], pytest.approx(0.5))]
+
     def test_generate_report(self, finder):
         """Test report generation."""
         structure1 = DirectoryStructure(
@@ -265,6 +444,16 @@ class TestLoadConfig:
         assert config["search"]["directory"] == "/test"
         assert config["comparison"]["similarity_threshold"] == 0.8
 
+    def test_load_config_resolves_digest_cache(self, temp_dir):
+        """Test that a relative digest cache is placed next to the config file."""
+        config_file = temp_dir / "config.yaml"
+        config_file.write_text("analysis:\n  digest_cache: cache/digests.db\n")
+
+        config = load_config(config_file)
+        assert config["analysis"]["digest_cache"] == str(
+            temp_dir.resolve() / "cache" / "digests.db"
+        )
+
     def test_load_config_nonexistent(self):
         """Test loading a nonexistent configuration file."""
         nonexistent = Path("/nonexistent/config.yaml")
@@ -2,24 +2,255 @@
 
 This module provides functionality to read multiple sheets from Excel files,
 merge data with configurable strategies, validate data integrity, and export
-the merged result to CSV format with comprehensive error handling.
+the merged result to CSV (or Parquet/Feather) with comprehensive error
+handling.
 """
 
+import hashlib
 import logging
 import logging.handlers
 import os
+import pickle
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Deque, Dict, Iterator, List, Optional, Set, Tuple
 
 import pandas as pd
 import yaml
 from dotenv import load_dotenv
 
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
 # Load environment variables
 load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+# Strategies the streaming merge supports (join needs every sheet at once)
+STREAMING_STRATEGIES = {"concat", "union", "intersection"}
+
+# Two independent 16-byte keys for pandas row hashing; together they give
+# 128-bit row digests for duplicate removal in streaming merges
+ROW_DIGEST_KEYS = ("excelmerger--row", "excelmerger--dup")
+
+# Placeholder for missing values when computing row digests
+MISSING_VALUE_TOKEN = "\x00<NA>"
+
+# Rows read from each sheet's start to infer streaming Parquet/Feather types
+SCHEMA_SAMPLE_ROWS = 1000
+
+# Workbook file extensions accepted as input
+EXCEL_EXTENSIONS = {".xlsx", ".xls", ".xlsm"}
+
+# Output format implied by each output file extension (output.format: auto)
+OUTPUT_FORMATS = {
+    ".csv": "csv",
+    ".parquet": "parquet",
+    ".pq": "parquet",
+    ".feather": "feather",
+    ".arrow": "feather",
+}
+
+
+class SheetCache:
+    """Sidecar cache of parsed sheets, validated by workbook size and mtime.
+
+    Each parsed sheet is pickled to its own file (with the workbook's sheet
+    list in one more), so concurrent workers never write the same entry. An
+    entry is only used while the workbook's size and modification time
+    still match the values recorded when it was parsed; unreadable entries
+    are treated as missing.
+    """
+
+    def __init__(self, cache_dir: Path) -> None:
+        """Initialize SheetCache.
+
+        Args:
+            cache_dir: Directory holding cache entries.
+        """
+        self.cache_dir = cache_dir
+
+    def _entry_path(self, workbook: Path, *key: Any) -> Path:
+        """Return the cache file for a workbook and key."""
+        raw = "\0".join(str(part) for part in (workbook.resolve(), *key))
+        return self.cache_dir / f"{hashlib.sha1(raw.encode()).hexdigest()}.pkl"
+
+    @staticmethod
+    def _stamp(workbook: Path) -> Tuple[int, int]:
+        """Return (size, mtime_ns) of a workbook."""
+        stat = workbook.stat()
+        return stat.st_size, stat.st_mtime_ns
+
+    def _read(self, entry_path: Path, workbook: Path) -> Any:
+        """Load an entry's value, or None if missing, stale or unreadable."""
+        try:
+            with open(entry_path, "rb") as f:
+                stamp, value = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.debug(f"Ignoring unreadable cache entry {entry_path}: {e}")
+            return None
+        return value if stamp == self._stamp(workbook) else None
+
+    def _write(self, entry_path: Path, workbook: Path, value: Any) -> None:
+        """Store an entry atomically, replacing any stale version."""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        temp_path = entry_path.with_name(f"{entry_path.name}.{os.getpid()}.tmp")
+        with open(temp_path, "wb") as f:
+            pickle.dump(
+                (self._stamp(workbook), value), f, protocol=pickle.HIGHEST_PROTOCOL
+            )
+        os.replace(temp_path, entry_path)
+
+    def get_sheet_names(self, workbook: Path) -> Optional[List[str]]:
+        """Return the cached sheet list of a workbook, if still valid."""
+        return self._read(self._entry_path(workbook, "<sheets>"), workbook)
+
+    def put_sheet_names(self, workbook: Path, sheet_names: List[str]) -> None:
+        """Cache the sheet list of a workbook."""
+        self._write(self._entry_path(workbook, "<sheets>"), workbook, sheet_names)
+
+    def get(
+        self, workbook: Path, sheet_name: str, header_row: Any
+    ) -> Optional[pd.DataFrame]:
+        """Return a cached parsed sheet, if still valid."""
+        entry_path = self._entry_path(workbook, sheet_name, header_row)
+        return self._read(entry_path, workbook)
+
+    def put(
+        self, workbook: Path, sheet_name: str, header_row: Any, df: pd.DataFrame
+    ) -> None:
+        """Cache a parsed sheet."""
+        entry_path = self._entry_path(workbook, sheet_name, header_row)
+        self._write(entry_path, workbook, df)
+
+
+class ColumnarWriter:
+    """Write DataFrame slices to a Parquet or Feather (Arrow IPC) file.
+
+    Each written slice becomes one Parquet row group or one Arrow record
+    batch under a fixed schema, so the merged data is converted to Arrow a
+    slice at a time instead of all at once. Columns can be widened to text
+    later, which rewrites the data written so far.
+    """
+
+    def __init__(
+        self,
+        file_path: Path,
+        file_format: str,
+        schema: "pa.Schema",
+        compression: Optional[str] = None,
+    ) -> None:
+        """Open the output file.
+
+        Args:
+            file_path: Path to output file.
+            file_format: "parquet" or "feather".
+            schema: Arrow schema every slice is converted to.
+            compression: Codec name, or None for the format default
+                (snappy for Parquet, uncompressed for Feather so the file
+                can be memory-mapped).
+        """
+        self.file_path = Path(file_path)
+        self.file_format = file_format
+        self.compression = compression
+        self.schema = schema
+        self._open()
+
+    def _open(self) -> None:
+        """Open a writer for the current schema at the output path."""
+        if self.file_format == "parquet":
+            self._writer = pq.ParquetWriter(
+                str(self.file_path),
+                self.schema,
+                compression=self.compression or "snappy",
+            )
+        else:
+            options = pa.ipc.IpcWriteOptions(compression=self.compression)
+            self._writer = pa.ipc.new_file(
+                str(self.file_path), self.schema, options=options
+            )
+
+    def _written_tables(self, file_path: Path) -> Iterator["pa.Table"]:
+        """Yield the row groups / record batches of a finished file.
+
+        Args:
+            file_path: Path to a file written by this class.
+
+        Yields:
+            One table per row group or record batch.
+        """
+        if self.file_format == "parquet":
+            parquet_file = pq.ParquetFile(str(file_path))
+            for index in range(parquet_file.num_row_groups):
+                yield parquet_file.read_row_group(index)
+        else:
+            with pa.memory_map(str(file_path)) as source:
+                reader = pa.ipc.open_file(source)
+                for index in range(reader.num_record_batches):
+                    yield pa.Table.from_batches([reader.get_batch(index)])
+
+    def widen(self, columns: List[str]) -> None:
+        """Change columns to text, converting everything written so far.
+
+        Existing values are rendered the way pandas renders them, matching
+        mixed-type columns converted by _arrow_compatible.
+
+        Args:
+            columns: Names of the columns to store as strings.
+        """
+        columns = [
+            name
+            for name in columns
+            if not pa.types.is_string(self.schema.field(name).type)
+        ]
+        if not columns:
+            return
+
+        self._writer.close()
+        previous_path = self.file_path.with_name(self.file_path.name + ".widen")
+        os.replace(self.file_path, previous_path)
+        for name in columns:
+            index = self.schema.get_field_index(name)
+            self.schema = self.schema.set(index, pa.field(name, pa.string()))
+        self._open()
+
+        try:
+            for table in self._written_tables(previous_path):
+                for name in columns:
+                    index = table.schema.get_field_index(name)
+                    values = table.column(index).to_pandas(integer_object_nulls=True)
+                    text = values.astype(str).where(values.notna(), None)
+                    table = table.set_column(
+                        index, name, pa.array(text, type=pa.string())
+                    )
+                self._writer.write_table(table.cast(self.schema))
+        finally:
+            previous_path.unlink()
+        logger.debug(f"Stored column(s) {columns} as text in {self.file_path}")
+
+    def write(self, df: pd.DataFrame) -> None:
+        """Append a slice as one row group / record batch.
+
+        Args:
+            df: DataFrame with the columns of the writer's schema.
+        """
+        table = pa.Table.from_pandas(df, schema=self.schema, preserve_index=False)
+        self._writer.write_table(table)
+
+    def close(self) -> None:
+        """Finish the file footer and close it."""
+        self._writer.close()
+
 
 class ExcelSheetMerger:
     """Processes Excel files by merging multiple sheets into CSV format."""
@@ -45,6 +276,7 @@ class ExcelSheetMerger:
             "merged_rows": 0,
             "validation_errors": 0,
             "sheets_skipped": 0,
+            "sheets_cached": 0,
         }
 
     def _load_config(self, config_path: str) -> dict:
@@ -147,11 +379,10 @@ class ExcelSheetMerger:
             self.validation_errors.append(error_msg)
             return False
 
-        valid_extensions = {".xlsx", ".xls", ".xlsm"}
-        if file_path.suffix.lower() not in valid_extensions:
+        if file_path.suffix.lower() not in EXCEL_EXTENSIONS:
             error_msg = (
                 f"Invalid file extension: {file_path.suffix}. "
-                f"Expected one of {valid_extensions}"
+                f"Expected one of {EXCEL_EXTENSIONS}"
             )
             logger.error(error_msg)
             self.validation_errors.append(error_msg)
@@ -159,11 +390,233 @@ class ExcelSheetMerger:
 
         return True
 
+    def _sheet_cache(self, workbook: Path) -> Optional[SheetCache]:
+        """Return the sidecar sheet cache for a workbook, if enabled.
+
+        The cache is off unless reading.cache_dir is set, because entries
+        are pickled and loading a pickle runs code; it should only point at
+        a directory that other users cannot write. A relative cache_dir is
+        resolved next to the workbook.
+
+        Args:
+            workbook: Path to Excel file.
+
+        Returns:
+            SheetCache, or None if caching is disabled.
+        """
+        cache_dir = self.config.get("reading", {}).get("cache_dir")
+        if not cache_dir:
+            return None
+        cache_path = Path(cache_dir).expanduser()
+        if not cache_path.is_absolute():
+            cache_path = workbook.parent / cache_path
+        return SheetCache(cache_path)
+
+    @staticmethod
+    def _read_workbook(
+        file_path: Path,
+        sheet_names: Optional[List[str]],
+        header_row: Any,
+        cache_dir: Optional[Path],
+        nrows: Optional[int] = None,
+        open_files: Optional[Dict[Path, Any]] = None,
+    ) -> Dict[str, Any]:
+        """Read sheets from one workbook, using the sheet cache when valid.
+
+        The workbook is only opened if a requested sheet (or the sheet list)
+        is not cached. Runs in worker processes, so it only touches its
+        arguments.
+
+        Args:
+            file_path: Path to Excel file.
+            sheet_names: Sheets to read, or None for all sheets.
+            header_row: Row to use as column headers.
+            cache_dir: Sheet cache directory, or None to disable caching.
+            nrows: Read only this many data rows of each sheet; partial
+                sheets are not written to the cache.
+            open_files: Open workbooks to reuse across calls. A workbook
+                opened here is added to it and left open for the caller to
+                close; without it, the workbook is closed before returning.
+
+        Returns:
+            Dictionary with the workbook's "available" sheet names, the
+            parsed "sheets", per-sheet "errors", the number of sheets served
+            from the cache and the elapsed "seconds".
+        """
+        start = time.perf_counter()
+        cache = SheetCache(cache_dir) if cache_dir else None
+        excel_file = open_files.get(file_path) if open_files is not None else None
+        sheets: Dict[str, pd.DataFrame] = {}
+        errors: Dict[str, str] = {}
+        cached = 0
+
+        try:
+            available = cache.get_sheet_names(file_path) if cache else None
+            if available is None:
+                if excel_file is None:
+                    excel_file = pd.ExcelFile(file_path, engine="openpyxl")
+                available = list(excel_file.sheet_names)
+                if cache:
+                    cache.put_sheet_names(file_path, available)
+
+            wanted = available if sheet_names is None else sheet_names
+            for sheet_name in wanted:
+                if sheet_name not in available:
+                    continue
+                df = cache.get(file_path, sheet_name, header_row) if cache else None
+                if df is not None:
+                    cached += 1
+                    if nrows is not None:
+                        df = df.head(nrows)
+                else:
+                    try:
+                        if excel_file is None:
+                            excel_file = pd.ExcelFile(file_path, engine="openpyxl")
+                        df = pd.read_excel(
+                            excel_file,
+                            sheet_name=sheet_name,
+                            engine="openpyxl",
+                            header=header_row,
+                            nrows=nrows,
+                        )
+                    except Exception as e:
+                        errors[sheet_name] = str(e)
+                        continue
+                    if cache and nrows is None:
+                        cache.put(file_path, sheet_name, header_row, df)
+                sheets[sheet_name] = df
+        finally:
+            if excel_file is not None:
+                if open_files is None:
+                    excel_file.close()
+                else:
+                    open_files[file_path] = excel_file
+
+        return {
+            "available": available,
+            "sheets": sheets,
+            "errors": errors,
+            "cached": cached,
+            "seconds": time.perf_counter() - start,
+        }
+
+    def _read_jobs(self) -> int:
+        """Resolve reading.jobs (0 = all CPU cores) to a process count.
+
+        Returns:
+            Number of worker processes to read with, at least 1.
+        """
+        jobs = int(self.config.get("reading", {}).get("jobs", 1))
+        if jobs <= 0:
+            jobs = os.cpu_count() or 1
+        return jobs
+
+    def _read_workbooks(
+        self,
+        tasks: List[Tuple[Path, Optional[List[str]]]],
+        nrows: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """Run _read_workbook for each task, across a process pool if enabled.
+
+        With reading.jobs above 1 (0 = all CPU cores) and more than one task,
+        tasks run in worker processes; results keep the order of tasks.
+
+        Args:
+            tasks: (workbook path, sheet names or None) pairs.
+            nrows: Data rows to read from each sheet, or None for all.
+
+        Returns:
+            _read_workbook results in task order.
+        """
+        header_row = self.config.get("reading", {}).get("header_row", 0)
+        jobs = min(self._read_jobs(), len(tasks))
+
+        arguments = []
+        for file_path, sheet_names in tasks:
+            cache = self._sheet_cache(file_path)
+            cache_dir = cache.cache_dir if cache else None
+            arguments.append((file_path, sheet_names, header_row, cache_dir, nrows))
+
+        if jobs <= 1:
+            return [self._read_workbook(*args) for args in arguments]
+
+        logger.info(f"Reading {len(tasks)} task(s) with {jobs} worker process(es)")
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            futures = [
+                executor.submit(self._read_workbook, *args) for args in arguments
+            ]
+            return [future.result() for future in futures]
+
+    def _collect_sheets(
+        self, label_prefix: str, result: Dict[str, Any]
+    ) -> Dict[str, pd.DataFrame]:
+        """Turn a _read_workbook result into labeled, tracked DataFrames.
+
+        Args:
+            label_prefix: Prefix for sheet labels ("" for a single workbook).
+            result: _read_workbook result.
+
+        Returns:
+            Dictionary mapping sheet labels to DataFrames.
+
+        Raises:
+            ValueError: If a sheet failed to load and invalid sheets are not
+                skipped.
+        """
+        loaded_sheets = {}
+        for sheet_name, error in result["errors"].items():
+            label = f"{label_prefix}{sheet_name}"
+            error_msg = f"Error loading sheet '{label}': {error}"
+            logger.error(error_msg)
+            self.validation_errors.append(error_msg)
+            if not self.config.get("error_handling", {}).get(
+                "skip_invalid_sheets", False
+            ):
+                raise ValueError(error_msg)
+            logger.warning(f"Skipping invalid sheet: {label}")
+            self.stats["sheets_skipped"] += 1
+
+        for sheet_name, df in result["sheets"].items():
+            label = f"{label_prefix}{sheet_name}"
+            # Add sheet name as column for tracking
+            if self.config.get("merging", {}).get("add_sheet_column", True):
+                df.insert(0, "source_sheet", label)
+            loaded_sheets[label] = df
+            logger.info(
+                f"Loaded sheet '{label}': {len(df)} rows, {len(df.columns)} columns"
+            )
+
+        self.stats["sheets_cached"] += result["cached"]
+        return loaded_sheets
+
+    def _available_sheets(self, workbook: Path) -> List[str]:
+        """List a workbook's sheets, from the sheet cache when valid.
+
+        Args:
+            workbook: Path to Excel file.
+
+        Returns:
+            Sheet names in workbook order.
+        """
+        cache = self._sheet_cache(workbook)
+        available_sheets = cache.get_sheet_names(workbook) if cache else None
+        if available_sheets is None:
+            with pd.ExcelFile(workbook, engine="openpyxl") as excel_file:
+                available_sheets = list(excel_file.sheet_names)
+            if cache:
+                cache.put_sheet_names(workbook, available_sheets)
+        return available_sheets
+
     def load_excel_sheets(
         self, file_path: str, sheet_names: Optional[List[str]] = None
     ) -> Dict[str, pd.DataFrame]:
         """Load specified sheets from Excel file.
 
+        Sheets are read in parallel, one task per sheet, when reading.jobs
+        allows it; otherwise the workbook is opened once for all sheets.
+        Sheets are served from the sheet cache, if enabled, while the
+        workbook is unchanged.
+
         Args:
             file_path: Path to Excel file.
             sheet_names: List of sheet names to load. If None, loads all sheets.
@@ -182,8 +635,13 @@ class ExcelSheetMerger:
             raise FileNotFoundError(f"Excel file validation failed: {file_path}")
 
         try:
-            excel_file = pd.ExcelFile(excel_path, engine="openpyxl")
-            available_sheets = excel_file.sheet_names
+            results = None
+            if self._read_jobs() > 1:
+                available_sheets = self._available_sheets(excel_path)
+            else:
+                # Open the workbook once; the sheet list comes back with it
+                results = self._read_workbooks([(excel_path, sheet_names)])
+                available_sheets = results[0]["available"]
             logger.info(
                 f"Found {len(available_sheets)} sheet(s) in {file_path}: "
                 f"{', '.join(available_sheets)}"
@@ -204,32 +662,15 @@ class ExcelSheetMerger:
                     self.validation_errors.append(error_msg)
                     raise ValueError(error_msg)
 
+            if results is None:
+                # One task per sheet, so a single workbook's sheets load in
+                # parallel
+                results = self._read_workbooks(
+                    [(excel_path, [name]) for name in sheet_names]
+                )
             loaded_sheets = {}
-            for sheet_name in sheet_names:
-                try:
-                    df = pd.read_excel(
-                        excel_file,
-                        sheet_name=sheet_name,
-                        engine="openpyxl",
-                        header=self.config.get("reading", {}).get("header_row", 0),
-                    )
-                    # Add sheet name as column for tracking
-                    if self.config.get("merging", {}).get("add_sheet_column", True):
-                        df.insert(0, "source_sheet", sheet_name)
-                    loaded_sheets[sheet_name] = df
-                    logger.info(
-                        f"Loaded sheet '{sheet_name}': {len(df)} rows, "
-                        f"{len(df.columns)} columns"
-                    )
-                except Exception as e:
-                    error_msg = f"Error loading sheet '{sheet_name}': {e}"
-                    logger.error(error_msg)
-                    self.validation_errors.append(error_msg)
-                    if self.config.get("error_handling", {}).get("skip_invalid_sheets", False):
-                        logger.warning(f"Skipping invalid sheet: {sheet_name}")
-                        self.stats["sheets_skipped"] += 1
-                        continue
-                    raise
+            for result in results:
+                loaded_sheets.update(self._collect_sheets("", result))
 
             self.sheet_data.update(loaded_sheets)
             self.stats["sheets_processed"] = len(loaded_sheets)
@@ -248,6 +689,85 @@ class ExcelSheetMerger:
             self.validation_errors.append(error_msg)
             raise
 
+    def find_workbooks(self, directory: str) -> List[Path]:
+        """List the Excel workbooks in a directory, sorted by name.
+
+        Office lock files ("~$name.xlsx") are skipped.
+
+        Args:
+            directory: Directory to search (not recursive).
+
+        Returns:
+            Sorted workbook paths.
+
+        Raises:
+            FileNotFoundError: If the directory doesn't exist.
+        """
+        folder = Path(directory)
+        if not folder.is_dir():
+            raise FileNotFoundError(f"Directory not found: {directory}")
+        return sorted(
+            path
+            for path in folder.iterdir()
+            if path.is_file()
+            and path.suffix.lower() in EXCEL_EXTENSIONS
+            and not path.name.startswith("~$")
+        )
+
+    def load_workbooks(
+        self, file_paths: List[str], sheet_names: Optional[List[str]] = None
+    ) -> Dict[str, pd.DataFrame]:
+        """Load sheets from several workbooks, one worker task per workbook.
+
+        Sheets are labeled "<workbook file name>:<sheet name>" so sheets with
+        the same name in different workbooks stay distinct.
+
+        Args:
+            file_paths: Paths to Excel files.
+            sheet_names: Sheets to load from every workbook. If None, loads
+                all sheets.
+
+        Returns:
+            Dictionary mapping sheet labels to DataFrames.
+
+        Raises:
+            FileNotFoundError: If a file doesn't exist or is not a workbook.
+            ValueError: If a workbook lacks a specified sheet, or a sheet
+                fails to load and invalid sheets are not skipped.
+        """
+        paths = [Path(file_path) for file_path in file_paths]
+        for path in paths:
+            if not self._validate_excel_file(path):
+                raise FileNotFoundError(f"Excel file validation failed: {path}")
+
+        start = time.perf_counter()
+        results = self._read_workbooks([(path, sheet_names) for path in paths])
+
+        loaded_sheets = {}
+        for path, result in zip(paths, results):
+            if sheet_names is not None:
+                missing_sheets = set(sheet_names) - set(result["available"])
+                if missing_sheets:
+                    error_msg = (
+                        f"Specified sheets not found in {path.name}: "
+                        f"{', '.join(missing_sheets)}"
+                    )
+                    logger.error(error_msg)
+                    self.validation_errors.append(error_msg)
+                    raise ValueError(error_msg)
+            loaded_sheets.update(self._collect_sheets(f"{path.name}:", result))
+            logger.debug(f"Read {path.name} in {result['seconds']:.2f}s")
+
+        self.sheet_data.update(loaded_sheets)
+        self.stats["sheets_processed"] = len(loaded_sheets)
+        logger.info(
+            f"Loaded {len(loaded_sheets)} sheet(s) from {len(paths)} workbook(s) "
+            f"in {time.perf_counter() - start:.2f}s "
+            f"({self.stats['sheets_cached']} from cache)"
+        )
+
+        return loaded_sheets
+
     def _validate_dataframe(self, df: pd.DataFrame, sheet_name: str) -> List[str]:
         """Validate DataFrame data quality.
 
@@ -464,9 +984,419 @@ class ExcelSheetMerger:
 
         return cleaned_df
 
+    def _sheet_sources(
+        self,
+        input_file: str,
+        sheet_names: Optional[List[str]],
+        sample_rows: int = 0,
+    ) -> List[Tuple[Path, str, str, Optional[pd.DataFrame]]]:
+        """List the sheets to merge, reading only their headers.
+
+        Each workbook is opened once for all of its sheets' headers, and
+        workbooks are read in parallel when reading.jobs allows it.
+
+        Args:
+            input_file: Excel file, or folder of workbooks.
+            sheet_names: Sheets to merge from each workbook, or None for all.
+            sample_rows: Data rows to read from each sheet for type
+                inference.
+
+        Returns:
+            (workbook path, sheet name, label prefix, header) for each sheet.
+            The prefix is "<workbook file name>:" for folders, as in
+            load_workbooks, and empty for a single workbook. The header is a
+            DataFrame with the sheet's columns, including source_sheet if it
+            is added on load, and up to sample_rows rows, or None if the
+            sheet failed to load (the data pass reports the error).
+
+        Raises:
+            FileNotFoundError: If a workbook doesn't exist or is invalid.
+            ValueError: If a workbook lacks a specified sheet.
+        """
+        input_path = Path(input_file)
+        if input_path.is_dir():
+            workbooks = self.find_workbooks(input_file)
+            if not workbooks:
+                raise ValueError(f"No Excel files found in: {input_file}")
+        else:
+            workbooks = [input_path]
+
+        for workbook in workbooks:
+            if not self._validate_excel_file(workbook):
+                raise FileNotFoundError(f"Excel file validation failed: {workbook}")
+
+        # Without a header row the columns are only known from a data row
+        header_row = self.config.get("reading", {}).get("header_row", 0)
+        nrows = sample_rows if header_row is not None else max(sample_rows, 1)
+        results = self._read_workbooks(
+            [(workbook, sheet_names) for workbook in workbooks], nrows=nrows
+        )
+        add_sheet_column = self.config.get("merging", {}).get("add_sheet_column", True)
+
+        sources = []
+        for workbook, result in zip(workbooks, results):
+            available = result["available"]
+            if sheet_names is not None:
+                missing_sheets = set(sheet_names) - set(available)
+                if missing_sheets:
+                    error_msg = (
+                        f"Specified sheets not found in {workbook.name}: "
+                        f"{', '.join(missing_sheets)}"
+                    )
+                    logger.error(error_msg)
+                    self.validation_errors.append(error_msg)
+                    raise ValueError(error_msg)
+            prefix = f"{workbook.name}:" if input_path.is_dir() else ""
+            for sheet_name in sheet_names if sheet_names is not None else available:
+                header = result["sheets"].get(sheet_name)
+                if header is not None:
+                    header = header.head(sample_rows)
+                    if add_sheet_column:
+                        header.insert(0, "source_sheet", sheet_name)
+                sources.append((workbook, sheet_name, prefix, header))
+        return sources
+
+    def _stream_sheets(
+        self, sources: List[Tuple[Path, str, str, Optional[pd.DataFrame]]]
+    ) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Read the sheets to merge in order, keeping few of them in memory.
+
+        Sequentially, each workbook is opened once and its sheets are read
+        one at a time. With reading.jobs above 1, whole workbooks are read
+        ahead in worker processes, at most jobs at a time, so memory is
+        bounded by that many workbooks instead of one sheet.
+
+        Args:
+            sources: _sheet_sources results.
+
+        Yields:
+            (label prefix, _read_workbook result) pairs in source order.
+        """
+        header_row = self.config.get("reading", {}).get("header_row", 0)
+        groups: List[Tuple[Path, str, List[str]]] = []
+        for workbook, sheet_name, prefix, _ in sources:
+            if groups and groups[-1][0] == workbook:
+                groups[-1][2].append(sheet_name)
+            else:
+                groups.append((workbook, prefix, [sheet_name]))
+
+        jobs = min(self._read_jobs(), len(groups))
+        if jobs <= 1:
+            for workbook, prefix, names in groups:
+                cache = self._sheet_cache(workbook)
+                cache_dir = cache.cache_dir if cache else None
+                open_files: Dict[Path, Any] = {}
+                try:
+                    for sheet_name in names:
+                        yield prefix, self._read_workbook(
+                            workbook,
+                            [sheet_name],
+                            header_row,
+                            cache_dir,
+                            open_files=open_files,
+                        )
+                finally:
+                    for excel_file in open_files.values():
+                        excel_file.close()
+            return
+
+        logger.info(f"Reading {len(groups)} workbook(s) with {jobs} worker process(es)")
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            pending: Deque[Tuple[str, Future]] = deque()
+            for workbook, prefix, names in groups:
+                cache = self._sheet_cache(workbook)
+                pending.append(
+                    (
+                        prefix,
+                        executor.submit(
+                            self._read_workbook,
+                            workbook,
+                            names,
+                            header_row,
+                            cache.cache_dir if cache else None,
+                        ),
+                    )
+                )
+                if len(pending) >= jobs:
+                    prefix, future = pending.popleft()
+                    yield prefix, future.result()
+            while pending:
+                prefix, future = pending.popleft()
+                yield prefix, future.result()
+
+    def _streaming_schema(
+        self, columns: List[Any], samples: List[pd.DataFrame]
+    ) -> "pa.Schema":
+        """Infer the columnar output schema from the first rows of each sheet.
+
+        A column takes the type its sampled values share across sheets,
+        with integers promoted to floats and timestamps to the finer unit.
+        Columns whose types conflict, or that have no sampled values, are
+        stored as text.
+
+        Args:
+            columns: Output columns.
+            samples: Sheet headers from _sheet_sources, one per loaded sheet.
+
+        Returns:
+            Arrow schema with one field per output column.
+        """
+        fields = []
+        for col in columns:
+            types = []
+            for sample in samples:
+                if col not in sample.columns or not sample[col].notna().any():
+                    continue
+                try:
+                    data_type = pa.array(sample[col], from_pandas=True).type
+                except (pa.ArrowInvalid, pa.ArrowTypeError):
+                    data_type = pa.string()
+                if pa.types.is_large_string(data_type):
+                    data_type = pa.string()
+                types.append(pa.schema([(str(col), data_type)]))
+            data_type = pa.string()
+            if types:
+                try:
+                    merged = pa.unify_schemas(types, promote_options="permissive")
+                    data_type = merged.field(0).type
+                except (pa.ArrowInvalid, pa.ArrowTypeError):
+                    pass
+            fields.append((str(col), data_type))
+        return pa.schema(fields)
+
+    @staticmethod
+    def _cast_to_schema(
+        df: pd.DataFrame, schema: "pa.Schema"
+    ) -> Tuple[pd.DataFrame, List[str]]:
+        """Prepare aligned rows for a columnar schema.
+
+        Args:
+            df: Rows aligned to the output columns.
+            schema: Target schema from ColumnarWriter.
+
+        Returns:
+            Tuple of (DataFrame with string columns rendered as text, names
+            of typed columns whose values do not fit their type; those are
+            rendered as text too).
+        """
+        converted = df.rename(columns=str)
+        failed = []
+        for field in schema:
+            values = converted[field.name]
+            if not pa.types.is_string(field.type):
+                try:
+                    pa.array(values, type=field.type, from_pandas=True)
+                    continue
+                except (pa.ArrowInvalid, pa.ArrowTypeError):
+                    failed.append(field.name)
+            converted[field.name] = values.astype(str).where(values.notna(), None)
+        return converted, failed
+
+    def _streaming_columns(self, strategy: str, headers: List[List[Any]]) -> List[Any]:
+        """Compute the merged column set from sheet headers.
+
+        Args:
+            strategy: concat, union or intersection.
+            headers: Column names of each sheet, in merge order.
+
+        Returns:
+            Output columns: concat keeps first-appearance order, union is
+            sorted (as in _merge_dataframes), and intersection keeps the
+            first sheet's order.
+
+        Raises:
+            ValueError: If an intersection has no common columns.
+        """
+        if not headers:
+            return []
+
+        if strategy == "union":
+            return sorted({col for columns in headers for col in columns})
+
+        if strategy == "intersection":
+            common_columns = set(headers[0]).intersection(*headers[1:])
+            if not common_columns:
+                raise ValueError("No common columns found across sheets")
+            return [col for col in headers[0] if col in common_columns]
+
+        merged_columns = []
+        seen = set()
+        for columns in headers:
+            for col in columns:
+                if col not in seen:
+                    seen.add(col)
+                    merged_columns.append(col)
+        return merged_columns
+
+    def _row_digests(self, df: pd.DataFrame) -> List[int]:
+        """Calculate a 128-bit digest of each row, comparing values as text.
+
+        Numbers are rendered as floats first, so an integer column from one
+        sheet matches the same values in a float column (one with blanks)
+        from another, as drop_duplicates does after concatenating sheets.
+
+        Args:
+            df: Aligned rows to digest.
+
+        Returns:
+            One digest per row, as Python integers.
+        """
+        canonical = {}
+        for position in range(df.shape[1]):
+            values = df.iloc[:, position]
+            text = values.astype(str)
+            if pd.api.types.is_numeric_dtype(values):
+                numeric = values.notna()
+            elif pd.api.types.is_object_dtype(values):
+                numeric = values.map(pd.api.types.is_number)
+            else:
+                numeric = None
+            if numeric is not None and numeric.any():
+                numbers = pd.to_numeric(values.where(numeric), errors="coerce")
+                text = text.where(~numeric, numbers.astype("float64").astype(str))
+            canonical[position] = text.where(values.notna(), MISSING_VALUE_TOKEN)
+        canonical = pd.DataFrame(canonical, index=df.index)
+        high, low = (
+            pd.util.hash_pandas_object(canonical, index=False, hash_key=key).tolist()
+            for key in ROW_DIGEST_KEYS
+        )
+        return [(h << 64) | l for h, l in zip(high, low)]
+
+    def merge_streaming(self, input_file: str, output_file: str) -> Dict[str, Any]:
+        """Merge sheets straight into the output file, one sheet at a time.
+
+        The merged column set is computed from sheet headers first; each
+        sheet is then loaded, validated, aligned to those columns, cleaned
+        and appended to the output before the next one is read, so memory
+        is bounded by the largest sheet (or, with reading.jobs above 1, by
+        that many workbooks read ahead). Each workbook is opened once per
+        pass. Duplicate rows across sheets are
+        found through a set of 128-bit row digests. remove_empty_columns is
+        ignored, because it cannot be decided one sheet at a time.
+        Parquet/Feather column types are inferred from the first
+        SCHEMA_SAMPLE_ROWS rows of every sheet; a column that a later row
+        does not fit is widened to text, rewriting the output so far.
+
+        Args:
+            input_file: Excel file, or folder of workbooks.
+            output_file: Path to output file.
+
+        Returns:
+            Dictionary with processing statistics.
+
+        Raises:
+            ValueError: If the merge strategy cannot be streamed or a sheet
+                fails to load.
+            FileNotFoundError: If a workbook doesn't exist or is invalid.
+        """
+        merge_config = self.config.get("merging", {})
+        strategy = merge_config.get("strategy", "concat")
+        if strategy not in STREAMING_STRATEGIES:
+            raise ValueError(
+                f"Streaming merge does not support strategy: {strategy} "
+                f"(use one of {', '.join(sorted(STREAMING_STRATEGIES))})"
+            )
+
+        clean_config = self.config.get("cleaning", {})
+        cleaning = clean_config.get("enabled", True)
+        if cleaning and clean_config.get("remove_empty_columns", False):
+            logger.warning("remove_empty_columns is ignored in streaming mode")
+
+        output_format = self._output_format(output_file)
+        sample_rows = SCHEMA_SAMPLE_ROWS if output_format != "csv" else 0
+        sheet_names = self.config.get("sheets", {}).get("names")
+        sources = self._sheet_sources(input_file, sheet_names, sample_rows)
+        samples = [header for _, _, _, header in sources if header is not None]
+        columns = self._streaming_columns(
+            strategy, [list(sample.columns) for sample in samples]
+        )
+        logger.info(
+            f"Streaming {len(sources)} sheet(s) into {len(columns)} column(s) "
+            f"using strategy: {strategy}"
+        )
+
+        output_path = Path(output_file)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        csv_config = self.config.get("csv_export", {})
+        writer: Optional[ColumnarWriter] = None
+        seen: Set[int] = set()
+        header_written = False
+        written = 0
+
+        try:
+            for prefix, result in self._stream_sheets(sources):
+                for label, df in self._collect_sheets(prefix, result).items():
+                    self.stats["sheets_processed"] += 1
+                    self.stats["total_rows"] += len(df)
+
+                    errors = self._validate_dataframe(df, label)
+                    self.validation_errors.extend(errors)
+                    if errors:
+                        logger.warning(
+                            f"Validation errors in sheet '{label}': {len(errors)}"
+                        )
+
+                    df = df.reindex(columns=columns)
+                    self.stats["merged_rows"] += len(df)
+                    if cleaning and clean_config.get("remove_empty_rows", False):
+                        df = df.dropna(how="all")
+                    if cleaning and clean_config.get("remove_duplicates", False):
+                        digests = self._row_digests(df)
+                        keep = []
+                        for digest in digests:
+                            keep.append(digest not in seen)
+                            seen.add(digest)
+                        df = df[keep]
+
+                    if output_format == "csv":
+                        df.to_csv(
+                            output_path,
+                            mode="a" if header_written else "w",
+                            header=not header_written,
+                            index=csv_config.get("include_index", False),
+                            encoding=csv_config.get("encoding", "utf-8"),
+                            sep=csv_config.get("separator", ","),
+                            na_rep=csv_config.get("na_representation", ""),
+                        )
+                        header_written = True
+                    else:
+                        if writer is None:
+                            writer = ColumnarWriter(
+                                output_path,
+                                output_format,
+                                self._streaming_schema(columns, samples),
+                                self.config.get("output", {}).get("compression"),
+                            )
+                        typed, failed = self._cast_to_schema(df, writer.schema)
+                        if failed:
+                            logger.warning(
+                                f"Column(s) {failed} in sheet '{label}' do not fit "
+                                "the inferred types; storing them as text"
+                            )
+                            writer.widen(failed)
+                        writer.write(typed)
+
+                    written += len(df)
+                    logger.debug(f"Appended {len(df)} row(s) from sheet '{label}'")
+        finally:
+            if writer is not None:
+                writer.close()
+
+        self.stats["validation_errors"] = len(self.validation_errors)
+        logger.info(
+            f"Streamed {self.stats['merged_rows']} merged rows "
+            f"({written} after cleaning) to: {output_path}"
+        )
+        logger.info(f"Statistics: {self.stats}")
+
+        return self.stats
+
     def process(self) -> Dict[str, Any]:
         """Process Excel file: load sheets, merge, validate, and prepare for export.
 
+        With merging.streaming enabled, sheets are merged straight into the
+        output file instead (see merge_streaming) and merged_df stays None.
+
         Returns:
             Dictionary with processing statistics.
 
@@ -479,9 +1409,21 @@ class ExcelSheetMerger:
 
         logger.info("Starting Excel sheet processing")
 
-        # Load sheets
+        if self.config.get("merging", {}).get("streaming", False):
+            output_file = self.config["files"].get("output_file")
+            if not output_file:
+                raise ValueError("Output file must be specified for streaming merge")
+            return self.merge_streaming(input_file, output_file)
+
+        # Load sheets (every workbook in the folder if input is a directory)
         sheet_names = self.config.get("sheets", {}).get("names")
-        self.load_excel_sheets(input_file, sheet_names)
+        if Path(input_file).is_dir():
+            workbooks = self.find_workbooks(input_file)
+            if not workbooks:
+                raise ValueError(f"No Excel files found in: {input_file}")
+            self.load_workbooks([str(path) for path in workbooks], sheet_names)
+        else:
+            self.load_excel_sheets(input_file, sheet_names)
 
         # Validate each sheet
         for sheet_name, df in self.sheet_data.items():
@@ -540,13 +1482,133 @@ class ExcelSheetMerger:
             logger.error(error_msg, exc_info=True)
             raise
 
+    def _output_format(self, file_path: str) -> str:
+        """Resolve output.format, inferring it from the extension on "auto".
+
+        Args:
+            file_path: Path to output file.
+
+        Returns:
+            "csv", "parquet" or "feather".
+
+        Raises:
+            ValueError: If the configured output format is unknown.
+            ImportError: If a columnar format is requested without pyarrow.
+        """
+        output_format = self.config.get("output", {}).get("format", "auto")
+        if output_format == "auto":
+            output_format = OUTPUT_FORMATS.get(Path(file_path).suffix.lower(), "csv")
+        if output_format not in ("csv", "parquet", "feather"):
+            raise ValueError(f"Unknown output format: {output_format}")
+        if output_format != "csv" and not HAS_PYARROW:
+            raise ImportError(f"pyarrow is required for {output_format} output")
+        return output_format
+
+    def _arrow_compatible(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Make mixed-type columns storable in Arrow.
+
+        Excel columns often mix numbers and text, which Arrow cannot store
+        in one typed column. Such columns are written as text; all other
+        columns keep their dtype.
+
+        Args:
+            df: DataFrame to export.
+
+        Returns:
+            DataFrame whose columns all convert to Arrow.
+        """
+        converted = None
+        for col in df.columns:
+            if not pd.api.types.is_object_dtype(df[col]):
+                continue
+            try:
+                pa.array(df[col], from_pandas=True)
+            except (pa.ArrowInvalid, pa.ArrowTypeError):
+                if converted is None:
+                    converted = df.copy()
+                values = df[col]
+                converted[col] = values.astype(str).where(values.notna(), None)
+                logger.warning(f"Column '{col}' has mixed types; exporting as text")
+        return df if converted is None else converted
+
+    def export_to_columnar(self, file_path: str, file_format: str = "parquet") -> None:
+        """Export merged DataFrame to a Parquet or Feather file.
+
+        Column dtypes are kept, and rows are written in slices of
+        output.row_group_size (one Parquet row group or Arrow record batch
+        each), so consumers can load or memory-map the file without parsing.
+
+        Args:
+            file_path: Path to output file.
+            file_format: "parquet" or "feather".
+
+        Raises:
+            ValueError: If no merged data is available.
+            ImportError: If pyarrow is not installed.
+            PermissionError: If output directory is not writable.
+        """
+        if self.merged_df is None:
+            raise ValueError("No merged data available. Call process() first.")
+        if not HAS_PYARROW:
+            raise ImportError(f"pyarrow is required for {file_format} output")
+
+        output_path = Path(file_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+
+        output_config = self.config.get("output", {})
+        row_group_size = max(1, int(output_config.get("row_group_size", 100000)))
+        # Column names must be strings in Arrow (Excel headers may be numbers)
+        df = self._arrow_compatible(self.merged_df).rename(columns=str)
+
+        try:
+            writer = ColumnarWriter(
+                output_path,
+                file_format,
+                pa.Schema.from_pandas(df, preserve_index=False),
+                output_config.get("compression"),
+            )
+            try:
+                for start in range(0, len(df), row_group_size):
+                    writer.write(df.iloc[start : start + row_group_size])
+            finally:
+                writer.close()
+            logger.info(
+                f"Exported {len(df)} rows to {file_format}: {output_path}"
+            )
+        except PermissionError:
+            error_msg = f"Permission denied writing to: {output_path}"
+            logger.error(error_msg)
+            raise PermissionError(error_msg)
+        except Exception as e:
+            error_msg = f"Error exporting to {file_format}: {e}"
+            logger.error(error_msg, exc_info=True)
+            raise
+
+    def export(self, file_path: str) -> None:
+        """Export merged DataFrame in the configured output format.
+
+        Args:
+            file_path: Path to output file.
+
+        Raises:
+            ValueError: If no merged data is available or the output format
+                is unknown.
+            ImportError: If a columnar format is requested without pyarrow.
+        """
+        output_format = self._output_format(file_path)
+        if output_format == "csv":
+            self.export_to_csv(file_path)
+        else:
+            self.export_to_columnar(file_path, output_format)
+
 
 def main() -> int:
     """Main entry point for Excel sheet merger."""
     import argparse
 
     parser = argparse.ArgumentParser(
-        description="Process Excel files: merge multiple sheets and export to CSV"
+        description="Process Excel files: merge multiple sheets and export to "
+        "CSV, Parquet or Feather"
     )
     parser.add_argument(
         "-c",
@@ -557,12 +1619,41 @@ def main() -> int:
     parser.add_argument(
         "-i",
         "--input",
-        help="Input Excel file path (overrides config)",
+        help="Input Excel file or folder of workbooks (overrides config)",
     )
     parser.add_argument(
         "-o",
         "--output",
-        help="Output CSV file path (overrides config)",
+        help="Output file path (overrides config)",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        help="Worker processes for reading sheets, 0 for all cores "
+        "(overrides config)",
+    )
+    parser.add_argument(
+        "--streaming",
+        action="store_true",
+        help="Merge sheets straight into the output file one at a time "
+        "(concat, union and intersection strategies)",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        help="Cache parsed sheets in this directory, relative to each "
+        "workbook unless absolute (overrides config)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Do not read or write the sidecar sheet cache",
+    )
+    parser.add_argument(
+        "--format",
+        choices=["auto", "csv", "parquet", "feather"],
+        help="Output format; auto picks it from the output file extension "
+        "(overrides config)",
     )
 
     args = parser.parse_args()
@@ -574,15 +1665,26 @@ def main() -> int:
             merger.config["files"]["input_file"] = args.input
         if args.output:
             merger.config["files"]["output_file"] = args.output
+        if args.format:
+            merger.config.setdefault("output", {})["format"] = args.format
+        if args.jobs is not None:
+            merger.config.setdefault("reading", {})["jobs"] = args.jobs
+        if args.cache_dir:
+            merger.config.setdefault("reading", {})["cache_dir"] = args.cache_dir
+        if args.no_cache:
+            merger.config.setdefault("reading", {})["cache_dir"] = None
+        if args.streaming:
+            merger.config.setdefault("merging", {})["streaming"] = True
 
         stats = merger.process()
 
-        # Export to CSV
+        # Export in the configured format (streaming merges have already written it)
         output_file = merger.config["files"]["output_file"]
-        if output_file:
-            merger.export_to_csv(output_file)
-        else:
-            logger.warning("Output file not specified, skipping export")
+        if merger.merged_df is not None:
+            if output_file:
+                merger.export(output_file)
+            else:
+                logger.warning("Output file not specified, skipping export")
 
         # Print summary
         print("\n" + "=" * 50)
@@ -593,6 +1695,7 @@ def main() -> int:
         print(f"Merged rows: {stats['merged_rows']}")
         print(f"Validation errors: {stats['validation_errors']}")
         print(f"Sheets skipped: {stats['sheets_skipped']}")
+        print(f"Sheets from cache: {stats['sheets_cached']}")
 
         if merger.validation_errors:
             print("\nValidation Errors:")
@@ -600,7 +1703,7 @@ def main() -> int:
                 print(f"  - {error}")
 
         if output_file:
-            print(f"\nCSV exported to: {output_file}")
+            print(f"\nExported to: {output_file}")
 
         return 0
 
@@ -291,3 +291,217 @@ class TestExcelSheetMerger:
 
         with pytest.raises(ValueError):
             merger.process()
+
+    @pytest.mark.parametrize("extension", ["parquet", "feather"])
+    def test_export_columnar(
+        self, temp_config_file, sample_excel_file, tmp_path, extension
+    ):
+        """Test Parquet/Feather export keeps dtypes and handles mixed columns."""
+        pytest.importorskip("pyarrow")
+        merger = ExcelSheetMerger(config_path=temp_config_file)
+        merger.config["output"] = {"format": "auto", "row_group_size": 2}
+        merger.load_excel_sheets(sample_excel_file)
+        merger.merged_df = merger._merge_dataframes()
+        merger.merged_df["code"] = [1, "A", 2.5, None, "B", 3]
+
+        output_path = tmp_path / f"output.{extension}"
+        merger.export(str(output_path))
+
+        read = pd.read_parquet if extension == "parquet" else pd.read_feather
+        result = read(output_path)
+        assert len(result) == 6
+        assert pd.api.types.is_integer_dtype(result["id"])
+        assert result["code"].tolist()[:3] == ["1", "A", "2.5"]
+        assert pd.isna(result["code"][3])
+        assert merger.merged_df["code"].tolist()[1] == "A"
+
+    def test_output_format(self, temp_config_file):
+        """Test output format resolution from config and file extension."""
+        merger = ExcelSheetMerger(config_path=temp_config_file)
+
+        assert merger._output_format("out.csv") == "csv"
+        assert merger._output_format("out.xlsx") == "csv"
+
+        merger.config["output"] = {"format": "xml"}
+        with pytest.raises(ValueError):
+            merger._output_format("out.csv")
+
+        merger.config["output"] = {"format": "feather"}
+        with patch("src.main.HAS_PYARROW", False):
+            with pytest.raises(ImportError):
+                merger._output_format("out.csv")
+
+    def test_load_excel_sheets_opens_workbook_once(
+        self, temp_config_file, sample_excel_file
+    ):
+        """Test a sequential load parses the workbook a single time."""
+        merger = ExcelSheetMerger(config_path=temp_config_file)
+        with patch("src.main.pd.ExcelFile", wraps=pd.ExcelFile) as excel_file:
+            sheets = merger.load_excel_sheets(sample_excel_file)
+        assert excel_file.call_count == 1
+        assert list(sheets) == ["Sheet1", "Sheet2"]
+
+    def test_load_excel_sheets_uses_cache(
+        self, temp_config_file, sample_excel_file, tmp_path
+    ):
+        """Test parsed sheets are cached and invalidated when the file changes."""
+        uncached = ExcelSheetMerger(config_path=temp_config_file)
+        uncached.load_excel_sheets(sample_excel_file)
+        assert not (tmp_path / ".sheet_cache").exists()
+
+        merger = ExcelSheetMerger(config_path=temp_config_file)
+        merger.config["reading"]["cache_dir"] = ".sheet_cache"
+        merger.load_excel_sheets(sample_excel_file)
+        assert merger.stats["sheets_cached"] == 0
+        assert (tmp_path / ".sheet_cache").is_dir()
+
+        cached = ExcelSheetMerger(config_path=temp_config_file)
+        cached.config["reading"]["cache_dir"] = ".sheet_cache"
+        with patch("src.main.pd.read_excel") as read_excel:
+            sheets = cached.load_excel_sheets(sample_excel_file)
+        read_excel.assert_not_called()
+        assert cached.stats["sheets_cached"] == 2
+        pd.testing.assert_frame_equal(sheets["Sheet1"], merger.sheet_data["Sheet1"])
+
+        with pd.ExcelWriter(sample_excel_file, engine="openpyxl") as writer:
+            pd.DataFrame({"id": [9]}).to_excel(writer, sheet_name="Sheet1", index=False)
+        changed = ExcelSheetMerger(config_path=temp_config_file)
+        changed.config["reading"]["cache_dir"] = ".sheet_cache"
+        sheets = changed.load_excel_sheets(sample_excel_file)
+        assert changed.stats["sheets_cached"] == 0
+        assert list(sheets) == ["Sheet1"]
+        assert sheets["Sheet1"]["id"].tolist() == [9]
+
+    def test_process_workbook_folder_in_parallel(
+        self, temp_config_file, sample_excel_file, tmp_path
+    ):
+        """Test merging every workbook in a folder with a process pool."""
+        folder = tmp_path / "books"
+        folder.mkdir()
+        for name in ("a.xlsx", "b.xlsx"):
+            (folder / name).write_bytes(Path(sample_excel_file).read_bytes())
+        (folder / "~$a.xlsx").write_text("lock file")
+
+        merger = ExcelSheetMerger(config_path=temp_config_file)
+        merger.config["files"]["input_file"] = str(folder)
+        merger.config["reading"]["jobs"] = 2
+        stats = merger.process()
+
+        assert list(merger.sheet_data) == [
+            "a.xlsx:Sheet1",
+            "a.xlsx:Sheet2",
+            "b.xlsx:Sheet1",
+            "b.xlsx:Sheet2",
+        ]
+        assert stats["total_rows"] == 12
+        assert merger.merged_df["source_sheet"].iloc[-1] == "b.xlsx:Sheet2"
+
+    @pytest.mark.parametrize("add_sheet_column", [True, False])
+    @pytest.mark.parametrize("strategy", ["concat", "union", "intersection"])
+    def test_merge_streaming_matches_in_memory(
+        self, temp_config_file, tmp_path, strategy, add_sheet_column
+    ):
+        """Test streaming merge writes the same rows as the in-memory merge."""
+        excel_path = tmp_path / "mixed.xlsx"
+        with pd.ExcelWriter(excel_path, engine="openpyxl") as writer:
+            pd.DataFrame({"id": [1, 2, 2], "name": ["A", "B", "B"]}).to_excel(
+                writer, sheet_name="Sheet1", index=False
+            )
+            pd.DataFrame({"id": [2, 3], "name": ["B", "C"], "x": [1, 2]}).to_excel(
+                writer, sheet_name="Sheet2", index=False
+            )
+            # A blank makes this sheet's ids floats; 1.0 duplicates Sheet1's 1
+            pd.DataFrame({"id": [1, None], "name": ["A", "D"]}).to_excel(
+                writer, sheet_name="Sheet3", index=False
+            )
+
+        outputs = []
+        for streaming in (False, True):
+            merger = ExcelSheetMerger(config_path=temp_config_file)
+            merger.config["files"]["input_file"] = str(excel_path)
+            merger.config["files"]["output_file"] = str(tmp_path / f"{streaming}.csv")
+            merger.config["merging"].update(strategy=strategy, streaming=streaming)
+            merger.config["merging"]["add_sheet_column"] = add_sheet_column
+            merger.config["cleaning"]["remove_duplicates"] = True
+            stats = merger.process()
+            if not streaming:
+                merger.export(merger.config["files"]["output_file"])
+            outputs.append(pd.read_csv(merger.config["files"]["output_file"]))
+
+        assert merger.merged_df is None
+        assert stats["merged_rows"] == 7
+        expected, result = outputs
+        pd.testing.assert_frame_equal(result, expected[list(result.columns)])
+        assert (result["name"] == "A").sum() == (2 if add_sheet_column else 1)
+
+    def test_merge_streaming_opens_each_workbook_once_per_pass(
+        self, temp_config_file, sample_excel_file, tmp_path
+    ):
+        """Test streaming reads headers and rows through one open workbook."""
+        merger = ExcelSheetMerger(config_path=temp_config_file)
+        with patch("src.main.pd.ExcelFile", wraps=pd.ExcelFile) as excel_file:
+            stats = merger.merge_streaming(
+                sample_excel_file, str(tmp_path / "output.csv")
+            )
+        assert excel_file.call_count == 2
+        assert stats["sheets_processed"] == 2
+
+    def test_merge_streaming_folder_in_parallel(
+        self, temp_config_file, sample_excel_file, tmp_path
+    ):
+        """Test streaming a folder with worker processes keeps sheet order."""
+        folder = tmp_path / "books"
+        folder.mkdir()
+        for name in ("a.xlsx", "b.xlsx", "c.xlsx"):
+            (folder / name).write_bytes(Path(sample_excel_file).read_bytes())
+
+        outputs = []
+        for jobs in (1, 2):
+            merger = ExcelSheetMerger(config_path=temp_config_file)
+            merger.config["reading"]["jobs"] = jobs
+            output_path = tmp_path / f"output_{jobs}.csv"
+            merger.merge_streaming(str(folder), str(output_path))
+            outputs.append(pd.read_csv(output_path))
+
+        assert list(dict.fromkeys(outputs[1]["source_sheet"])) == [
+            f"{book}:{sheet}"
+            for book in ("a.xlsx", "b.xlsx", "c.xlsx")
+            for sheet in ("Sheet1", "Sheet2")
+        ]
+        pd.testing.assert_frame_equal(outputs[0], outputs[1])
+
+    def test_merge_streaming_rejects_join(self, temp_config_file, sample_excel_file):
+        """Test streaming merge refuses the join strategy."""
+        merger = ExcelSheetMerger(config_path=temp_config_file)
+        merger.config["merging"].update(strategy="join", join={"keys": ["id"]})
+
+        with pytest.raises(ValueError):
+            merger.merge_streaming(sample_excel_file, "output.csv")
+
+    @pytest.mark.parametrize("extension", ["parquet", "feather"])
+    def test_merge_streaming_columnar_types(
+        self, temp_config_file, tmp_path, extension
+    ):
+        """Test streaming columnar output infers types and widens failed casts."""
+        pytest.importorskip("pyarrow")
+        excel_path = tmp_path / "typed.xlsx"
+        with pd.ExcelWriter(excel_path, engine="openpyxl") as writer:
+            pd.DataFrame({"id": [1, 2], "score": [1, 2], "code": [7, 9]}).to_excel(
+                writer, sheet_name="Sheet1", index=False
+            )
+            pd.DataFrame({"id": [3, 4], "score": [2.5, 3], "code": [8, "B"]}).to_excel(
+                writer, sheet_name="Sheet2", index=False
+            )
+
+        merger = ExcelSheetMerger(config_path=temp_config_file)
+        output_path = tmp_path / f"merged.{extension}"
+        with patch("src.main.SCHEMA_SAMPLE_ROWS", 1):
+            merger.merge_streaming(str(excel_path), str(output_path))
+
+        read = pd.read_parquet if extension == "parquet" else pd.read_feather
+        result = read(output_path)
+        assert result["id"].tolist() == [1, 2, 3, 4]
+        assert result["score"].tolist() == [1.0, 2.0, 2.5, 3.0]
+        assert result["code"].tolist() == ["7", "9", "8", "B"]
+        assert result["source_sheet"].tolist()[1:3] == ["Sheet1", "Sheet2"]
+        assert list(tmp_path.glob("*.widen")) == []
@@ -12,10 +12,12 @@ import logging
 import logging.handlers
 import os
 import re
+import sqlite3
 import sys
+from collections import defaultdict
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 
 import yaml
 from dotenv import load_dotenv
@@ -25,6 +27,9 @@ load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+# Key marking index-level (non-file) lines in JSON Lines indexes
+JSONL_META_KEY = "_index"
+
 
 class FileIndexer:
     """Generates searchable file index with metadata."""
@@ -38,6 +43,10 @@ class FileIndexer:
         self.config = config
         self.options = config.get("options", {})
         self.metadata_config = config.get("metadata", {})
+        self.storage = config.get("storage", "json").lower()
+        self.search_fields = config.get("search", {}).get(
+            "search_fields", ["name", "path"]
+        )
         self.exclude_patterns = [
             re.compile(pattern) for pattern in config.get("exclude_patterns", [])
         ]
@@ -45,6 +54,15 @@ class FileIndexer:
             re.compile(pattern) for pattern in config.get("exclude_directories", [])
         ]
 
+        self.stats = {
+            "files_added": 0,
+            "files_removed": 0,
+            "files_updated": 0,
+            "files_unchanged": 0,
+            "directories_scanned": 0,
+            "directories_skipped": 0,
+        }
+
     def should_exclude_file(self, file_path: Path) -> bool:
         """Check if file should be excluded from indexing.
 
@@ -146,7 +164,9 @@ class FileIndexer:
 
             # Full path
             if self.metadata_config.get("full_path", True):
-                metadata["full_path"] = str(file_path.resolve())
+                # Not resolved, so symlinked files keep their location in the tree
+                # and incremental updates can match them by walked path
+                metadata["full_path"] = str(file_path.absolute())
 
             # Relative path
             if self.metadata_config.get("relative_path", False) and base_path:
@@ -218,7 +238,11 @@ class FileIndexer:
             return {}
 
     def index_directory(
-        self, directory: Path, recursive: bool = True, base_path: Optional[Path] = None
+        self,
+        directory: Path,
+        recursive: bool = True,
+        base_path: Optional[Path] = None,
+        directory_mtimes: Optional[Dict[str, int]] = None,
     ) -> List[Dict]:
         """Index all files in a directory.
 
@@ -226,43 +250,102 @@ class FileIndexer:
             directory: Directory to index.
             recursive: Whether to index recursively.
             base_path: Base path for relative paths.
+            directory_mtimes: If given, filled with the mtime (ns) of every
+                directory walked, for later incremental updates.
 
         Returns:
             List of file metadata dictionaries.
         """
+        return list(
+            self.iter_directory(directory, recursive, base_path, directory_mtimes)
+        )
+
+    def iter_directory(
+        self,
+        directory: Path,
+        recursive: bool = True,
+        base_path: Optional[Path] = None,
+        directory_mtimes: Optional[Dict[str, int]] = None,
+    ) -> Iterator[Dict]:
+        """Yield metadata for each file in a directory as it is walked.
+
+        Args:
+            directory: Directory to index.
+            recursive: Whether to index recursively.
+            base_path: Base path for relative paths.
+            directory_mtimes: If given, filled with the mtime (ns) of every
+                directory walked, for later incremental updates.
+
+        Yields:
+            File metadata dictionaries.
+        """
         directory = directory.resolve()
 
         if not directory.exists() or not directory.is_dir():
             logger.warning(f"Directory does not exist: {directory}")
-            return []
+            return
 
         if self.should_exclude_directory(directory):
             logger.debug(f"Excluding directory: {directory}")
-            return []
+            return
 
         if base_path is None:
             base_path = directory
 
-        files_indexed = []
+        stack = [directory]
 
-        # Find all files
-        if recursive:
-            file_paths = directory.rglob("*")
-        else:
-            file_paths = directory.glob("*")
-
-        for file_path in file_paths:
-            if not file_path.is_file():
+        while stack:
+            current = stack.pop()
+            try:
+                # Stat before listing so a concurrent change is never missed
+                mtime_ns = os.stat(current).st_mtime_ns
+                file_paths, subdirectories = self._list_directory(current)
+            except OSError as e:
+                logger.warning(f"Cannot scan directory {current}: {e}")
                 continue
 
-            if self.should_exclude_file(file_path):
-                continue
+            if directory_mtimes is not None:
+                directory_mtimes[str(current)] = mtime_ns
 
-            metadata = self.get_file_metadata(file_path, base_path)
-            if metadata:
-                files_indexed.append(metadata)
+            for file_path in file_paths:
+                if self.should_exclude_file(file_path):
+                    continue
+
+                metadata = self.get_file_metadata(file_path, base_path)
+                if metadata:
+                    yield metadata
 
-        return files_indexed
+            if recursive:
+                stack.extend(reversed(subdirectories))
+
+    def _list_directory(self, directory: Path) -> Tuple[List[Path], List[Path]]:
+        """List the files and non-excluded subdirectories directly inside a directory.
+
+        Args:
+            directory: Directory to list.
+
+        Returns:
+            Tuple of (sorted file paths, sorted subdirectory paths).
+
+        Raises:
+            OSError: If the directory cannot be listed.
+        """
+        file_paths = []
+        subdirectories = []
+
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirectory = Path(entry.path)
+                        if not self.should_exclude_directory(subdirectory):
+                            subdirectories.append(subdirectory)
+                    elif entry.is_file():
+                        file_paths.append(Path(entry.path))
+                except OSError:
+                    continue
+
+        return sorted(file_paths), sorted(subdirectories)
 
     def create_index(
         self, directories: List[Path], recursive: bool = True
@@ -277,6 +360,7 @@ class FileIndexer:
             Dictionary with index data.
         """
         all_files = []
+        directory_mtimes: Dict[str, int] = {}
 
         for directory in directories:
             directory = directory.resolve()
@@ -286,7 +370,9 @@ class FileIndexer:
                 continue
 
             logger.info(f"Indexing directory: {directory}")
-            files = self.index_directory(directory, recursive, directory)
+            files = self.index_directory(
+                directory, recursive, directory, directory_mtimes
+            )
             all_files.extend(files)
             logger.info(f"Indexed {len(files)} files from {directory}")
 
@@ -295,13 +381,223 @@ class FileIndexer:
             "total_files": len(all_files),
             "directories_indexed": [str(d.resolve()) for d in directories],
             "recursive": recursive,
+            "directories": directory_mtimes,
             "files": all_files,
         }
 
         return index
 
+    def write_index_stream(
+        self, directories: List[Path], recursive: bool, output_path: Path
+    ) -> Dict:
+        """Index directories straight to a JSON Lines file.
+
+        Records are written as they are produced, so memory use does not
+        grow with the number of files. See save_index for the file layout.
+
+        Args:
+            directories: List of directories to index.
+            recursive: Whether to index recursively.
+            output_path: Path of the JSON Lines index.
+
+        Returns:
+            Index dictionary without the "files" list.
+        """
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = output_path.with_name(output_path.name + ".tmp")
+
+        header = {
+            "created_at": datetime.now().isoformat(),
+            "directories_indexed": [str(d.resolve()) for d in directories],
+            "recursive": recursive,
+        }
+        directory_mtimes: Dict[str, int] = {}
+        total_files = 0
+
+        try:
+            with open(temp_path, "w", encoding="utf-8") as f:
+                f.write(json.dumps({JSONL_META_KEY: header}, ensure_ascii=False) + "\n")
+
+                for directory in directories:
+                    directory = directory.resolve()
+
+                    if not directory.exists():
+                        logger.warning(f"Directory does not exist: {directory}")
+                        continue
+
+                    logger.info(f"Indexing directory: {directory}")
+                    directory_files = 0
+                    for metadata in self.iter_directory(
+                        directory, recursive, directory, directory_mtimes
+                    ):
+                        f.write(json.dumps(metadata, ensure_ascii=False) + "\n")
+                        directory_files += 1
+                    total_files += directory_files
+                    logger.info(f"Indexed {directory_files} files from {directory}")
+
+                trailer = {"total_files": total_files, "directories": directory_mtimes}
+                f.write(json.dumps({JSONL_META_KEY: trailer}, ensure_ascii=False) + "\n")
+
+            os.replace(temp_path, output_path)
+        except IOError as e:
+            logger.error(f"Error saving index: {e}")
+            raise
+
+        delta_path = get_delta_path(output_path)
+        if delta_path.exists():
+            delta_path.unlink()
+
+        logger.info(f"Index saved to {output_path}")
+        return {**header, **trailer}
+
+    def update_index(self, index: Dict) -> Dict:
+        """Compute the changes to an existing index since it was written.
+
+        Directories whose mtime is unchanged are not listed again; their
+        previously indexed files are only stat'ed. Metadata (and hashes) are
+        recomputed only for files whose size or mtime changed.
+
+        Args:
+            index: Previously created index (see create_index).
+
+        Returns:
+            Delta dictionary with added, updated and removed files and
+            changed directory mtimes, suitable for apply_index_delta.
+
+        Raises:
+            ValueError: If the index does not record full paths.
+        """
+        if not self.metadata_config.get("full_path", True):
+            raise ValueError("Incremental update requires metadata.full_path")
+
+        recursive = index.get("recursive", True)
+        previous_files = {f["full_path"]: f for f in index.get("files", [])}
+        previous_directories = index.get("directories", {})
+
+        files_by_directory: Dict[str, List[str]] = defaultdict(list)
+        for full_path in previous_files:
+            files_by_directory[str(Path(full_path).parent)].append(full_path)
+
+        subdirectories_by_directory: Dict[str, List[str]] = defaultdict(list)
+        for dir_path in previous_directories:
+            subdirectories_by_directory[str(Path(dir_path).parent)].append(dir_path)
+
+        delta: Dict = {
+            "added": [],
+            "updated": [],
+            "removed": [],
+            "directories": {},
+            "removed_directories": [],
+        }
+        seen_files = set()
+        seen_directories = set()
+
+        for root in index.get("directories_indexed", []):
+            root_path = Path(root)
+
+            if not root_path.is_dir():
+                logger.warning(f"Directory does not exist: {root_path}")
+                continue
+
+            logger.info(f"Updating index for directory: {root_path}")
+            stack = [root_path]
+
+            while stack:
+                current = stack.pop()
+                key = str(current)
+
+                try:
+                    mtime_ns = os.stat(current).st_mtime_ns
+                except OSError as e:
+                    logger.warning(f"Cannot access directory {current}: {e}")
+                    continue
+
+                seen_directories.add(key)
+
+                if previous_directories.get(key) == mtime_ns:
+                    # No entries were added, removed or renamed here
+                    self.stats["directories_skipped"] += 1
+                    file_paths = [Path(p) for p in files_by_directory.get(key, [])]
+                    subdirectories = [
+                        Path(p) for p in subdirectories_by_directory.get(key, [])
+                    ]
+                else:
+                    try:
+                        file_paths, subdirectories = self._list_directory(current)
+                    except OSError as e:
+                        logger.warning(f"Cannot scan directory {current}: {e}")
+                        continue
+                    self.stats["directories_scanned"] += 1
+                    delta["directories"][key] = mtime_ns
+
+                for file_path in file_paths:
+                    full_path = str(file_path)
+                    previous = previous_files.get(full_path)
+
+                    if previous is not None and self._is_unchanged(file_path, previous):
+                        seen_files.add(full_path)
+                        self.stats["files_unchanged"] += 1
+                        continue
+
+                    if self.should_exclude_file(file_path):
+                        continue
+
+                    metadata = self.get_file_metadata(file_path, root_path)
+                    if not metadata:
+                        continue
+
+                    seen_files.add(full_path)
+                    if previous is None:
+                        delta["added"].append(metadata)
+                    else:
+                        delta["updated"].append(metadata)
+
+                if recursive:
+                    stack.extend(subdirectories)
+
+        delta["removed"] = [p for p in previous_files if p not in seen_files]
+        delta["removed_directories"] = [
+            d for d in previous_directories if d not in seen_directories
+        ]
+
+        self.stats["files_added"] = len(delta["added"])
+        self.stats["files_updated"] = len(delta["updated"])
+        self.stats["files_removed"] = len(delta["removed"])
+
+        logger.info(
+            f"Index update: {self.stats['files_added']} added, "
+            f"{self.stats['files_updated']} updated, "
+            f"{self.stats['files_removed']} removed"
+        )
+
+        return delta
+
+    def _is_unchanged(self, file_path: Path, previous: Dict) -> bool:
+        """Check whether a file's size and mtime match its index entry.
+
+        Args:
+            file_path: Path to file.
+            previous: Previous metadata dictionary for the file.
+
+        Returns:
+            True if the file is unchanged, False if changed or missing.
+        """
+        try:
+            file_stat = file_path.stat()
+        except (OSError, IOError):
+            return False
+
+        return (
+            previous.get("size") == file_stat.st_size
+            and previous.get("modified_timestamp") == file_stat.st_mtime
+        )
+
     def save_index(self, index: Dict, output_path: Path) -> None:
-        """Save index to JSON file.
+        """Save index to a JSON, JSON Lines or SQLite file, per the storage setting.
+
+        JSON Lines indexes hold one file record per line. Index-level fields
+        are stored on lines of the form {"_index": {...}}: a header before the
+        records and, when written by write_index_stream, a trailer after them.
 
         Args:
             index: Index dictionary.
@@ -309,55 +605,175 @@ class FileIndexer:
         """
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
+        if self.storage == "sqlite":
+            store = SQLiteIndexStore(output_path)
+            try:
+                store.save(index)
+            finally:
+                store.close()
+            logger.info(f"Index saved to {output_path}")
+            return
+
         try:
             with open(output_path, "w", encoding="utf-8") as f:
-                json.dump(index, f, indent=2, ensure_ascii=False)
+                if self.storage == "jsonl":
+                    meta = {key: value for key, value in index.items() if key != "files"}
+                    f.write(json.dumps({JSONL_META_KEY: meta}, ensure_ascii=False) + "\n")
+                    for file_info in index.get("files", []):
+                        f.write(json.dumps(file_info, ensure_ascii=False) + "\n")
+                else:
+                    json.dump(index, f, indent=2, ensure_ascii=False)
+
+            # The full index supersedes any pending incremental deltas
+            delta_path = get_delta_path(output_path)
+            if delta_path.exists():
+                delta_path.unlink()
 
             logger.info(f"Index saved to {output_path}")
         except IOError as e:
             logger.error(f"Error saving index: {e}")
             raise
 
-    def search_index(self, index: Dict, query: str, case_sensitive: bool = False) -> List[Dict]:
+    def save_index_delta(self, delta: Dict, output_path: Path) -> None:
+        """Append an incremental delta to the index's delta journal.
+
+        Only the changes are written; load_index replays the journal on top
+        of the last full index.
+
+        Args:
+            delta: Delta dictionary from update_index.
+            output_path: Path of the index the delta applies to.
+        """
+        delta_path = get_delta_path(output_path)
+
+        try:
+            with open(delta_path, "a", encoding="utf-8") as f:
+                record = {"updated_at": datetime.now().isoformat(), **delta}
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+            logger.info(f"Index delta appended to {delta_path}")
+        except IOError as e:
+            logger.error(f"Error saving index delta: {e}")
+            raise
+
+    def search_index(
+        self,
+        index: Dict,
+        query: str,
+        case_sensitive: bool = False,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> List[Dict]:
         """Search the file index.
 
         Args:
             index: Index dictionary.
             query: Search query string.
-            flags: re flags for search.
+            case_sensitive: Whether matching is case-sensitive.
+            filters: Optional attribute filters (see matches_filters).
 
         Returns:
             List of matching file metadata dictionaries.
         """
-        if not query:
+        if not query and not filters:
             return []
 
-        search_config = self.config.get("search", {})
-        search_fields = search_config.get("search_fields", ["name", "path"])
+        return list(
+            self.search_records(index.get("files", []), query, case_sensitive, filters)
+        )
 
-        matches = []
-        query_lower = query if case_sensitive else query.lower()
+    def search_records(
+        self,
+        records: Iterable[Dict],
+        query: str,
+        case_sensitive: bool = False,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> Iterator[Dict]:
+        """Filter a stream of file records, e.g. from iter_index_records.
 
-        for file_info in index.get("files", []):
-            match_found = False
+        Args:
+            records: File metadata dictionaries.
+            query: Search query string.
+            case_sensitive: Whether matching is case-sensitive.
+            filters: Optional attribute filters (see matches_filters).
 
-            for field in search_fields:
-                field_value = file_info.get(field, "")
-                if not field_value:
-                    continue
+        Yields:
+            Matching file metadata dictionaries.
+        """
+        if not query and not filters:
+            return
+
+        for file_info in records:
+            if self.matches_query(file_info, query, case_sensitive) and matches_filters(
+                file_info, filters
+            ):
+                yield file_info
+
+    def search_database(
+        self,
+        database_path: Path,
+        query: str,
+        case_sensitive: bool = False,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> List[Dict]:
+        """Search a SQLite index without loading it into memory.
 
-                field_str = str(field_value)
-                if not case_sensitive:
-                    field_str = field_str.lower()
+        Args:
+            database_path: Path to SQLite index.
+            query: Search query string.
+            case_sensitive: Whether matching is case-sensitive.
+            filters: Optional attribute filters (see matches_filters).
+
+        Returns:
+            List of matching file metadata dictionaries.
+        """
+        if not query and not filters:
+            return []
+
+        store = SQLiteIndexStore(database_path, create=False)
+        try:
+            candidates = store.search(query, self.search_fields, filters)
+        finally:
+            store.close()
+
+        # The database narrows candidates; this check keeps results identical
+        # to the JSON backend (case-sensitivity, non-ASCII case folding)
+        return [
+            file_info
+            for file_info in candidates
+            if self.matches_query(file_info, query, case_sensitive)
+        ]
+
+    def matches_query(
+        self, file_info: Dict, query: str, case_sensitive: bool = False
+    ) -> bool:
+        """Check whether any search field contains the query.
+
+        Args:
+            file_info: File metadata dictionary.
+            query: Search query string (empty matches everything).
+            case_sensitive: Whether matching is case-sensitive.
+
+        Returns:
+            True if the file matches.
+        """
+        if not query:
+            return True
 
-                if query_lower in field_str:
-                    match_found = True
-                    break
+        query_cmp = query if case_sensitive else query.lower()
 
-            if match_found:
-                matches.append(file_info)
+        for field in self.search_fields:
+            field_value = file_info.get(field, "")
+            if not field_value:
+                continue
 
-        return matches
+            field_str = str(field_value)
+            if not case_sensitive:
+                field_str = field_str.lower()
+
+            if query_cmp in field_str:
+                return True
+
+        return False
 
     def _format_size(self, size_bytes: int) -> str:
         """Format file size in human-readable format.
@@ -375,6 +791,318 @@ class FileIndexer:
         return f"{size_bytes:.2f} PB"
 
 
+class SQLiteIndexStore:
+    """SQLite storage for file indexes.
+
+    Name and path are indexed with an FTS5 trigram table so substring
+    searches do not scan every row, and B-tree indexes cover extension,
+    size, modification time and hash filters.
+    """
+
+    # Searchable fields stored in their own columns; others are read from
+    # the metadata JSON
+    COLUMNS = ("name", "full_path", "file_type", "extension", "hash")
+    FTS_FIELDS = ("name", "full_path")
+
+    def __init__(self, database_path: Path, create: bool = True) -> None:
+        """Initialize SQLiteIndexStore.
+
+        Args:
+            database_path: Path to SQLite database file.
+            create: Create the database if it does not exist.
+
+        Raises:
+            FileNotFoundError: If create is False and the database is missing.
+        """
+        if not create and not database_path.exists():
+            raise FileNotFoundError(f"Index file not found: {database_path}")
+
+        self.database_path = database_path
+        self.conn = sqlite3.connect(str(database_path))
+        self._init_database()
+
+    def _init_database(self) -> None:
+        """Initialize database schema."""
+        cursor = self.conn.cursor()
+
+        cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS files (
+                id INTEGER PRIMARY KEY,
+                full_path TEXT NOT NULL UNIQUE,
+                name TEXT,
+                file_type TEXT,
+                extension TEXT,
+                size INTEGER,
+                modified_timestamp REAL,
+                hash TEXT,
+                metadata TEXT NOT NULL
+            )
+            """
+        )
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_files_extension ON files(extension)"
+        )
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_files_size ON files(size)")
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_files_modified ON files(modified_timestamp)"
+        )
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_files_hash ON files(hash)")
+
+        cursor.execute(
+            """
+            CREATE VIRTUAL TABLE IF NOT EXISTS files_fts USING fts5(
+                name, full_path, content='files', content_rowid='id',
+                tokenize='trigram'
+            )
+            """
+        )
+        cursor.execute(
+            """
+            CREATE TRIGGER IF NOT EXISTS files_ai AFTER INSERT ON files BEGIN
+                INSERT INTO files_fts(rowid, name, full_path)
+                VALUES (new.id, new.name, new.full_path);
+            END
+            """
+        )
+        cursor.execute(
+            """
+            CREATE TRIGGER IF NOT EXISTS files_ad AFTER DELETE ON files BEGIN
+                INSERT INTO files_fts(files_fts, rowid, name, full_path)
+                VALUES ('delete', old.id, old.name, old.full_path);
+            END
+            """
+        )
+
+        cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS index_meta (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL
+            )
+            """
+        )
+
+        self.conn.commit()
+
+    def save(self, index: Dict) -> None:
+        """Replace the stored index.
+
+        Args:
+            index: Index dictionary (see FileIndexer.create_index).
+        """
+        with self.conn:
+            self.conn.execute("DELETE FROM files")
+            self.conn.execute("DELETE FROM index_meta")
+            self._write_meta(
+                {key: value for key, value in index.items() if key != "files"}
+            )
+            self._insert_files(index.get("files", []))
+
+    def load(self) -> Dict:
+        """Load the complete index into a dictionary.
+
+        Returns:
+            Index dictionary.
+        """
+        index = {
+            key: json.loads(value)
+            for key, value in self.conn.execute("SELECT key, value FROM index_meta")
+        }
+        index["files"] = [
+            json.loads(row[0])
+            for row in self.conn.execute("SELECT metadata FROM files ORDER BY id")
+        ]
+        index["total_files"] = len(index["files"])
+        return index
+
+    def apply_delta(self, delta: Dict) -> None:
+        """Write only the changed rows of an incremental update.
+
+        Args:
+            delta: Delta dictionary from FileIndexer.update_index.
+        """
+        with self.conn:
+            changed = delta.get("updated", []) + delta.get("added", [])
+            self.conn.executemany(
+                "DELETE FROM files WHERE full_path = ?",
+                [(p,) for p in delta.get("removed", [])]
+                + [(f["full_path"],) for f in changed],
+            )
+            self._insert_files(changed)
+
+            meta = {
+                key: json.loads(value)
+                for key, value in self.conn.execute(
+                    "SELECT key, value FROM index_meta WHERE key = 'directories'"
+                )
+            }
+            directories = meta.get("directories", {})
+            for dir_path in delta.get("removed_directories", []):
+                directories.pop(dir_path, None)
+            directories.update(delta.get("directories", {}))
+
+            total_files = self.conn.execute("SELECT COUNT(*) FROM files").fetchone()[0]
+            updates: Dict[str, Any] = {
+                "directories": directories,
+                "total_files": total_files,
+            }
+            if "updated_at" in delta:
+                updates["updated_at"] = delta["updated_at"]
+            self._write_meta(updates)
+
+    def search(
+        self,
+        query: str,
+        search_fields: List[str],
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> List[Dict]:
+        """Find candidate files whose search fields may contain the query.
+
+        Matching is case-insensitive; callers apply exact matching rules.
+
+        Args:
+            query: Search query string (empty matches everything).
+            search_fields: Metadata fields to search.
+            filters: Optional attribute filters (see matches_filters).
+
+        Returns:
+            List of file metadata dictionaries, in index order.
+        """
+        conditions = []
+        params: List[Any] = []
+
+        if query:
+            escaped = (
+                query.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+            )
+            like = f"%{escaped}%"
+            query_conditions = []
+
+            fts_fields = [f for f in search_fields if f in self.FTS_FIELDS]
+            if fts_fields and len(query) >= 3:
+                phrase = '"' + query.replace('"', '""') + '"'
+                query_conditions.append(
+                    "id IN (SELECT rowid FROM files_fts WHERE files_fts MATCH ?)"
+                )
+                params.append("{" + " ".join(fts_fields) + "} : " + phrase)
+            else:
+                # Trigram lookups need at least three characters
+                fts_fields = []
+
+            for field in search_fields:
+                if field in fts_fields:
+                    continue
+                if field in self.COLUMNS:
+                    column = field
+                else:
+                    column = "json_extract(metadata, ?)"
+                    params.append(f'$."{field}"')
+                query_conditions.append(f"{column} LIKE ? ESCAPE '\\'")
+                params.append(like)
+
+            if not query_conditions:
+                return []
+            conditions.append("(" + " OR ".join(query_conditions) + ")")
+
+        filters = filters or {}
+        if filters.get("extension") is not None:
+            conditions.append("extension = ?")
+            params.append(filters["extension"].lower().lstrip("."))
+        if filters.get("min_size") is not None:
+            conditions.append("size >= ?")
+            params.append(filters["min_size"])
+        if filters.get("max_size") is not None:
+            conditions.append("size <= ?")
+            params.append(filters["max_size"])
+        if filters.get("modified_after") is not None:
+            conditions.append("modified_timestamp >= ?")
+            params.append(filters["modified_after"])
+        if filters.get("hash") is not None:
+            conditions.append("hash = ?")
+            params.append(filters["hash"].lower())
+
+        sql = "SELECT metadata FROM files"
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        sql += " ORDER BY id"
+
+        return [json.loads(row[0]) for row in self.conn.execute(sql, params)]
+
+    def _insert_files(self, files: List[Dict]) -> None:
+        """Insert file metadata rows."""
+        rows = []
+        for file_info in files:
+            if "full_path" not in file_info:
+                raise ValueError("SQLite storage requires metadata.full_path")
+            rows.append(
+                (
+                    file_info["full_path"],
+                    file_info.get("name"),
+                    file_info.get("file_type"),
+                    file_info.get("extension"),
+                    file_info.get("size"),
+                    file_info.get("modified_timestamp"),
+                    file_info.get("hash"),
+                    json.dumps(file_info, ensure_ascii=False),
+                )
+            )
+
+        self.conn.executemany(
+            """
+            INSERT INTO files
+            (full_path, name, file_type, extension, size, modified_timestamp,
+             hash, metadata)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            rows,
+        )
+
+    def _write_meta(self, values: Dict[str, Any]) -> None:
+        """Store index-level metadata values as JSON."""
+        self.conn.executemany(
+            "INSERT OR REPLACE INTO index_meta (key, value) VALUES (?, ?)",
+            [(key, json.dumps(value)) for key, value in values.items()],
+        )
+
+    def close(self) -> None:
+        """Close the database."""
+        self.conn.close()
+
+
+def matches_filters(file_info: Dict, filters: Optional[Dict[str, Any]]) -> bool:
+    """Check a file's metadata against attribute filters.
+
+    Args:
+        file_info: File metadata dictionary.
+        filters: Mapping with optional extension, min_size, max_size,
+            modified_after (timestamp) and hash keys.
+
+    Returns:
+        True if all given filters match.
+    """
+    if not filters:
+        return True
+
+    if filters.get("extension") is not None:
+        if file_info.get("extension") != filters["extension"].lower().lstrip("."):
+            return False
+    if filters.get("min_size") is not None:
+        if file_info.get("size", -1) < filters["min_size"]:
+            return False
+    if filters.get("max_size") is not None:
+        if file_info.get("size", float("inf")) > filters["max_size"]:
+            return False
+    if filters.get("modified_after") is not None:
+        if file_info.get("modified_timestamp", float("-inf")) < filters["modified_after"]:
+            return False
+    if filters.get("hash") is not None:
+        if file_info.get("hash") != filters["hash"].lower():
+            return False
+
+    return True
+
+
 def setup_logging(config: Dict) -> None:
     """Configure logging based on config file.
 
@@ -432,12 +1160,135 @@ def load_config(config_path: Optional[Path] = None) -> Dict:
     return config
 
 
-def load_index(index_path: Path) -> Dict:
-    """Load index from JSON file.
+def iter_jsonl_lines(index_path: Path) -> Iterator[Dict]:
+    """Yield every parsed line of a JSON Lines index, including meta lines.
+
+    Args:
+        index_path: Path to JSON Lines index.
+
+    Yields:
+        Parsed JSON objects.
+
+    Raises:
+        FileNotFoundError: If index file does not exist.
+        json.JSONDecodeError: If a line is invalid.
+    """
+    if not index_path.exists():
+        raise FileNotFoundError(f"Index file not found: {index_path}")
+
+    with open(index_path, "r", encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def iter_index_records(index_path: Path) -> Iterator[Dict]:
+    """Stream file records from a JSON Lines index with constant memory.
+
+    Pending incremental deltas are overlaid: removed and changed records are
+    skipped as they stream past, and changed or added records follow at the
+    end. Only the delta journal is held in memory.
+
+    Args:
+        index_path: Path to JSON Lines index.
+
+    Yields:
+        File metadata dictionaries.
+    """
+    removed = set()
+    upserts: Dict[str, Dict] = {}
+
+    delta_path = get_delta_path(index_path)
+    if delta_path.exists():
+        with open(delta_path, "r", encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                delta = json.loads(line)
+                for full_path in delta.get("removed", []):
+                    removed.add(full_path)
+                    upserts.pop(full_path, None)
+                for file_info in delta.get("updated", []) + delta.get("added", []):
+                    removed.discard(file_info["full_path"])
+                    upserts[file_info["full_path"]] = file_info
+
+    for record in iter_jsonl_lines(index_path):
+        if JSONL_META_KEY in record:
+            continue
+        full_path = record.get("full_path")
+        if full_path in removed or full_path in upserts:
+            continue
+        yield record
+
+    yield from upserts.values()
+
+
+def get_index_path(config: Dict) -> Path:
+    """Return the configured index location for the selected storage.
+
+    Args:
+        config: Configuration dictionary.
+
+    Returns:
+        Path to the JSON index file or SQLite database.
+    """
+    storage = config.get("storage", "json").lower()
+    if storage == "sqlite":
+        return Path(config.get("database_file", "data/file_index.db"))
+    if storage == "jsonl":
+        return Path(config.get("jsonl_file", "data/file_index.jsonl"))
+    return Path(config.get("index_file", "data/file_index.json"))
+
+
+def get_delta_path(index_path: Path) -> Path:
+    """Return the path of the delta journal belonging to an index file.
 
     Args:
         index_path: Path to index file.
 
+    Returns:
+        Path to the delta journal.
+    """
+    return index_path.with_name(index_path.name + ".delta")
+
+
+def apply_index_delta(index: Dict, delta: Dict) -> Dict:
+    """Apply an incremental delta to an index in place.
+
+    Args:
+        index: Index dictionary.
+        delta: Delta dictionary from FileIndexer.update_index.
+
+    Returns:
+        The updated index dictionary.
+    """
+    files = {f["full_path"]: f for f in index.get("files", [])}
+
+    for full_path in delta.get("removed", []):
+        files.pop(full_path, None)
+    for file_info in delta.get("updated", []) + delta.get("added", []):
+        files[file_info["full_path"]] = file_info
+
+    directories = index.setdefault("directories", {})
+    for dir_path in delta.get("removed_directories", []):
+        directories.pop(dir_path, None)
+    directories.update(delta.get("directories", {}))
+
+    index["files"] = list(files.values())
+    index["total_files"] = len(index["files"])
+    if "updated_at" in delta:
+        index["updated_at"] = delta["updated_at"]
+
+    return index
+
+
+def load_index(index_path: Path, storage: Optional[str] = None) -> Dict:
+    """Load index from a JSON or JSON Lines file, replaying any incremental deltas.
+
+    Args:
+        index_path: Path to index file.
+        storage: "json" or "jsonl"; inferred from the file suffix if omitted.
+
     Returns:
         Index dictionary.
 
@@ -448,8 +1299,29 @@ def load_index(index_path: Path) -> Dict:
     if not index_path.exists():
         raise FileNotFoundError(f"Index file not found: {index_path}")
 
-    with open(index_path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    if storage is None:
+        storage = "jsonl" if index_path.suffix == ".jsonl" else "json"
+
+    if storage == "jsonl":
+        index: Dict = {"files": []}
+        for record in iter_jsonl_lines(index_path):
+            if JSONL_META_KEY in record:
+                index.update(record[JSONL_META_KEY])
+            else:
+                index["files"].append(record)
+        index["total_files"] = len(index["files"])
+    else:
+        with open(index_path, "r", encoding="utf-8") as f:
+            index = json.load(f)
+
+    delta_path = get_delta_path(index_path)
+    if delta_path.exists():
+        with open(delta_path, "r", encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    apply_index_delta(index, json.loads(line))
+
+    return index
 
 
 def main() -> None:
@@ -459,7 +1331,7 @@ def main() -> None:
     )
     parser.add_argument(
         "command",
-        choices=["index", "search"],
+        choices=["index", "update", "search"],
         help="Command to execute",
     )
     parser.add_argument(
@@ -484,7 +1356,7 @@ def main() -> None:
         "-o",
         "--output",
         type=Path,
-        help="Output index file path (overrides config)",
+        help="Output index file path (overrides config, for index and update commands)",
     )
     parser.add_argument(
         "-i",
@@ -503,6 +1375,36 @@ def main() -> None:
         action="store_true",
         help="Case-sensitive search (for search command)",
     )
+    parser.add_argument(
+        "--storage",
+        choices=["json", "jsonl", "sqlite"],
+        help="Index storage backend (overrides config)",
+    )
+    parser.add_argument(
+        "--ext",
+        type=str,
+        help="Only match files with this extension (for search command)",
+    )
+    parser.add_argument(
+        "--min-size",
+        type=int,
+        help="Only match files of at least this many bytes (for search command)",
+    )
+    parser.add_argument(
+        "--max-size",
+        type=int,
+        help="Only match files of at most this many bytes (for search command)",
+    )
+    parser.add_argument(
+        "--modified-after",
+        type=str,
+        help="Only match files modified on or after this ISO date (for search command)",
+    )
+    parser.add_argument(
+        "--hash",
+        type=str,
+        help="Only match files with this hash (for search command)",
+    )
     parser.add_argument(
         "-c",
         "--config",
@@ -516,6 +1418,15 @@ def main() -> None:
         config = load_config(args.config)
         setup_logging(config)
 
+        if args.storage:
+            config["storage"] = args.storage
+        storage = config.get("storage", "json").lower()
+        if args.output:
+            path_key = {"sqlite": "database_file", "jsonl": "jsonl_file"}.get(
+                storage, "index_file"
+            )
+            config[path_key] = str(args.output)
+
         if args.command == "index":
             # Override config with command-line arguments
             if args.directories:
@@ -524,8 +1435,6 @@ def main() -> None:
                 recursive = False
             else:
                 recursive = args.recursive if args.recursive else config.get("options", {}).get("recursive", True)
-            if args.output:
-                config["index_file"] = str(args.output)
 
             # Get directories to index
             directories = [
@@ -541,13 +1450,14 @@ def main() -> None:
             print(f"Recursive: {recursive}")
             print()
 
-            # Create index
+            # Create and save index
             indexer = FileIndexer(config)
-            index = indexer.create_index(directories, recursive)
-
-            # Save index
-            index_path = Path(config.get("index_file", "data/file_index.json"))
-            indexer.save_index(index, index_path)
+            index_path = get_index_path(config)
+            if storage == "jsonl":
+                index = indexer.write_index_stream(directories, recursive, index_path)
+            else:
+                index = indexer.create_index(directories, recursive)
+                indexer.save_index(index, index_path)
 
             print()
             print("=" * 60)
@@ -557,29 +1467,82 @@ def main() -> None:
             print(f"Index saved to: {index_path}")
             print("=" * 60)
 
-        elif args.command == "search":
-            if not args.index and not args.query:
-                # Try to use default index file
-                index_path = Path(config.get("index_file", "data/file_index.json"))
-            elif args.index:
-                index_path = args.index
+        elif args.command == "update":
+            index_path = get_index_path(config)
+            indexer = FileIndexer(config)
+
+            if storage == "sqlite":
+                store = SQLiteIndexStore(index_path, create=False)
+                try:
+                    index = store.load()
+                    delta = indexer.update_index(index)
+                    store.apply_delta(delta)
+                finally:
+                    store.close()
+                delta_location = index_path
             else:
-                index_path = Path(config.get("index_file", "data/file_index.json"))
+                index = load_index(index_path, storage)
+                delta = indexer.update_index(index)
+                indexer.save_index_delta(delta, index_path)
+                delta_location = get_delta_path(index_path)
+            apply_index_delta(index, delta)
 
-            if not args.query:
-                print("Error: --query is required for search command")
-                sys.exit(1)
+            print()
+            print("=" * 60)
+            print("INDEX UPDATE SUMMARY")
+            print("=" * 60)
+            print(f"Files added: {indexer.stats['files_added']:,}")
+            print(f"Files updated: {indexer.stats['files_updated']:,}")
+            print(f"Files removed: {indexer.stats['files_removed']:,}")
+            print(f"Files unchanged: {indexer.stats['files_unchanged']:,}")
+            print(f"Directories rescanned: {indexer.stats['directories_scanned']:,}")
+            print(f"Directories skipped: {indexer.stats['directories_skipped']:,}")
+            print(f"Total files indexed: {index['total_files']:,}")
+            print(f"Delta saved to: {delta_location}")
+            print("=" * 60)
+
+        elif args.command == "search":
+            index_path = args.index if args.index else get_index_path(config)
+
+            filters = {
+                "extension": args.ext,
+                "min_size": args.min_size,
+                "max_size": args.max_size,
+                "modified_after": (
+                    datetime.fromisoformat(args.modified_after).timestamp()
+                    if args.modified_after
+                    else None
+                ),
+                "hash": args.hash,
+            }
+            filters = {key: value for key, value in filters.items() if value is not None}
 
-            # Load index
-            index = load_index(index_path)
+            if not args.query and not filters:
+                print("Error: --query or a filter is required for search command")
+                sys.exit(1)
 
             # Search
             indexer = FileIndexer(config)
-            matches = indexer.search_index(
-                index, args.query, case_sensitive=args.case_sensitive
-            )
+            if storage == "sqlite":
+                matches = indexer.search_database(
+                    index_path, args.query, args.case_sensitive, filters
+                )
+            elif storage == "jsonl":
+                matches = list(
+                    indexer.search_records(
+                        iter_index_records(index_path),
+                        args.query,
+                        args.case_sensitive,
+                        filters,
+                    )
+                )
+            else:
+                index = load_index(index_path, storage)
+                matches = indexer.search_index(
+                    index, args.query, case_sensitive=args.case_sensitive, filters=filters
+                )
 
-            print(f"Search results for '{args.query}': {len(matches)} match(es)\n")
+            print(f"Search results for '{args.query or ''}': {len(matches)} match(es)\n")
 
             if matches:
                 for i, file_info in enumerate(matches, 1):
@@ -603,6 +1566,10 @@ def main() -> None:
         logger.error(f"Invalid configuration file: {e}")
         print(f"Error: Invalid configuration file: {e}")
         sys.exit(1)
+    except sqlite3.Error as e:
+        logger.error(f"Index database error: {e}")
+        print(f"Error: Index database error: {e}")
+        sys.exit(1)
     except json.JSONDecodeError as e:
         logger.error(f"Invalid index file: {e}")
         print(f"Error: Invalid index file: {e}")
@@ -8,7 +8,15 @@ from unittest.mock import Mock, patch
 
 import pytest
 
-from src.main import FileIndexer, load_config, load_index
+from src.main import (
+    FileIndexer,
+    SQLiteIndexStore,
+    apply_index_delta,
+    get_delta_path,
+    iter_index_records,
+    load_config,
+    load_index,
+)
 
 
 class TestFileIndexer:
@@ -178,6 +186,150 @@ class TestFileIndexer:
         assert hash_value is not None
         assert len(hash_value) == 64  # SHA256 produces 64 hex characters
 
+    def test_update_index_reports_changes(self, sample_config, temp_dir):
+        """Test incremental update detects added, updated and removed files."""
+        indexer = FileIndexer(sample_config)
+        index = indexer.create_index([temp_dir], recursive=True)
+        assert str(temp_dir / "subdir") in index["directories"]
+
+        (temp_dir / "test1.txt").write_text("Changed content 1")
+        (temp_dir / "test2.py").unlink()
+        (temp_dir / "subdir" / "new.txt").write_text("new")
+
+        indexer = FileIndexer(sample_config)
+        delta = indexer.update_index(index)
+
+        assert [f["name"] for f in delta["added"]] == ["new.txt"]
+        assert [f["name"] for f in delta["updated"]] == ["test1.txt"]
+        assert delta["removed"] == [str(temp_dir / "test2.py")]
+        assert indexer.stats["files_unchanged"] == 1
+
+        apply_index_delta(index, delta)
+        fresh = FileIndexer(sample_config).create_index([temp_dir], recursive=True)
+        assert sorted(f["full_path"] for f in index["files"]) == sorted(
+            f["full_path"] for f in fresh["files"]
+        )
+
+    def test_update_index_skips_unchanged_directories(self, sample_config, temp_dir):
+        """Test that unchanged directories are not listed again."""
+        indexer = FileIndexer(sample_config)
+        index = indexer.create_index([temp_dir], recursive=True)
+
+        indexer = FileIndexer(sample_config)
+        with patch("src.main.os.scandir") as mock_scandir:
+            delta = indexer.update_index(index)
+
+        mock_scandir.assert_not_called()
+        assert delta["added"] == delta["updated"] == delta["removed"] == []
+        assert indexer.stats["directories_skipped"] == 2
+
+    def test_save_index_delta_replayed_by_load_index(self, sample_config, temp_dir, tmp_path):
+        """Test that load_index replays the delta journal."""
+        indexer = FileIndexer(sample_config)
+        index_path = tmp_path / "index.json"
+        indexer.save_index(indexer.create_index([temp_dir], recursive=True), index_path)
+
+        (temp_dir / "added.txt").write_text("added")
+        index = load_index(index_path)
+        indexer.save_index_delta(indexer.update_index(index), index_path)
+
+        assert get_delta_path(index_path).exists()
+        loaded = load_index(index_path)
+        assert "added.txt" in [f["name"] for f in loaded["files"]]
+        assert loaded["total_files"] == index["total_files"] + 1
+
+        indexer.save_index(loaded, index_path)
+        assert not get_delta_path(index_path).exists()
+
+    def test_sqlite_search_matches_json_search(self, sample_config, temp_dir, tmp_path):
+        """Test that SQLite search returns the same results as JSON search."""
+        sample_config["search"]["search_fields"] = ["name", "full_path", "file_type"]
+        indexer = FileIndexer(sample_config)
+        index = indexer.create_index([temp_dir], recursive=True)
+
+        sample_config["storage"] = "sqlite"
+        database_path = tmp_path / "index.db"
+        FileIndexer(sample_config).save_index(index, database_path)
+
+        for query, case_sensitive in [
+            ("test", False),
+            ("TEST", True),
+            ("subdir", False),
+            ("py", False),
+            ("100%", False),
+        ]:
+            expected = indexer.search_index(index, query, case_sensitive)
+            actual = indexer.search_database(database_path, query, case_sensitive)
+            assert actual == expected
+
+    def test_sqlite_search_filters(self, sample_config, temp_dir, tmp_path):
+        """Test attribute filters on the SQLite backend."""
+        sample_config["storage"] = "sqlite"
+        indexer = FileIndexer(sample_config)
+        database_path = tmp_path / "index.db"
+        indexer.save_index(indexer.create_index([temp_dir], recursive=True), database_path)
+
+        matches = indexer.search_database(database_path, "", filters={"extension": "txt"})
+        assert sorted(m["name"] for m in matches) == ["test1.txt", "test3.txt"]
+
+        matches = indexer.search_database(
+            database_path, "test", filters={"extension": ".py", "max_size": 100}
+        )
+        assert [m["name"] for m in matches] == ["test2.py"]
+
+    def test_sqlite_apply_delta(self, sample_config, temp_dir, tmp_path):
+        """Test that incremental updates are written to the SQLite backend."""
+        sample_config["storage"] = "sqlite"
+        indexer = FileIndexer(sample_config)
+        database_path = tmp_path / "index.db"
+        indexer.save_index(indexer.create_index([temp_dir], recursive=True), database_path)
+
+        (temp_dir / "test2.py").unlink()
+        (temp_dir / "added.txt").write_text("added")
+
+        store = SQLiteIndexStore(database_path)
+        delta = indexer.update_index(store.load())
+        store.apply_delta(delta)
+        index = store.load()
+        store.close()
+
+        names = sorted(f["name"] for f in index["files"])
+        assert names == ["added.txt", "test1.txt", "test3.txt"]
+        assert index["total_files"] == 3
+        assert indexer.search_database(database_path, "test2") == []
+
+    def test_write_index_stream(self, sample_config, temp_dir, tmp_path):
+        """Test streaming an index to JSON Lines."""
+        sample_config["storage"] = "jsonl"
+        indexer = FileIndexer(sample_config)
+        index_path = tmp_path / "index.jsonl"
+
+        summary = indexer.write_index_stream([temp_dir], True, index_path)
+
+        lines = index_path.read_text().splitlines()
+        assert len(lines) == summary["total_files"] + 2
+        assert "_index" in json.loads(lines[0])
+        assert "_index" in json.loads(lines[-1])
+
+        loaded = load_index(index_path)
+        expected = indexer.create_index([temp_dir], recursive=True)
+        assert loaded["files"] == expected["files"]
+        assert loaded["directories"] == expected["directories"]
+
+    def test_search_records_streams_jsonl(self, sample_config, temp_dir, tmp_path):
+        """Test stream-filtering a JSON Lines index with pending deltas."""
+        sample_config["storage"] = "jsonl"
+        indexer = FileIndexer(sample_config)
+        index_path = tmp_path / "index.jsonl"
+        indexer.write_index_stream([temp_dir], True, index_path)
+
+        (temp_dir / "test1.txt").unlink()
+        (temp_dir / "test4.txt").write_text("Test content 4")
+        indexer.save_index_delta(indexer.update_index(load_index(index_path)), index_path)
+
+        matches = indexer.search_records(iter_index_records(index_path), "test")
+        assert sorted(m["name"] for m in matches) == ["test2.py", "test3.txt", "test4.txt"]
+
     def test_format_size(self, sample_config):
         """Test size formatting."""
         indexer = FileIndexer(sample_config)
@@ -9,10 +9,15 @@ import gzip
 import logging
 import logging.handlers
 import os
-import shutil
+import struct
+import threading
+import time
+import zlib
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import List, Optional, Set
+from typing import Deque, List, Optional, Set, Tuple
 
 import yaml
 from dotenv import load_dotenv
@@ -22,6 +27,40 @@ load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+# Bytes read or verified at a time
+CHUNK_SIZE = 1024 * 1024
+
+# Deflate window; each block is primed with this much of the previous one
+DEFLATE_WINDOW = 32 * 1024
+
+
+def _compress_block(block: bytes, dictionary: bytes, level: int, last: bool) -> bytes:
+    """Compress one block of a block-parallel gzip stream.
+
+    The block is raw deflate primed with the end of the previous block, so
+    that matches can reach back across the boundary. Blocks other than the
+    last end with a sync flush on a byte boundary, so the compressed blocks
+    concatenate into a single deflate stream.
+
+    Args:
+        block: Uncompressed data.
+        dictionary: Up to DEFLATE_WINDOW bytes preceding the block.
+        level: Compression level (1-9).
+        last: Whether this is the final block of the stream.
+
+    Returns:
+        Raw deflate data for the block.
+    """
+    if dictionary:
+        compressor = zlib.compressobj(
+            level, zlib.DEFLATED, -zlib.MAX_WBITS, zdict=dictionary
+        )
+    else:
+        compressor = zlib.compressobj(level, zlib.DEFLATED, -zlib.MAX_WBITS)
+
+    data = compressor.compress(block)
+    return data + compressor.flush(zlib.Z_FINISH if last else zlib.Z_SYNC_FLUSH)
+
 
 class LogCompressor:
     """Compresses log files with retention and date-based organization."""
@@ -38,6 +77,7 @@ class LogCompressor:
         """
         self.config = self._load_config(config_path)
         self._setup_logging()
+        self._stats_lock = threading.Lock()
         self.stats = {
             "files_scanned": 0,
             "files_compressed": 0,
@@ -45,6 +85,8 @@ class LogCompressor:
             "files_failed": 0,
             "files_deleted": 0,
             "space_saved_mb": 0.0,
+            "bytes_compressed": 0,
+            "throughput_mb_s": 0.0,
             "compressed_files": [],
             "deleted_files": [],
         }
@@ -250,6 +292,135 @@ class LogCompressor:
         compressed_name = file_path.name + ".gz"
         return output_dir / compressed_name
 
+    def _write_gzip(self, file_path: Path, compressed_path: Path) -> Tuple[int, int]:
+        """Compress a file to gzip on the calling thread.
+
+        Args:
+            file_path: Path to file to compress.
+            compressed_path: Path of gzip file to write.
+
+        Returns:
+            Tuple of (CRC-32, size) of the uncompressed data.
+        """
+        compression_level = self.config.get("compression", {}).get("compression_level", 6)
+        crc = 0
+        size = 0
+
+        with open(file_path, "rb") as f_in:
+            with gzip.open(compressed_path, "wb", compresslevel=compression_level) as f_out:
+                while chunk := f_in.read(CHUNK_SIZE):
+                    f_out.write(chunk)
+                    crc = zlib.crc32(chunk, crc)
+                    size += len(chunk)
+
+        return crc, size
+
+    def _write_gzip_blocks(self, file_path: Path, compressed_path: Path) -> Tuple[int, int]:
+        """Compress a file to gzip in blocks compressed in parallel (pigz style).
+
+        Blocks are read in order and compressed by a thread pool, with at
+        most two blocks per worker in flight. The output is one standard
+        gzip member, readable by any gzip tool.
+
+        Args:
+            file_path: Path to file to compress.
+            compressed_path: Path of gzip file to write.
+
+        Returns:
+            Tuple of (CRC-32, size) of the uncompressed data.
+        """
+        compression = self.config.get("compression", {})
+        level = compression.get("compression_level", 6)
+        block_size = max(compression.get("block_size_kb", 1024), 64) * 1024
+        workers = self._workers()
+        crc = 0
+        size = 0
+
+        # Header: magic, deflate, no flags, mtime, extra flags, OS unknown
+        extra_flags = 2 if level == 9 else 4 if level == 1 else 0
+        header = b"\x1f\x8b\x08\x00" + struct.pack(
+            "<IBB", int(time.time()), extra_flags, 255
+        )
+
+        with open(file_path, "rb") as f_in, open(compressed_path, "wb") as f_out:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                f_out.write(header)
+                pending: Deque[Future] = deque()
+                dictionary = b""
+                block = f_in.read(block_size)
+
+                while True:
+                    next_block = f_in.read(block_size)
+                    last = not next_block
+                    crc = zlib.crc32(block, crc)
+                    size += len(block)
+                    pending.append(
+                        executor.submit(_compress_block, block, dictionary, level, last)
+                    )
+                    dictionary = block[-DEFLATE_WINDOW:]
+
+                    while pending and (last or len(pending) >= workers * 2):
+                        f_out.write(pending.popleft().result())
+
+                    if last:
+                        break
+                    block = next_block
+
+            f_out.write(struct.pack("<II", crc, size & 0xFFFFFFFF))
+
+        return crc, size
+
+    def _verify_compressed(
+        self, compressed_path: Path, expected_crc: int, expected_size: int
+    ) -> None:
+        """Verify a gzip file by streaming it through the decompressor.
+
+        The gzip trailer is checked by the decompressor, and the CRC-32 and
+        length of the output are compared with those of the original, one
+        chunk at a time.
+
+        Args:
+            compressed_path: Path of gzip file to verify.
+            expected_crc: CRC-32 of the original data.
+            expected_size: Size of the original data.
+
+        Raises:
+            ValueError: If the decompressed data does not match the original.
+            OSError: If the gzip file is corrupt.
+            EOFError: If the gzip file is truncated.
+        """
+        crc = 0
+        size = 0
+
+        with gzip.open(compressed_path, "rb") as f:
+            while chunk := f.read(CHUNK_SIZE):
+                crc = zlib.crc32(chunk, crc)
+                size += len(chunk)
+
+        if (crc, size) != (expected_crc, expected_size):
+            raise ValueError(
+                f"decompressed {size} bytes with CRC {crc:08x}, "
+                f"expected {expected_size} bytes with CRC {expected_crc:08x}"
+            )
+
+    def _workers(self) -> int:
+        """Return the configured number of compression worker threads."""
+        return max(1, int(self.config.get("compression", {}).get("workers", 1)))
+
+    def _uses_blocks(self, file_size: int) -> bool:
+        """Check whether a file is large enough for block-parallel compression.
+
+        Args:
+            file_size: Size of the file in bytes.
+
+        Returns:
+            True if block-parallel compression is enabled and applies.
+        """
+        threshold_mb = self.config.get("compression", {}).get(
+            "parallel_block_threshold_mb", 0
+        )
+        return threshold_mb > 0 and file_size >= threshold_mb * 1024**2
+
     def _compress_file(self, file_path: Path) -> bool:
         """Compress a file using gzip.
 
@@ -260,7 +431,6 @@ class LogCompressor:
             True if successful, False otherwise.
         """
         dry_run = self.config.get("safety", {}).get("dry_run", False)
-        compression_level = self.config.get("compression", {}).get("compression_level", 6)
 
         try:
             compressed_path = self._get_compressed_path(file_path)
@@ -273,15 +443,17 @@ class LogCompressor:
             original_size = file_path.stat().st_size
 
             # Compress file
-            with open(file_path, "rb") as f_in:
-                with gzip.open(compressed_path, "wb", compresslevel=compression_level) as f_out:
-                    shutil.copyfileobj(f_in, f_out)
+            start = time.perf_counter()
+            if self._uses_blocks(original_size):
+                crc, size = self._write_gzip_blocks(file_path, compressed_path)
+            else:
+                crc, size = self._write_gzip(file_path, compressed_path)
+            elapsed = time.perf_counter() - start
 
             # Verify compression if configured
             if self.config.get("compression", {}).get("verify_compression", True):
                 try:
-                    with gzip.open(compressed_path, "rb") as f:
-                        f.read()
+                    self._verify_compressed(compressed_path, crc, size)
                 except Exception as e:
                     logger.error(f"Compression verification failed for {compressed_path}: {e}")
                     compressed_path.unlink()
@@ -289,21 +461,25 @@ class LogCompressor:
 
             compressed_size = compressed_path.stat().st_size
             space_saved = original_size - compressed_size
-            self.stats["space_saved_mb"] += space_saved / (1024 ** 2)
+            throughput = size / (1024 ** 2) / elapsed if elapsed > 0 else 0.0
 
             logger.info(
                 f"Compressed: {file_path} -> {compressed_path} "
-                f"({original_size / 1024:.2f} KB -> {compressed_size / 1024:.2f} KB)"
+                f"({original_size / 1024:.2f} KB -> {compressed_size / 1024:.2f} KB, "
+                f"{throughput:.1f} MB/s)"
             )
 
-            if self.config.get("logging", {}).get("log_compressions", True):
-                self.stats["compressed_files"].append({
-                    "original": str(file_path),
-                    "compressed": str(compressed_path),
-                    "original_size": original_size,
-                    "compressed_size": compressed_size,
-                    "space_saved": space_saved,
-                })
+            with self._stats_lock:
+                self.stats["space_saved_mb"] += space_saved / (1024 ** 2)
+                self.stats["bytes_compressed"] += size
+                if self.config.get("logging", {}).get("log_compressions", True):
+                    self.stats["compressed_files"].append({
+                        "original": str(file_path),
+                        "compressed": str(compressed_path),
+                        "original_size": original_size,
+                        "compressed_size": compressed_size,
+                        "space_saved": space_saved,
+                    })
 
             # Remove original if configured
             if self.config.get("compression", {}).get("remove_original_after", True):
@@ -315,9 +491,10 @@ class LogCompressor:
                 if age_days >= keep_days:
                     file_path.unlink()
                     logger.info(f"Removed original file: {file_path}")
-                    if self.config.get("logging", {}).get("log_deletions", True):
-                        self.stats["deleted_files"].append(str(file_path))
-                    self.stats["files_deleted"] += 1
+                    with self._stats_lock:
+                        if self.config.get("logging", {}).get("log_deletions", True):
+                            self.stats["deleted_files"].append(str(file_path))
+                        self.stats["files_deleted"] += 1
                 else:
                     logger.debug(
                         f"Keeping original for retention period: {file_path} "
@@ -328,11 +505,13 @@ class LogCompressor:
 
         except PermissionError:
             logger.error(f"Permission denied: {file_path}")
-            self.stats["files_failed"] += 1
+            with self._stats_lock:
+                self.stats["files_failed"] += 1
             return False
         except Exception as e:
             logger.error(f"Error compressing {file_path}: {e}", exc_info=True)
-            self.stats["files_failed"] += 1
+            with self._stats_lock:
+                self.stats["files_failed"] += 1
             return False
 
     def _find_log_files(self, root_path: Path, recursive: bool = True) -> List[Path]:
@@ -422,7 +601,8 @@ class LogCompressor:
         if dry_run:
             logger.info("DRY RUN MODE: No files will be compressed")
 
-        # Find and compress log files
+        # Find log files to compress
+        to_compress: List[Path] = []
         for target in targets:
             if not target.get("enabled", True):
                 continue
@@ -439,13 +619,12 @@ class LogCompressor:
 
             for file_path in log_files:
                 if self._should_compress(file_path):
-                    if self._compress_file(file_path):
-                        self.stats["files_compressed"] += 1
-                    else:
-                        self.stats["files_failed"] += 1
+                    to_compress.append(file_path)
                 else:
                     self.stats["files_skipped"] += 1
 
+        self._compress_files(to_compress)
+
         # Cleanup old compressed files
         self._cleanup_old_files()
 
@@ -458,6 +637,51 @@ class LogCompressor:
 
         return self.stats
 
+    def _compress_files(self, file_paths: List[Path]) -> None:
+        """Compress files, using a thread pool when several workers are configured.
+
+        Files below the block-parallel threshold are compressed whole, one per
+        worker. Larger files are compressed afterwards, one at a time, with
+        their blocks spread across the workers. zlib releases the GIL while
+        compressing, so threads use multiple cores.
+
+        Args:
+            file_paths: Files to compress.
+        """
+        whole_files = []
+        block_files = []
+        for file_path in file_paths:
+            try:
+                file_size = file_path.stat().st_size
+            except OSError:
+                file_size = 0
+            if self._uses_blocks(file_size):
+                block_files.append(file_path)
+            else:
+                whole_files.append(file_path)
+
+        workers = self._workers()
+        start = time.perf_counter()
+
+        if workers > 1 and len(whole_files) > 1:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(self._compress_file, whole_files))
+        else:
+            results = [self._compress_file(file_path) for file_path in whole_files]
+        results.extend(self._compress_file(file_path) for file_path in block_files)
+
+        for compressed in results:
+            if compressed:
+                self.stats["files_compressed"] += 1
+            else:
+                self.stats["files_failed"] += 1
+
+        elapsed = time.perf_counter() - start
+        if elapsed > 0 and self.stats["bytes_compressed"]:
+            self.stats["throughput_mb_s"] = (
+                self.stats["bytes_compressed"] / (1024 ** 2) / elapsed
+            )
+
     def _generate_report(self) -> None:
         """Generate compression report."""
         report_config = self.config.get("reporting", {})
@@ -489,6 +713,7 @@ class LogCompressor:
                 f.write(f"Files Failed: {self.stats['files_failed']}\n")
                 f.write(f"Files Deleted: {self.stats['files_deleted']}\n")
                 f.write(f"Space Saved: {self.stats['space_saved_mb']:.2f} MB\n")
+                f.write(f"Throughput: {self.stats['throughput_mb_s']:.1f} MB/s\n")
                 f.write("\n")
 
             if report_config.get("include_file_list", True) and self.stats["compressed_files"]:
@@ -529,6 +754,12 @@ def main() -> int:
         "--path",
         help="Target directory path to process",
     )
+    parser.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        help="Number of files to compress in parallel",
+    )
 
     args = parser.parse_args()
 
@@ -540,6 +771,8 @@ def main() -> int:
             compressor.config["safety"]["dry_run"] = True
         if args.path:
             compressor.config["targets"] = [{"path": args.path, "enabled": True, "recursive": True}]
+        if args.workers:
+            compressor.config.setdefault("compression", {})["workers"] = args.workers
 
         stats = compressor.compress_logs()
 
@@ -552,6 +785,7 @@ def main() -> int:
         print(f"Files Failed: {stats['files_failed']}")
         print(f"Files Deleted: {stats['files_deleted']}")
         print(f"Space Saved: {stats['space_saved_mb']:.2f} MB")
+        print(f"Throughput: {stats['throughput_mb_s']:.1f} MB/s")
 
         if compressor.config.get("safety", {}).get("dry_run", False):
             print("\n[DRY RUN] No files were actually compressed")
@@ -3,6 +3,7 @@
 import gzip
 import tempfile
 import time
+import zlib
 from datetime import datetime, timedelta
 from pathlib import Path
 from unittest.mock import patch
@@ -230,3 +231,68 @@ def test_compress_logs(config_file, temp_dir):
 
     assert stats["files_scanned"] >= 3
     assert stats["files_compressed"] >= 3
+
+
+def test_compress_logs_parallel(config_file, temp_dir):
+    """Test compressing logs with several worker threads."""
+    compressor = LogCompressor(config_path=str(config_file))
+    compressor.config["safety"]["dry_run"] = False
+    compressor.config["compression"]["workers"] = 4
+
+    contents = {}
+    for i in range(8):
+        log_file = Path(temp_dir) / f"parallel{i}.log"
+        contents[log_file] = f"parallel log {i} " * 500
+        log_file.write_text(contents[log_file])
+
+    stats = compressor.compress_logs()
+
+    assert stats["files_compressed"] >= 8
+    assert stats["files_failed"] == 0
+    assert stats["throughput_mb_s"] > 0
+    for log_file, content in contents.items():
+        with gzip.open(compressor._get_compressed_path(log_file), "rb") as f:
+            assert f.read().decode() == content
+
+
+def test_compress_file_block_parallel(config_file, temp_dir):
+    """Test block-parallel compression produces a standard gzip file."""
+    compressor = LogCompressor(config_path=str(config_file))
+    compressor.config["safety"]["dry_run"] = False
+    compressor.config["compression"]["workers"] = 3
+    compressor.config["compression"]["parallel_block_threshold_mb"] = 0.1
+    compressor.config["compression"]["block_size_kb"] = 64
+
+    log_file = Path(temp_dir) / "large.log"
+    content = b"".join(
+        f"2024-01-01 INFO request {i} took {i % 97}ms\n".encode() for i in range(20000)
+    )
+    log_file.write_bytes(content)
+
+    assert compressor._uses_blocks(len(content))
+    assert compressor._compress_file(log_file) is True
+
+    compressed_path = compressor._get_compressed_path(log_file)
+    with gzip.open(compressed_path, "rb") as f:
+        assert f.read() == content
+    assert compressed_path.stat().st_size < len(content) // 4
+
+
+def test_verify_compressed_detects_mismatch(config_file, temp_dir):
+    """Test streaming verification rejects data that differs from the original."""
+    compressor = LogCompressor(config_path=str(config_file))
+
+    compressed_path = Path(temp_dir) / "check.log.gz"
+    with gzip.open(compressed_path, "wb") as f:
+        f.write(b"original data")
+
+    crc = zlib.crc32(b"original data")
+    compressor._verify_compressed(compressed_path, crc, len(b"original data"))
+
+    with pytest.raises(ValueError):
+        compressor._verify_compressed(compressed_path, crc ^ 1, len(b"original data"))
+
+    data = compressed_path.read_bytes()
+    compressed_path.write_bytes(data[:-6])
+    with pytest.raises(EOFError):
+        compressor._verify_compressed(compressed_path, crc, len(b"original data"))
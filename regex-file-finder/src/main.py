@@ -4,22 +4,596 @@ This module provides functionality to find files matching regex patterns
 in filenames or file content, with options to move, copy, or list matching files.
 """
 
+import codecs
 import logging
 import logging.handlers
 import os
 import re
 import shutil
+import sqlite3
+from array import array
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Dict, List, Optional, Pattern, Set, Tuple, Union
 
 import yaml
 from dotenv import load_dotenv
 
+try:
+    from re import _parser as sre_parse
+except ImportError:  # Python < 3.11
+    import sre_parse
+
 # Load environment variables
 load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+# Parser opcodes of repeats; POSSESSIVE_REPEAT and ATOMIC_GROUP are 3.11+
+_REPEAT_OPCODES = tuple(
+    getattr(sre_parse, name)
+    for name in ("MAX_REPEAT", "MIN_REPEAT", "POSSESSIVE_REPEAT")
+    if hasattr(sre_parse, name)
+)
+_ATOMIC_GROUP = getattr(sre_parse, "ATOMIC_GROUP", None)
+
+
+class LiteralPrefilter:
+    """Rejects buffers that lack literals every match of a regex contains.
+
+    The pattern is reduced to requirements: groups of literal strings of
+    which at least one must occur in any text the pattern matches. Buffers
+    are checked with bytes.find, or with a literal-only bytes regex when
+    matching ignores case, which is far cheaper than running the regex.
+    """
+
+    # Shortest literal worth checking for
+    MIN_LITERAL_LENGTH = 3
+
+    # Most alternatives kept for one requirement drawn from an alternation
+    MAX_ALTERNATIVES = 16
+
+    # Non-ASCII characters that str patterns match case-insensitively for
+    # these ASCII letters, as UTF-8 bytes
+    CASE_FOLD_EXTRAS = {
+        "i": [b"\xc4\xb0", b"\xc4\xb1"],
+        "k": [b"\xe2\x84\xaa"],
+        "s": [b"\xc5\xbf"],
+    }
+
+    def __init__(
+        self, requirements: List[Union[Tuple[bytes, ...], Pattern[bytes]]]
+    ) -> None:
+        """Initialize the prefilter.
+
+        Args:
+            requirements: Each either a tuple of UTF-8 literals of which one
+                must occur, or a bytes pattern that must match, checked in
+                order.
+        """
+        self.requirements = requirements
+
+    @classmethod
+    def from_pattern(cls, pattern: str, flags: int = 0) -> Optional["LiteralPrefilter"]:
+        """Build a prefilter for a regex.
+
+        Args:
+            pattern: Regex pattern.
+            flags: Flags the pattern is compiled with.
+
+        Returns:
+            Prefilter, or None if the pattern requires no usable literal.
+        """
+        try:
+            parsed = sre_parse.parse(pattern, flags)
+        except re.error:
+            return None
+
+        ignore_case = bool(parsed.state.flags & re.IGNORECASE)
+        literal_sets = cls._required_literals(parsed, ignore_case)
+        literal_sets.sort(key=lambda literals: -min(map(len, literals)))
+
+        requirements: List[Union[Tuple[bytes, ...], Pattern[bytes]]] = []
+        for literals in literal_sets:
+            if not ignore_case:
+                requirements.append(tuple(text.encode("utf-8") for text in literals))
+                continue
+
+            compiled = [
+                cls.compile_literal(text, ignore_case=True) for text in literals
+            ]
+            if all(compiled):
+                requirements.append(
+                    re.compile(
+                        b"|".join(part.pattern for part in compiled), re.IGNORECASE
+                    )
+                )
+
+        return cls(requirements) if requirements else None
+
+    @classmethod
+    def compile_literal(
+        cls, text: str, ignore_case: bool = False
+    ) -> Optional[Pattern[bytes]]:
+        """Compile text for matching raw UTF-8 bytes the way a str pattern would.
+
+        Args:
+            text: Literal text.
+            ignore_case: Whether the str pattern ignores case.
+
+        Returns:
+            Compiled bytes pattern, or None if text has non-ASCII characters
+            and case is ignored.
+        """
+        if not ignore_case:
+            return re.compile(re.escape(text.encode("utf-8")))
+
+        if not text.isascii():
+            return None
+
+        parts = []
+        for char in text:
+            escaped = re.escape(char.encode("ascii"))
+            extras = cls.CASE_FOLD_EXTRAS.get(char.lower())
+            if extras:
+                escaped = b"(?:" + b"|".join([escaped] + extras) + b")"
+            parts.append(escaped)
+        return re.compile(b"".join(parts), re.IGNORECASE)
+
+    @classmethod
+    def _required_literals(cls, items: Any, ignore_case: bool) -> List[Tuple[str, ...]]:
+        """Collect literal sets required by a parsed regex sequence.
+
+        Only constructs that must match at least once contribute; classes,
+        anchors, lookarounds and optional parts end the current literal.
+        Line breaks are excluded so that text-mode newline translation
+        cannot hide a literal.
+
+        Args:
+            items: Parsed sequence from the regex parser.
+            ignore_case: Whether the whole pattern ignores case.
+
+        Returns:
+            List of tuples of alternatives, one of which must occur.
+        """
+        requirements: List[Tuple[str, ...]] = []
+        run: List[str] = []
+
+        def flush() -> None:
+            if len(run) >= cls.MIN_LITERAL_LENGTH:
+                requirements.append(("".join(run),))
+            run.clear()
+
+        for op, av in items:
+            if op is sre_parse.LITERAL and av not in (10, 13):
+                run.append(chr(av))
+                continue
+
+            flush()
+            if op is sre_parse.SUBPATTERN:
+                _, add_flags, _, sub = av
+                if ignore_case or not add_flags & re.IGNORECASE:
+                    requirements.extend(cls._required_literals(sub, ignore_case))
+            elif op in _REPEAT_OPCODES:
+                minimum, _, item = av
+                if minimum >= 1:
+                    requirements.extend(cls._required_literals(item, ignore_case))
+            elif op is _ATOMIC_GROUP:
+                requirements.extend(cls._required_literals(av, ignore_case))
+            elif op is sre_parse.BRANCH:
+                alternatives: Set[str] = set()
+                for branch in av[1]:
+                    options = cls._required_literals(branch, ignore_case)
+                    if not options:
+                        break
+                    alternatives.update(max(options, key=lambda o: min(map(len, o))))
+                else:
+                    if len(alternatives) <= cls.MAX_ALTERNATIVES:
+                        requirements.append(tuple(sorted(alternatives)))
+
+        flush()
+        return requirements
+
+    def might_match(self, buffer: bytes) -> bool:
+        """Check whether a buffer holds every required literal.
+
+        Args:
+            buffer: UTF-8 file content.
+
+        Returns:
+            False if the pattern cannot match anywhere in buffer.
+        """
+        for requirement in self.requirements:
+            if isinstance(requirement, tuple):
+                if all(buffer.find(literal) == -1 for literal in requirement):
+                    return False
+            elif requirement.search(buffer) is None:
+                return False
+        return True
+
+
+class TrigramIndex:
+    """Persistent trigram index of file content, updated by file mtime.
+
+    Each indexed file's content is case-folded and split into three-byte
+    trigrams. Every trigram has a posting list of the ids of the files that
+    contain it, stored in SQLite. A content pattern is reduced to the
+    literals every match must contain, and only files holding all of a
+    literal's trigrams are candidates. Files that could not be indexed are
+    always candidates, and patterns without a usable literal fall back to a
+    full scan.
+
+    Posting lists are only appended to. A changed file is indexed under a
+    new id and its old id goes stale; stale ids drop out of queries because
+    they no longer name a file, and are compacted away once they outnumber
+    live files.
+    """
+
+    # Non-ASCII characters that str patterns match case-insensitively for
+    # ASCII letters, as UTF-8 bytes, with the letter they fold to
+    CASE_FOLDS = [
+        (b"\xc4\xb0", b"i"),
+        (b"\xc4\xb1", b"i"),
+        (b"\xe2\x84\xaa", b"k"),
+        (b"\xc5\xbf", b"s"),
+    ]
+
+    # Posting list item type: unsigned 32-bit file ids
+    ID_TYPECODE = "I"
+
+    # Postings buffered in memory before they are written out
+    FLUSH_POSTINGS = 2000000
+
+    # Stale ids tolerated before compacting, beyond one per live file
+    MIN_STALE_TO_COMPACT = 1000
+
+    # Most file ids bound into one SQL statement
+    SQL_BATCH_SIZE = 500
+
+    def __init__(self, database_path: Path, max_file_size: int = 10485760) -> None:
+        """Initialize TrigramIndex.
+
+        Args:
+            database_path: Path to SQLite database file.
+            max_file_size: Files larger than this are not indexed.
+        """
+        self.database_path = database_path
+        self.database_path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_file_size = max_file_size
+        self.conn = sqlite3.connect(str(self.database_path))
+        self._pending: Dict[bytes, array] = {}
+        self._pending_count = 0
+        self._init_database()
+
+    def _init_database(self) -> None:
+        """Initialize database schema."""
+        cursor = self.conn.cursor()
+
+        cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS files (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                path TEXT NOT NULL UNIQUE,
+                size INTEGER NOT NULL,
+                mtime_ns INTEGER NOT NULL,
+                indexed INTEGER NOT NULL
+            )
+            """
+        )
+        cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS postings (
+                trigram BLOB PRIMARY KEY,
+                file_ids BLOB NOT NULL
+            ) WITHOUT ROWID
+            """
+        )
+        cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS metadata (
+                key TEXT PRIMARY KEY,
+                value INTEGER NOT NULL
+            )
+            """
+        )
+        cursor.execute(
+            "INSERT OR IGNORE INTO metadata (key, value) VALUES ('stale_ids', 0)"
+        )
+
+        self.conn.commit()
+        logger.debug(f"Trigram index initialized at {self.database_path}")
+
+    @classmethod
+    def _fold(cls, data: bytes) -> bytes:
+        """Case-fold UTF-8 bytes for indexing and querying.
+
+        Args:
+            data: UTF-8 bytes.
+
+        Returns:
+            Bytes with ASCII letters lowercased and the non-ASCII characters
+            that match them case-insensitively replaced by them.
+        """
+        data = data.lower()
+        for variant, letter in cls.CASE_FOLDS:
+            data = data.replace(variant, letter)
+        return data
+
+    @staticmethod
+    def _trigrams(data: bytes) -> Set[bytes]:
+        """Return the distinct trigrams of folded bytes.
+
+        Args:
+            data: Folded bytes.
+
+        Returns:
+            Set of three-byte strings.
+        """
+        return {data[i : i + 3] for i in range(len(data) - 2)}
+
+    def _read_trigrams(self, file_path: Path, size: int) -> Optional[Set[bytes]]:
+        """Read a file and return its trigrams.
+
+        Args:
+            file_path: Path to file.
+            size: Size of the file in bytes.
+
+        Returns:
+            Set of trigrams, or None if the file is too large, binary or
+            unreadable and so cannot be indexed.
+        """
+        if size > self.max_file_size:
+            return None
+
+        try:
+            with open(file_path, "rb") as f:
+                data = f.read()
+        except OSError as e:
+            logger.warning(f"Could not index {file_path}: {e}")
+            return None
+
+        if b"\x00" in data[:8192]:
+            return None
+
+        return self._trigrams(self._fold(data))
+
+    def update(self, file_paths: List[Path], root: Path) -> Dict[str, int]:
+        """Bring the index up to date for the files of one search.
+
+        Files whose size and mtime match the index are left alone. Index
+        entries under root whose file no longer exists are removed.
+
+        Args:
+            file_paths: Files found by the search.
+            root: Directory that was searched.
+
+        Returns:
+            Dictionary with counts of files indexed and removed.
+        """
+        prefix = os.path.join(os.path.abspath(root), "")
+        known = {
+            path: (file_id, size, mtime_ns)
+            for file_id, path, size, mtime_ns in self.conn.execute(
+                "SELECT id, path, size, mtime_ns FROM files "
+                "WHERE substr(path, 1, ?) = ?",
+                (len(prefix), prefix),
+            )
+        }
+
+        indexed = stale = 0
+        seen = set()
+        for file_path in file_paths:
+            path = os.path.abspath(file_path)
+            seen.add(path)
+            try:
+                stat = file_path.stat()
+            except OSError as e:
+                logger.warning(f"Could not stat {file_path}: {e}")
+                continue
+
+            entry = known.get(path)
+            if entry is not None and entry[1:] == (stat.st_size, stat.st_mtime_ns):
+                continue
+
+            if entry is not None:
+                self.conn.execute("DELETE FROM files WHERE id = ?", (entry[0],))
+                stale += 1
+
+            trigrams = self._read_trigrams(file_path, stat.st_size)
+            cursor = self.conn.execute(
+                "INSERT INTO files (path, size, mtime_ns, indexed) VALUES (?, ?, ?, ?)",
+                (path, stat.st_size, stat.st_mtime_ns, int(trigrams is not None)),
+            )
+            for trigram in trigrams or ():
+                postings = self._pending.get(trigram)
+                if postings is None:
+                    postings = self._pending[trigram] = array(self.ID_TYPECODE)
+                postings.append(cursor.lastrowid)
+            self._pending_count += len(trigrams or ())
+            if self._pending_count >= self.FLUSH_POSTINGS:
+                self._flush()
+            indexed += 1
+
+        removed = 0
+        for path, (file_id, _, _) in known.items():
+            if path not in seen and not os.path.exists(path):
+                self.conn.execute("DELETE FROM files WHERE id = ?", (file_id,))
+                removed += 1
+
+        self._flush()
+        self.conn.execute(
+            "UPDATE metadata SET value = value + ? WHERE key = 'stale_ids'",
+            (stale + removed,),
+        )
+        self.conn.commit()
+        self._compact_if_stale()
+
+        if indexed or removed:
+            logger.info(
+                f"Trigram index updated: {indexed} file(s) indexed, {removed} removed"
+            )
+        return {"indexed": indexed, "removed": removed}
+
+    def _flush(self) -> None:
+        """Append buffered file ids to their trigrams' posting lists."""
+        if not self._pending:
+            return
+
+        trigrams = list(self._pending)
+        for start in range(0, len(trigrams), self.SQL_BATCH_SIZE):
+            batch = trigrams[start : start + self.SQL_BATCH_SIZE]
+            placeholders = ", ".join("?" * len(batch))
+            existing = dict(
+                self.conn.execute(
+                    "SELECT trigram, file_ids FROM postings "
+                    f"WHERE trigram IN ({placeholders})",
+                    batch,
+                )
+            )
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO postings (trigram, file_ids) VALUES (?, ?)",
+                (
+                    (
+                        trigram,
+                        existing.get(trigram, b"") + self._pending[trigram].tobytes(),
+                    )
+                    for trigram in batch
+                ),
+            )
+
+        self._pending.clear()
+        self._pending_count = 0
+
+    def _compact_if_stale(self) -> None:
+        """Drop stale ids from posting lists once they outnumber live files."""
+        stale = self.conn.execute(
+            "SELECT value FROM metadata WHERE key = 'stale_ids'"
+        ).fetchone()[0]
+        live = self.conn.execute("SELECT COUNT(*) FROM files").fetchone()[0]
+        if stale <= max(live, self.MIN_STALE_TO_COMPACT):
+            return
+
+        logger.info(f"Compacting trigram index ({stale} stale file ids)")
+        live_ids = {row[0] for row in self.conn.execute("SELECT id FROM files")}
+        rewritten = []
+        for trigram, file_ids in self.conn.execute(
+            "SELECT trigram, file_ids FROM postings"
+        ):
+            postings = self._unpack(file_ids)
+            kept = array(self.ID_TYPECODE, (i for i in postings if i in live_ids))
+            if len(kept) != len(postings):
+                rewritten.append((trigram, kept.tobytes()))
+
+        self.conn.executemany(
+            "UPDATE postings SET file_ids = ? WHERE trigram = ?",
+            ((file_ids, trigram) for trigram, file_ids in rewritten),
+        )
+        self.conn.execute("DELETE FROM postings WHERE file_ids = x''")
+        self.conn.execute("UPDATE metadata SET value = 0 WHERE key = 'stale_ids'")
+        self.conn.commit()
+
+    def _unpack(self, file_ids: bytes) -> array:
+        """Unpack a stored posting list.
+
+        Args:
+            file_ids: Packed posting list.
+
+        Returns:
+            Array of file ids.
+        """
+        postings = array(self.ID_TYPECODE)
+        postings.frombytes(file_ids)
+        return postings
+
+    def _query_trigrams(self, literal: str, ignore_case: bool) -> Optional[Set[bytes]]:
+        """Return the trigrams that text matching a literal must contain.
+
+        Args:
+            literal: Literal text required by the pattern.
+            ignore_case: Whether the pattern ignores case.
+
+        Returns:
+            Set of trigrams, or None if the literal yields none. Trigrams with
+            non-ASCII bytes are dropped when case is ignored, since their
+            case variants are not folded in the index.
+        """
+        trigrams = self._trigrams(self._fold(literal.encode("utf-8")))
+        if ignore_case:
+            trigrams = {trigram for trigram in trigrams if trigram.isascii()}
+        return trigrams or None
+
+    def _file_ids_with(self, trigrams: Set[bytes]) -> Set[int]:
+        """Return ids of indexed files that contain every trigram.
+
+        Args:
+            trigrams: Trigrams to look up.
+
+        Returns:
+            Set of file ids, possibly including stale ones.
+        """
+        file_ids: Optional[Set[int]] = None
+        for trigram in trigrams:
+            row = self.conn.execute(
+                "SELECT file_ids FROM postings WHERE trigram = ?", (trigram,)
+            ).fetchone()
+            postings = set(self._unpack(row[0])) if row else set()
+            file_ids = postings if file_ids is None else file_ids & postings
+            if not file_ids:
+                break
+        return file_ids or set()
+
+    def candidates(self, pattern: str, flags: int = 0) -> Optional[Set[str]]:
+        """Return paths of files that may contain a match for a pattern.
+
+        Args:
+            pattern: Regex pattern to match.
+            flags: Flags the pattern is searched with.
+
+        Returns:
+            Set of absolute paths, or None if the pattern cannot be narrowed
+            by the index and every file must be scanned.
+        """
+        try:
+            parsed = sre_parse.parse(pattern, flags)
+        except re.error:
+            return None
+
+        ignore_case = bool(parsed.state.flags & re.IGNORECASE)
+        file_ids: Optional[Set[int]] = None
+
+        for literals in LiteralPrefilter._required_literals(parsed, ignore_case):
+            queries = [self._query_trigrams(text, ignore_case) for text in literals]
+            if not all(queries):
+                continue
+
+            matching: Set[int] = set()
+            for trigrams in queries:
+                matching |= self._file_ids_with(trigrams)
+            file_ids = matching if file_ids is None else file_ids & matching
+
+        if file_ids is None:
+            return None
+
+        paths = {
+            row[0]
+            for row in self.conn.execute("SELECT path FROM files WHERE indexed = 0")
+        }
+        ids = sorted(file_ids)
+        for start in range(0, len(ids), self.SQL_BATCH_SIZE):
+            batch = ids[start : start + self.SQL_BATCH_SIZE]
+            placeholders = ", ".join("?" * len(batch))
+            paths.update(
+                row[0]
+                for row in self.conn.execute(
+                    f"SELECT path FROM files WHERE id IN ({placeholders})", batch
+                )
+            )
+        return paths
+
+    def close(self) -> None:
+        """Commit pending writes and close the database."""
+        self.conn.commit()
+        self.conn.close()
+
 
 class RegexFileFinder:
     """Finds files matching regex patterns in names or content."""
@@ -37,9 +611,13 @@ class RegexFileFinder:
         self.config = self._load_config(config_path)
         self._setup_logging()
         self.matched_files: List[Dict[str, Any]] = []
+        self._prefilters: Dict[Tuple[str, int], Optional[LiteralPrefilter]] = {}
+        self.trigram_index = self._open_trigram_index()
         self.stats = {
             "files_scanned": 0,
             "files_matched": 0,
+            "files_prefiltered": 0,
+            "files_skipped_by_index": 0,
             "files_moved": 0,
             "files_copied": 0,
             "errors": 0,
@@ -124,6 +702,25 @@ class RegexFileFinder:
 
         logger.info("Logging configured successfully")
 
+    def _open_trigram_index(self) -> Optional[TrigramIndex]:
+        """Open the trigram index if it is enabled in configuration.
+
+        Returns:
+            TrigramIndex, or None if disabled.
+        """
+        search_config = self.config.get("search", {})
+        index_config = search_config.get("trigram_index", {})
+        if not index_config.get("enabled", False):
+            return None
+
+        index_path = Path(index_config.get("file", "trigram_index.db"))
+        if not index_path.is_absolute():
+            index_path = Path(__file__).parent.parent / index_path
+
+        return TrigramIndex(
+            index_path, max_file_size=search_config.get("max_file_size", 10485760)
+        )
+
     def _validate_path(self, path: Path) -> bool:
         """Validate that path exists and is accessible.
 
@@ -226,24 +823,32 @@ class RegexFileFinder:
             logger.warning(f"Could not get file size for {file_path}: {e}")
             return False
 
-        # Check if file is binary
+        search_config = self.config.get("search", {})
+        flags = self._content_flags()
+        prefilter = self._get_prefilter(pattern, flags)
+
+        # Check if file is binary, then skip it if it lacks the literals
+        # every match of the pattern contains
         try:
             with open(file_path, "rb") as f:
                 chunk = f.read(8192)
                 if b"\x00" in chunk:
                     logger.debug(f"Skipping binary file: {file_path}")
                     return False
+                if prefilter is not None and not prefilter.might_match(
+                    chunk + f.read()
+                ):
+                    logger.debug(f"Required literals not in file: {file_path}")
+                    self.stats["files_prefiltered"] += 1
+                    return False
         except (OSError, PermissionError) as e:
             logger.warning(f"Could not read file {file_path}: {e}")
             return False
 
         # Try to read and search content
         try:
-            encoding = self.config.get("search", {}).get("encoding", "utf-8")
+            encoding = search_config.get("encoding", "utf-8")
             with open(file_path, "r", encoding=encoding, errors="ignore") as f:
-                flags = re.IGNORECASE if self.config.get("search", {}).get("case_sensitive", False) is False else 0
-                flags |= re.MULTILINE
-                
                 # Read in chunks for large files
                 chunk_size = 8192
                 buffer = ""
@@ -269,6 +874,83 @@ class RegexFileFinder:
 
         return False
 
+    def _content_flags(self) -> int:
+        """Return the regex flags content patterns are searched with.
+
+        Returns:
+            IGNORECASE unless case_sensitive is set, combined with MULTILINE.
+        """
+        case_sensitive = self.config.get("search", {}).get("case_sensitive", False)
+        flags = re.IGNORECASE if case_sensitive is False else 0
+        return flags | re.MULTILINE
+
+    def _content_is_utf8(self) -> bool:
+        """Check whether file contents are decoded as UTF-8.
+
+        The literal prefilter and the trigram index work on raw bytes, which
+        only match the pattern's text when contents are read as UTF-8.
+
+        Returns:
+            True if search.encoding resolves to UTF-8.
+        """
+        encoding = self.config.get("search", {}).get("encoding", "utf-8")
+        try:
+            return codecs.lookup(encoding).name == "utf-8"
+        except LookupError:
+            return False
+
+    def _get_prefilter(self, pattern: str, flags: int) -> Optional[LiteralPrefilter]:
+        """Get the literal prefilter for a content pattern.
+
+        Prefilters are built once per pattern and flags. Files are checked
+        as raw bytes, so none is used unless content is read as UTF-8.
+
+        Args:
+            pattern: Regex pattern to match.
+            flags: Flags the pattern is searched with.
+
+        Returns:
+            Prefilter, or None if disabled or the pattern has no usable literal.
+        """
+        if not self.config.get("search", {}).get("literal_prefilter", True):
+            return None
+        if not self._content_is_utf8():
+            return None
+
+        key = (pattern, flags)
+        if key not in self._prefilters:
+            self._prefilters[key] = LiteralPrefilter.from_pattern(pattern, flags)
+        return self._prefilters[key]
+
+    def _index_candidates(
+        self, pattern: str, search_dir: Path, file_paths: List[Path]
+    ) -> Optional[Set[str]]:
+        """Update the trigram index and narrow a content search with it.
+
+        Args:
+            pattern: Regex pattern to match.
+            search_dir: Directory being searched.
+            file_paths: Files that will be searched.
+
+        Returns:
+            Absolute paths of candidate files, or None if every file must be
+            searched (always, unless contents are read as UTF-8).
+        """
+        if self.trigram_index is None or not self._content_is_utf8():
+            return None
+
+        try:
+            self.trigram_index.update(file_paths, search_dir)
+            candidates = self.trigram_index.candidates(pattern, self._content_flags())
+        except sqlite3.Error as e:
+            logger.warning(f"Trigram index unavailable, scanning all files: {e}")
+            self.stats["errors"] += 1
+            return None
+
+        if candidates is None:
+            logger.info("Pattern cannot be narrowed by the trigram index")
+        return candidates
+
     def find_files(
         self,
         pattern: str,
@@ -318,6 +1000,8 @@ class RegexFileFinder:
         self.matched_files = []
         self.stats["files_scanned"] = 0
         self.stats["files_matched"] = 0
+        self.stats["files_prefiltered"] = 0
+        self.stats["files_skipped_by_index"] = 0
 
         # Compile pattern once for efficiency
         try:
@@ -332,6 +1016,7 @@ class RegexFileFinder:
         else:
             iterator = search_dir.glob("*")
 
+        file_paths = []
         for item_path in iterator:
             if not item_path.is_file():
                 continue
@@ -342,6 +1027,13 @@ class RegexFileFinder:
             if self._is_excluded(item_path):
                 continue
 
+            file_paths.append(item_path)
+
+        candidates = None
+        if search_in in ["content", "both"]:
+            candidates = self._index_candidates(pattern, search_dir, file_paths)
+
+        for item_path in file_paths:
             matched = False
             match_type = None
 
@@ -351,9 +1043,12 @@ class RegexFileFinder:
                     matched = True
                     match_type = "name"
 
-            # Search in content
+            # Search in content, unless the index rules the file out
             if not matched and search_in in ["content", "both"]:
-                if self._matches_content_pattern(item_path, pattern):
+                path = os.path.abspath(item_path)
+                if candidates is not None and path not in candidates:
+                    self.stats["files_skipped_by_index"] += 1
+                elif self._matches_content_pattern(item_path, pattern):
                     matched = True
                     match_type = "content" if match_type is None else "both"
 
@@ -584,6 +1279,12 @@ class RegexFileFinder:
         """
         return self.stats.copy()
 
+    def close(self) -> None:
+        """Close the trigram index, if open."""
+        if self.trigram_index is not None:
+            self.trigram_index.close()
+            self.trigram_index = None
+
 
 def main() -> int:
     """Main entry point for regex file finder."""
@@ -683,12 +1384,15 @@ def main() -> int:
         print("\nStatistics:")
         print(f"  Files scanned: {stats['files_scanned']}")
         print(f"  Files matched: {stats['files_matched']}")
+        if finder.trigram_index is not None:
+            print(f"  Files skipped by index: {stats['files_skipped_by_index']}")
         if args.action == "copy":
             print(f"  Files copied: {stats['files_copied']}")
         elif args.action == "move":
             print(f"  Files moved: {stats['files_moved']}")
         print(f"  Errors: {stats['errors']}")
 
+        finder.close()
         return 0
 
     except FileNotFoundError as e:
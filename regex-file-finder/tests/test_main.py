@@ -1,5 +1,7 @@
 """Unit tests for Regex File Finder."""
 
+import os
+import re
 import tempfile
 from pathlib import Path
 from unittest.mock import Mock, patch
@@ -7,7 +9,7 @@ from unittest.mock import Mock, patch
 import pytest
 import yaml
 
-from src.main import RegexFileFinder
+from src.main import RegexFileFinder, TrigramIndex
 
 
 @pytest.fixture
@@ -113,6 +115,33 @@ class TestRegexFileFinder:
         assert finder._matches_content_pattern(test_file, r"TODO") is True
         assert finder._matches_content_pattern(test_file, r"FIXME") is False
 
+    def test_matches_content_pattern_prefilter(self, temp_config_file, tmp_path):
+        """Test that files lacking required literals skip the regex."""
+        finder = RegexFileFinder(config_path=temp_config_file)
+        hit_file = tmp_path / "hit.py"
+        hit_file.write_text("def on_click_handler(event):\n    pass\n")
+        miss_file = tmp_path / "miss.py"
+        miss_file.write_text("def on_click(event):\n    pass\n")
+        pattern = r"def\s+\w+_HANDLER\("
+
+        assert finder._matches_content_pattern(hit_file, pattern) is True
+        with patch("src.main.re.search") as mock_search:
+            assert finder._matches_content_pattern(miss_file, pattern) is False
+            mock_search.assert_not_called()
+        assert finder.stats["files_prefiltered"] == 1
+
+    def test_matches_content_pattern_prefilter_disabled(
+        self, temp_config_file, tmp_path
+    ):
+        """Test that the prefilter can be turned off."""
+        finder = RegexFileFinder(config_path=temp_config_file)
+        finder.config["search"]["literal_prefilter"] = False
+        test_file = tmp_path / "test.txt"
+        test_file.write_text("nothing here")
+
+        assert finder._matches_content_pattern(test_file, r"FIXME") is False
+        assert finder.stats["files_prefiltered"] == 0
+
     def test_is_excluded_by_directory(self, temp_config_file):
         """Test directory exclusion."""
         finder = RegexFileFinder(config_path=temp_config_file)
@@ -304,3 +333,118 @@ class TestRegexFileFinder:
 
         result = finder._matches_content_pattern(large_file, r"x")
         assert result is False
+
+
+class TestTrigramIndex:
+    """Test cases for TrigramIndex."""
+
+    def test_candidates_narrow_by_literal(self, tmp_path):
+        """Test that only files holding the pattern's literals are candidates."""
+        root = tmp_path / "repo"
+        root.mkdir()
+        (root / "a.py").write_text("def on_click_handler(event):\n")
+        (root / "b.py").write_text("def on_click(event):\n")
+        index = TrigramIndex(tmp_path / "index.db")
+        index.update(sorted(root.iterdir()), root)
+
+        candidates = index.candidates(r"def\s+\w+_HANDLER\(", re.IGNORECASE)
+
+        assert candidates == {str(root / "a.py")}
+        assert index.candidates(r"\w+\(", 0) is None
+        index.close()
+
+    def test_update_is_incremental(self, tmp_path):
+        """Test that changed files are reindexed and deleted files removed."""
+        root = tmp_path / "repo"
+        root.mkdir()
+        changed = root / "changed.txt"
+        changed.write_text("nothing yet")
+        deleted = root / "deleted.txt"
+        deleted.write_text("FIXME later")
+        kept = root / "kept.txt"
+        kept.write_text("unchanged")
+        index = TrigramIndex(tmp_path / "index.db")
+
+        assert index.update([changed, deleted, kept], root)["indexed"] == 3
+
+        changed.write_text("FIXME now")
+        os.utime(changed, ns=(0, 10**9))
+        deleted.unlink()
+        result = index.update([changed, kept], root)
+
+        assert result == {"indexed": 1, "removed": 1}
+        assert index.candidates("FIXME") == {str(changed)}
+        index.close()
+
+
+    def test_stale_ids_are_compacted(self, tmp_path, monkeypatch):
+        """Test that reindexed files' old ids are dropped from posting lists."""
+        monkeypatch.setattr(TrigramIndex, "MIN_STALE_TO_COMPACT", 0)
+        root = tmp_path / "repo"
+        root.mkdir()
+        note = root / "note.txt"
+        index = TrigramIndex(tmp_path / "index.db")
+
+        for mtime, text in enumerate(["FIXME one", "FIXME two", "FIXME three"], 1):
+            note.write_text(text)
+            os.utime(note, ns=(0, mtime * 10**9))
+            index.update([note], root)
+
+        (file_id,) = index.conn.execute("SELECT id FROM files").fetchone()
+        rows = index.conn.execute("SELECT file_ids FROM postings").fetchall()
+        assert all(set(index._unpack(row[0])) == {file_id} for row in rows)
+        assert index.candidates("FIXME") == {str(note)}
+        index.close()
+
+
+class TestRegexFileFinderTrigramIndex:
+    """Test content search through the trigram index."""
+
+    def test_find_files_with_index(self, sample_config, tmp_path):
+        """Test that indexed content searches match unindexed ones."""
+        sample_config["search"]["trigram_index"] = {
+            "enabled": True,
+            "file": str(tmp_path / "index.db"),
+        }
+        config_path = tmp_path / "config.yaml"
+        with open(config_path, "w", encoding="utf-8") as f:
+            yaml.dump(sample_config, f)
+        root = tmp_path / "repo"
+        root.mkdir()
+        (root / "todo.txt").write_text("TODO: write tests\n")
+        (root / "done.txt").write_text("all done\n")
+        (root / "big.txt").write_text("no literal here\n")
+
+        finder = RegexFileFinder(config_path=str(config_path))
+        files = finder.find_files(r"todo:\s+\w+", str(root), search_in="content")
+
+        assert [Path(f["path"]).name for f in files] == ["todo.txt"]
+        assert finder.get_stats()["files_skipped_by_index"] == 2
+
+        files = finder.find_files(r"\w+:", str(root), search_in="content")
+        assert [Path(f["path"]).name for f in files] == ["todo.txt"]
+        assert finder.get_stats()["files_skipped_by_index"] == 0
+        finder.close()
+
+    def test_find_files_index_bypassed_for_other_encodings(
+        self, sample_config, tmp_path
+    ):
+        """Test that the index is not used unless contents are read as UTF-8."""
+        sample_config["search"].update(
+            encoding="latin-1",
+            case_sensitive=True,
+            trigram_index={"enabled": True, "file": str(tmp_path / "index.db")},
+        )
+        config_path = tmp_path / "config.yaml"
+        with open(config_path, "w", encoding="utf-8") as f:
+            yaml.dump(sample_config, f)
+        root = tmp_path / "repo"
+        root.mkdir()
+        (root / "menu.txt").write_bytes("café menu\n".encode("latin-1"))
+
+        finder = RegexFileFinder(config_path=str(config_path))
+        files = finder.find_files("é menu", str(root), search_in="content")
+
+        assert [Path(f["path"]).name for f in files] == ["menu.txt"]
+        assert finder.get_stats()["files_skipped_by_index"] == 0
+        finder.close()
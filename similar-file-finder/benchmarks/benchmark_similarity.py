@@ -0,0 +1,135 @@
+"""Micro-benchmark for the similar-file-finder edit distance kernels.
+
+Compares the original dynamic programming Levenshtein implementation with
+the bit-parallel kernel (with and without a threshold cutoff) and the NumPy
+batch path, on synthetic file names.
+
+Usage:
+    python benchmarks/benchmark_similarity.py [--names 500] [--threshold 0.8]
+"""
+
+import argparse
+import random
+import string
+import sys
+import time
+from pathlib import Path
+from typing import Callable, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.main import (  # noqa: E402
+    HAS_NUMPY,
+    _myers_distance,
+    levenshtein_distances,
+    max_levenshtein_distance,
+)
+
+
+def reference_levenshtein(str1: str, str2: str) -> int:
+    """Original row-by-row dynamic programming implementation."""
+    str1 = str1.lower()
+    str2 = str2.lower()
+
+    if len(str1) < len(str2):
+        return reference_levenshtein(str2, str1)
+
+    if len(str2) == 0:
+        return len(str1)
+
+    previous_row = range(len(str2) + 1)
+    for i, c1 in enumerate(str1):
+        current_row = [i + 1]
+        for j, c2 in enumerate(str2):
+            insertions = previous_row[j + 1] + 1
+            deletions = current_row[j] + 1
+            substitutions = previous_row[j] + (c1 != c2)
+            current_row.append(min(insertions, deletions, substitutions))
+        previous_row = current_row
+
+    return previous_row[-1]
+
+
+def bit_parallel(str1: str, str2: str, max_distance=None) -> int:
+    """Bit-parallel kernel with the same argument handling as the finder."""
+    str1 = str1.lower()
+    str2 = str2.lower()
+    if len(str1) < len(str2):
+        str1, str2 = str2, str1
+    if max_distance is not None and len(str1) - len(str2) > max_distance:
+        return max_distance + 1
+    if not str2:
+        return len(str1)
+    return _myers_distance(str2, str1, max_distance)
+
+
+def make_names(count: int, seed: int = 42) -> List[str]:
+    """Generate file-name-like strings with shared stems and small edits."""
+    rng = random.Random(seed)
+    alphabet = string.ascii_lowercase + string.digits + "_-"
+    stems = [
+        "".join(rng.choice(alphabet) for _ in range(rng.randint(6, 30)))
+        for _ in range(max(1, count // 5))
+    ]
+    names = []
+    for _ in range(count):
+        name = list(rng.choice(stems))
+        for _ in range(rng.randint(0, 4)):
+            position = rng.randrange(len(name) + 1)
+            name.insert(position, rng.choice(alphabet))
+        names.append("".join(name))
+    return names
+
+
+def time_all_pairs(names: List[str], distance: Callable[[str, str], int]) -> float:
+    """Time scoring every pair of names with a pairwise kernel."""
+    start = time.perf_counter()
+    for i, name in enumerate(names):
+        for other in names[i + 1 :]:
+            distance(name, other)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    """Run the benchmark and print a timing table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--names", type=int, default=500, help="Names to compare")
+    parser.add_argument(
+        "--threshold", type=float, default=0.8, help="Similarity threshold"
+    )
+    args = parser.parse_args()
+
+    names = make_names(args.names)
+    pairs = args.names * (args.names - 1) // 2
+
+    def with_cutoff(str1: str, str2: str) -> int:
+        max_len = max(len(str1), len(str2))
+        return bit_parallel(
+            str1, str2, max_levenshtein_distance(max_len, args.threshold)
+        )
+
+    results = [
+        ("reference DP", time_all_pairs(names, reference_levenshtein)),
+        ("bit-parallel", time_all_pairs(names, bit_parallel)),
+        ("bit-parallel + cutoff", time_all_pairs(names, with_cutoff)),
+    ]
+
+    if HAS_NUMPY:
+        start = time.perf_counter()
+        for i, name in enumerate(names):
+            levenshtein_distances(name, names[i + 1 :])
+        results.append(("numpy batch", time.perf_counter() - start))
+    else:
+        print("NumPy not installed; skipping batch kernel")
+
+    baseline = results[0][1]
+    print(f"{pairs:,} pairs from {args.names} names")
+    for label, elapsed in results:
+        print(
+            f"  {label:<24} {elapsed:8.3f}s  "
+            f"{pairs / elapsed:>12,.0f} pairs/s  {baseline / elapsed:6.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
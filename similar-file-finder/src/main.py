@@ -8,20 +8,181 @@ finding potential duplicates or related files.
 import difflib
 import logging
 import logging.handlers
+import math
 import os
-from collections import defaultdict
+import time
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
 
 import yaml
 from dotenv import load_dotenv
 
+try:
+    import numpy as np
+
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
 # Load environment variables
 load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+# Slack applied to similarity bounds so floating point rounding never prunes
+# a pair that the exact similarity calculation would accept
+BOUND_EPSILON = 1e-9
+
+# Longest query the NumPy batch kernel packs into one uint64 bit vector
+BATCH_MAX_QUERY_LENGTH = 64
+
+# Fewest candidates for which the NumPy batch kernel beats the scalar one
+BATCH_MIN_CANDIDATES = 16
+
+# Most partners of one file scored in a single batch
+SCORE_BATCH_SIZE = 4096
+
+
+def _myers_distance(
+    pattern: str, text: str, max_distance: Optional[int] = None
+) -> int:
+    """Levenshtein distance using the Myers/Hyyrö bit-parallel algorithm.
+
+    Bit i of the vertical delta vectors (pv, mv) tracks whether the edit
+    matrix value rises or falls between rows i and i + 1 of the current
+    column, so each text character advances a full column at once. Python
+    integers grow as needed, so patterns of any length work, although
+    patterns under 64 characters fit a single machine word.
+
+    Args:
+        pattern: Non-empty string encoded as bit vectors (the shorter one).
+        text: String scanned character by character.
+        max_distance: Optional cutoff; max_distance + 1 is returned as soon
+            as the distance is known to exceed it.
+
+    Returns:
+        Levenshtein distance between pattern and text.
+    """
+    length = len(pattern)
+    peq: Dict[str, int] = {}
+    for i, char in enumerate(pattern):
+        peq[char] = peq.get(char, 0) | (1 << i)
+
+    mask = (1 << length) - 1
+    high_bit = 1 << (length - 1)
+    pv = mask
+    mv = 0
+    score = length
+    remaining = len(text)
+
+    for char in text:
+        eq = peq.get(char, 0)
+        xv = eq | mv
+        xh = (((eq & pv) + pv) ^ pv) | eq
+        ph = mv | ~(xh | pv)
+        mh = pv & xh
+        if ph & high_bit:
+            score += 1
+        elif mh & high_bit:
+            score -= 1
+        ph = (ph << 1) | 1
+        mh <<= 1
+        pv = (mh | ~(xv | ph)) & mask
+        mv = ph & xv & mask
+
+        # Each remaining character can lower the final score by at most one
+        remaining -= 1
+        if max_distance is not None and score - remaining > max_distance:
+            return max_distance + 1
+
+    return score
+
+
+def max_levenshtein_distance(max_len: int, threshold: float) -> int:
+    """Largest edit distance that still reaches a similarity threshold.
+
+    Args:
+        max_len: Length of the longer string.
+        threshold: Levenshtein similarity threshold.
+
+    Returns:
+        Distance cutoff for 1 - distance / max_len >= threshold.
+    """
+    return max(0, int(math.floor((1.0 - threshold) * max_len + BOUND_EPSILON)))
+
+
+def levenshtein_distances(query: str, candidates: List[str]) -> List[int]:
+    """Levenshtein distance from one string to many, case-insensitively.
+
+    With NumPy available and a query of at most 64 characters, every
+    candidate is processed at once: the bit-parallel state of each
+    candidate lives in a uint64 array and one vectorized step is taken per
+    candidate character position. Otherwise each pair is scored with the
+    scalar bit-parallel kernel.
+
+    Args:
+        query: String compared with every candidate.
+        candidates: Strings to compare with the query.
+
+    Returns:
+        Distances in candidate order.
+    """
+    query = query.lower()
+    lowered = [candidate.lower() for candidate in candidates]
+
+    if (
+        not HAS_NUMPY
+        or not query
+        or len(query) > BATCH_MAX_QUERY_LENGTH
+        or len(lowered) < BATCH_MIN_CANDIDATES
+    ):
+        return [
+            _myers_distance(query, candidate) if query else len(candidate)
+            for candidate in lowered
+        ]
+
+    # Characters absent from the query share code 0, whose match mask is 0
+    codes = {char: code for code, char in enumerate(dict.fromkeys(query), 1)}
+    peq = np.zeros(len(codes) + 1, dtype=np.uint64)
+    for i, char in enumerate(query):
+        peq[codes[char]] |= np.uint64(1 << i)
+
+    lengths = np.array([len(candidate) for candidate in lowered], dtype=np.int64)
+    width = int(lengths.max()) if len(lowered) else 0
+    text = np.zeros((len(lowered), width), dtype=np.int64)
+    for row, candidate in enumerate(lowered):
+        text[row, : len(candidate)] = [codes.get(char, 0) for char in candidate]
+
+    length = len(query)
+    mask = np.uint64((1 << length) - 1)
+    high_bit = np.uint64(1 << (length - 1))
+    one = np.uint64(1)
+    zero = np.uint64(0)
+    pv = np.full(len(lowered), mask, dtype=np.uint64)
+    mv = np.zeros(len(lowered), dtype=np.uint64)
+    score = np.full(len(lowered), length, dtype=np.int64)
+
+    for column in range(width):
+        active = lengths > column
+        eq = peq[text[:, column]]
+        xv = eq | mv
+        xh = (((eq & pv) + pv) ^ pv) | eq
+        ph = mv | ~(xh | pv)
+        mh = pv & xh
+        step = (ph & high_bit != zero).astype(np.int64) - (
+            mh & high_bit != zero
+        ).astype(np.int64)
+        score += np.where(active, step, 0)
+        ph = (ph << one) | one
+        mh = mh << one
+        pv = np.where(active, (mh | ~(xv | ph)) & mask, pv)
+        mv = np.where(active, ph & xv & mask, mv)
+
+    return score.tolist()
+
 
 class SimilarFileFinder:
     """Finds files with similar names using string similarity algorithms."""
@@ -40,13 +201,27 @@ class SimilarFileFinder:
         self._setup_logging()
         self.files: List[Dict[str, Any]] = []
         self.similar_pairs: List[Dict[str, Any]] = []
+        self.shard_timings: List[Dict[str, Any]] = []
         self.stats = {
             "files_scanned": 0,
             "similar_pairs_found": 0,
             "directories_scanned": 0,
+            "pairs_compared": 0,
             "errors": 0,
         }
 
+    def __getstate__(self) -> Dict[str, Any]:
+        """Return picklable state for worker processes.
+
+        Workers only need the configuration to score pairs, so the scanned
+        file list and results are not copied into every process.
+        """
+        state = self.__dict__.copy()
+        state["files"] = []
+        state["similar_pairs"] = []
+        state["shard_timings"] = []
+        return state
+
     def _load_config(self, config_path: str) -> dict:
         """Load configuration from YAML file.
 
@@ -130,12 +305,21 @@ class SimilarFileFinder:
         """
         return difflib.SequenceMatcher(None, str1.lower(), str2.lower()).ratio()
 
-    def _levenshtein_distance(self, str1: str, str2: str) -> int:
+    def _levenshtein_distance(
+        self, str1: str, str2: str, max_distance: Optional[int] = None
+    ) -> int:
         """Calculate Levenshtein distance between two strings.
 
+        Uses the bit-parallel Myers/Hyyrö algorithm: the shorter string is
+        encoded as bit vectors and each character of the longer string
+        updates a whole column of the edit matrix in a few integer
+        operations.
+
         Args:
             str1: First string.
             str2: Second string.
+            max_distance: Optional cutoff. Once the distance is known to
+                exceed it, max_distance + 1 is returned immediately.
 
         Returns:
             Levenshtein distance (number of edits needed).
@@ -144,29 +328,27 @@ class SimilarFileFinder:
         str2 = str2.lower()
 
         if len(str1) < len(str2):
-            return self._levenshtein_distance(str2, str1)
+            str1, str2 = str2, str1
+
+        if max_distance is not None and len(str1) - len(str2) > max_distance:
+            return max_distance + 1
 
         if len(str2) == 0:
             return len(str1)
 
-        previous_row = range(len(str2) + 1)
-        for i, c1 in enumerate(str1):
-            current_row = [i + 1]
-            for j, c2 in enumerate(str2):
-                insertions = previous_row[j + 1] + 1
-                deletions = current_row[j] + 1
-                substitutions = previous_row[j] + (c1 != c2)
-                current_row.append(min(insertions, deletions, substitutions))
-            previous_row = current_row
-
-        return previous_row[-1]
+        return _myers_distance(str2, str1, max_distance)
 
-    def _levenshtein_similarity(self, str1: str, str2: str) -> float:
+    def _levenshtein_similarity(
+        self, str1: str, str2: str, threshold: Optional[float] = None
+    ) -> float:
         """Calculate similarity based on Levenshtein distance.
 
         Args:
             str1: First string.
             str2: Second string.
+            threshold: Optional similarity threshold. Pairs that cannot reach
+                it stop early and get a score below the threshold instead of
+                their exact similarity.
 
         Returns:
             Similarity ratio between 0.0 and 1.0.
@@ -175,9 +357,32 @@ class SimilarFileFinder:
         if max_len == 0:
             return 1.0
 
-        distance = self._levenshtein_distance(str1, str2)
+        max_distance = None
+        if threshold is not None:
+            max_distance = max_levenshtein_distance(max_len, threshold)
+
+        distance = self._levenshtein_distance(str1, str2, max_distance)
         return 1.0 - (distance / max_len)
 
+    def _levenshtein_similarities(
+        self, query: str, candidates: List[str]
+    ) -> List[float]:
+        """Calculate Levenshtein similarity of one string against many.
+
+        Args:
+            query: String scored against every candidate.
+            candidates: Strings to compare with the query.
+
+        Returns:
+            Similarity ratios in candidate order.
+        """
+        distances = levenshtein_distances(query, candidates)
+        similarities = []
+        for candidate, distance in zip(candidates, distances):
+            max_len = max(len(query), len(candidate))
+            similarities.append(1.0 - (distance / max_len) if max_len else 1.0)
+        return similarities
+
     def _jaro_winkler_similarity(self, str1: str, str2: str) -> float:
         """Calculate Jaro-Winkler similarity.
 
@@ -210,13 +415,14 @@ class SimilarFileFinder:
             start = max(0, i - match_window)
             end = min(i + match_window + 1, len2)
 
-            for j in range(start, end):
-                if str2_matches[j] or str1[i] != str2[j]:
-                    continue
+            # str.find scans the window in C; skip positions already matched
+            j = str2.find(str1[i], start, end)
+            while j != -1 and str2_matches[j]:
+                j = str2.find(str1[i], j + 1, end)
+            if j != -1:
                 str1_matches[i] = True
                 str2_matches[j] = True
                 matches += 1
-                break
 
         if matches == 0:
             return 0.0
@@ -249,7 +455,11 @@ class SimilarFileFinder:
         return winkler
 
     def _calculate_similarity(
-        self, str1: str, str2: str, algorithm: str = "sequence"
+        self,
+        str1: str,
+        str2: str,
+        algorithm: str = "sequence",
+        threshold: Optional[float] = None,
     ) -> float:
         """Calculate similarity using specified algorithm.
 
@@ -257,6 +467,8 @@ class SimilarFileFinder:
             str1: First string.
             str2: Second string.
             algorithm: Algorithm to use ('sequence', 'levenshtein', 'jaro_winkler').
+            threshold: Optional threshold that allows Levenshtein to stop
+                early on pairs that cannot reach it.
 
         Returns:
             Similarity ratio between 0.0 and 1.0.
@@ -264,7 +476,7 @@ class SimilarFileFinder:
         if algorithm == "sequence":
             return self._sequence_similarity(str1, str2)
         elif algorithm == "levenshtein":
-            return self._levenshtein_similarity(str1, str2)
+            return self._levenshtein_similarity(str1, str2, threshold)
         elif algorithm == "jaro_winkler":
             return self._jaro_winkler_similarity(str1, str2)
         else:
@@ -314,10 +526,12 @@ class SimilarFileFinder:
 
         self.files = []
         self.similar_pairs = []
+        self.shard_timings = []
         self.stats = {
             "files_scanned": 0,
             "similar_pairs_found": 0,
             "directories_scanned": 0,
+            "pairs_compared": 0,
             "errors": 0,
         }
 
@@ -367,15 +581,489 @@ class SimilarFileFinder:
             extra=self.stats,
         )
 
+    def _required_overlap(
+        self, len1: int, len2: int, algorithm: str, threshold: float
+    ) -> int:
+        """Minimum shared characters two names need to reach the threshold.
+
+        Every algorithm only credits identical characters, so the number of
+        matched characters is at most the multiset character overlap of the
+        two (lowercased) names. This returns the smallest overlap for which
+        the algorithm's upper bound still reaches the threshold.
+
+        Args:
+            len1: Length of the shorter name.
+            len2: Length of the longer name.
+            algorithm: Similarity algorithm.
+            threshold: Similarity threshold.
+
+        Returns:
+            Minimum character overlap (0 means no pruning is possible).
+        """
+        if algorithm == "levenshtein":
+            # distance >= len2 - overlap
+            required = threshold * len2
+        elif algorithm == "jaro_winkler":
+            # jaro <= (m/len1 + m/len2 + 1) / 3 and the Winkler prefix
+            # bonus adds at most 0.4 * (1 - jaro); zero matches scores 0.0
+            required = (5 * threshold - 3) * len1 * len2 / (len1 + len2)
+            if threshold > 0:
+                required = max(required, 1)
+        else:
+            # ratio = 2 * matches / (len1 + len2)
+            required = threshold * (len1 + len2) / 2
+
+        return max(0, math.ceil(required - BOUND_EPSILON))
+
+    def _jaro_winkler_may_reach(
+        self, str1: str, str2: str, overlap: int, threshold: float
+    ) -> bool:
+        """Check the Jaro-Winkler upper bound using the actual common prefix.
+
+        Args:
+            str1: First lowercased name.
+            str2: Second lowercased name.
+            overlap: Multiset character overlap of the names.
+            threshold: Similarity threshold.
+
+        Returns:
+            False if the pair cannot reach the threshold.
+        """
+        prefix_len = 0
+        for c1, c2 in zip(str1[:4], str2[:4]):
+            if c1 != c2:
+                break
+            prefix_len += 1
+
+        jaro = (overlap / len(str1) + overlap / len(str2) + 1) / 3.0
+        bound = jaro + 0.1 * prefix_len * (1 - jaro)
+        return bound >= threshold - BOUND_EPSILON
+
+    def _min_partner_length(self, length: int, algorithm: str, threshold: float) -> int:
+        """Shortest name that can reach the threshold against a longer name.
+
+        Args:
+            length: Length of the longer name.
+            algorithm: Similarity algorithm.
+            threshold: Similarity threshold.
+
+        Returns:
+            Minimum length of the shorter name.
+        """
+        if algorithm == "levenshtein":
+            bound = threshold * length
+        elif algorithm == "jaro_winkler":
+            bound = (5 * threshold - 4) * length
+        else:
+            bound = threshold * length / (2 - threshold)
+
+        return max(0, math.ceil(bound - BOUND_EPSILON))
+
+    def _all_rows(
+        self, count: int, start: int = 0, stop: Optional[int] = None
+    ) -> Iterator[Tuple[int, Sequence[int]]]:
+        """Yield every pair of ``count`` files, one row per file.
+
+        Args:
+            count: Number of files.
+            start: First row to yield.
+            stop: Row to stop before (default: all rows).
+
+        Yields:
+            (i, partners) with partners the range of indexes after i.
+        """
+        for i in range(start, count if stop is None else min(stop, count)):
+            yield i, range(i + 1, count)
+
+    def _candidate_rows(
+        self,
+        names: List[str],
+        algorithm: str,
+        threshold: float,
+        start: int = 0,
+        stop: Optional[int] = None,
+    ) -> Iterator[Tuple[int, Sequence[int]]]:
+        """Generate, one file at a time, the partners that can reach the threshold.
+
+        Uses prefix filtering over character tokens: names are tokenized into
+        (character, occurrence) tokens ordered by global rarity, and two names
+        whose overlap reaches the required minimum must share a token within
+        their short prefixes. Only prefix tokens are put in the inverted
+        index, and length-difference and overlap bounds are checked before a
+        partner is yielded. Pruning is exact: no pair that would score at or
+        above the threshold is dropped.
+
+        Rows are produced lazily, so only the inverted index and the current
+        row are held in memory. Each unordered pair appears in exactly one
+        row, as (i, j) or (j, i). There is one row per name, in a fixed
+        order, and ``start``/``stop`` select a range of rows: earlier rows
+        are still indexed but not probed, so any range can be generated
+        independently.
+
+        Args:
+            names: Names to compare.
+            algorithm: Similarity algorithm.
+            threshold: Similarity threshold.
+            start: First row to yield.
+            stop: Row to stop before (default: all rows).
+
+        Yields:
+            (i, partners) with the sorted indexes that file i is compared with.
+        """
+        count = len(names)
+        lowered = [name.lower() for name in names]
+
+        # Names whose length changes when lowercased (or that are empty) do
+        # not fit the length-based bounds, so they are compared with everyone
+        unsafe = [
+            i
+            for i in range(count)
+            if not lowered[i] or len(lowered[i]) != len(names[i])
+        ]
+        if threshold <= 0 or len(unsafe) == count:
+            yield from self._all_rows(count, start, stop)
+            return
+
+        if stop is None:
+            stop = count
+
+        unsafe_set = set(unsafe)
+        for i in unsafe[start:stop]:
+            yield i, [j for j in range(count) if j not in unsafe_set or j > i]
+        if stop <= len(unsafe):
+            return
+
+        safe = [i for i in range(count) if i not in unsafe_set]
+        tokens = {}
+        for i in safe:
+            occurrences: Counter = Counter()
+            tokens[i] = []
+            for char in lowered[i]:
+                tokens[i].append((char, occurrences[char]))
+                occurrences[char] += 1
+        # Multiset character overlap equals the intersection of token sets
+        token_sets = {i: frozenset(tokens[i]) for i in safe}
+
+        frequency: Counter = Counter()
+        for i in safe:
+            frequency.update(tokens[i])
+        for i in safe:
+            tokens[i].sort(key=lambda token: (frequency[token], token))
+
+        inverted: Dict[Tuple[str, int], List[int]] = defaultdict(list)
+
+        ordered = sorted(safe, key=lambda idx: len(lowered[idx]))
+        for row, i in enumerate(ordered, len(unsafe)):
+            if row >= stop:
+                break
+
+            length = len(lowered[i])
+
+            # Rows before the range are only indexed, for the rows after them
+            if row >= start:
+                min_length = self._min_partner_length(length, algorithm, threshold)
+
+                # Probe with the prefix needed against the least demanding partner
+                probe_overlap = self._required_overlap(
+                    max(min_length, 1), length, algorithm, threshold
+                )
+                probe_prefix = length - max(probe_overlap, 1) + 1
+
+                candidates = set()
+                for token in tokens[i][:probe_prefix]:
+                    candidates.update(inverted.get(token, ()))
+
+                partners = []
+                for j in candidates:
+                    other_length = len(lowered[j])
+                    if other_length < min_length:
+                        continue
+
+                    required = self._required_overlap(
+                        other_length, length, algorithm, threshold
+                    )
+                    overlap = len(token_sets[i] & token_sets[j])
+                    if overlap < required:
+                        continue
+
+                    if algorithm == "jaro_winkler" and not self._jaro_winkler_may_reach(
+                        lowered[i], lowered[j], overlap, threshold
+                    ):
+                        continue
+
+                    partners.append(j)
+
+                yield i, sorted(partners)
+
+            # Index with the prefix needed against an equal-length partner,
+            # the least demanding partner among the longer names still to come
+            index_overlap = self._required_overlap(length, length, algorithm, threshold)
+            index_prefix = length - max(index_overlap, 1) + 1
+            for token in tokens[i][:index_prefix]:
+                inverted[token].append(i)
+
+    def _comparison_string(self, file_info: Dict[str, Any], compare_by: str) -> str:
+        """Return the part of the file name that is compared.
+
+        Args:
+            file_info: File information dictionary.
+            compare_by: "name" or "full_name".
+
+        Returns:
+            String to compare.
+        """
+        if compare_by == "full_name":
+            return file_info["full_name"]
+        return file_info["name"]
+
+    def _score_batch(
+        self,
+        names: List[str],
+        i: int,
+        partners: Sequence[int],
+        algorithm: str,
+        threshold: float,
+    ) -> List[float]:
+        """Score one file against a batch of partners.
+
+        For the Levenshtein algorithm, a large enough batch is scored in one
+        NumPy call. Other pairs use the scalar kernel with the threshold
+        cutoff, so pairs below the threshold may get an underestimated score.
+
+        Args:
+            names: Comparison strings indexed by file position.
+            i: Index of the file.
+            partners: Indexes of the files it is compared with.
+            algorithm: Similarity algorithm name.
+            threshold: Similarity threshold.
+
+        Returns:
+            Similarity for each partner, in partner order.
+        """
+        use_numpy = self.config.get("similarity", {}).get("use_numpy", True)
+        if (
+            algorithm == "levenshtein"
+            and HAS_NUMPY
+            and use_numpy
+            and len(partners) >= BATCH_MIN_CANDIDATES
+            and 0 < len(names[i]) <= BATCH_MAX_QUERY_LENGTH
+        ):
+            return self._levenshtein_similarities(
+                names[i], [names[j] for j in partners]
+            )
+
+        # Score in (lower index, higher index) order, as the full scan does
+        return [
+            self._calculate_similarity(
+                names[min(i, j)], names[max(i, j)], algorithm, threshold
+            )
+            for j in partners
+        ]
+
+    def _score_rows(
+        self,
+        names: List[str],
+        rows: Iterator[Tuple[int, Sequence[int]]],
+        algorithm: str,
+        threshold: float,
+    ) -> Tuple[List[Tuple[int, int, float]], int]:
+        """Score candidate rows in batches, keeping pairs that reach the threshold.
+
+        Args:
+            names: Comparison strings indexed by file position.
+            rows: (i, partners) rows of candidate pairs.
+            algorithm: Similarity algorithm name.
+            threshold: Similarity threshold.
+
+        Returns:
+            Tuple of (matching (i, j, similarity) triples with i < j, sorted,
+            number of pairs scored).
+        """
+        matches: List[Tuple[int, int, float]] = []
+        compared = 0
+
+        for i, partners in rows:
+            for start in range(0, len(partners), SCORE_BATCH_SIZE):
+                batch = partners[start : start + SCORE_BATCH_SIZE]
+                similarities = self._score_batch(names, i, batch, algorithm, threshold)
+                compared += len(batch)
+                matches.extend(
+                    (min(i, j), max(i, j), similarity)
+                    for j, similarity in zip(batch, similarities)
+                    if similarity >= threshold
+                )
+
+        matches.sort()
+        return matches, compared
+
+    def _iter_rows(
+        self,
+        names: List[str],
+        algorithm: str,
+        threshold: float,
+        blocking: bool,
+        start: int = 0,
+        stop: Optional[int] = None,
+    ) -> Iterator[Tuple[int, Sequence[int]]]:
+        """Yield candidate rows, pruned when blocking applies to the algorithm.
+
+        Args:
+            names: Comparison strings indexed by file position.
+            algorithm: Similarity algorithm name.
+            threshold: Similarity threshold.
+            blocking: Whether candidate pruning is enabled.
+            start: First row to yield.
+            stop: Row to stop before (default: all rows).
+
+        Yields:
+            (i, partners) rows of candidate pairs.
+        """
+        if blocking and algorithm in ("sequence", "levenshtein", "jaro_winkler"):
+            return self._candidate_rows(names, algorithm, threshold, start, stop)
+        return self._all_rows(len(names), start, stop)
+
+    def _shard_rows(
+        self, row_sizes: List[int], shard_count: int
+    ) -> List[Tuple[int, int, int]]:
+        """Split rows into contiguous ranges with similar pair counts.
+
+        Each file's candidates stay in one shard (and one NumPy batch).
+
+        Args:
+            row_sizes: Number of candidate pairs in each row.
+            shard_count: Number of shards to create.
+
+        Returns:
+            Non-empty shards as (start row, stop row, pair count).
+        """
+        total = sum(row_sizes)
+        shards: List[Tuple[int, int, int]] = []
+        start = 0
+        cumulative = 0
+        assigned = 0
+
+        for row, size in enumerate(row_sizes):
+            cumulative += size
+            if (
+                len(shards) < shard_count - 1
+                and cumulative * shard_count >= total * (len(shards) + 1)
+            ):
+                shards.append((start, row + 1, cumulative - assigned))
+                start = row + 1
+                assigned = cumulative
+
+        shards.append((start, len(row_sizes), total - assigned))
+        return [shard for shard in shards if shard[2]]
+
+    def _score_shard(
+        self,
+        names: List[str],
+        algorithm: str,
+        threshold: float,
+        blocking: bool,
+        start: int,
+        stop: int,
+    ) -> Tuple[List[Tuple[int, int, float]], float]:
+        """Generate and score one range of candidate rows in a worker process.
+
+        Args:
+            names: Comparison strings indexed by file position.
+            algorithm: Similarity algorithm name.
+            threshold: Similarity threshold.
+            blocking: Whether candidate pruning is enabled.
+            start: First row of the shard.
+            stop: Row to stop before.
+
+        Returns:
+            Tuple of (matching (i, j, similarity) triples, seconds spent).
+        """
+        started = time.perf_counter()
+        rows = self._iter_rows(names, algorithm, threshold, blocking, start, stop)
+        matches, _ = self._score_rows(names, rows, algorithm, threshold)
+        return matches, time.perf_counter() - started
+
+    def _score_rows_parallel(
+        self,
+        names: List[str],
+        algorithm: str,
+        threshold: float,
+        blocking: bool,
+        jobs: int,
+    ) -> Tuple[List[Tuple[int, int, float]], int]:
+        """Score candidate pairs across a process pool.
+
+        Row sizes are counted first, then each worker is given a range of
+        rows with a similar number of pairs and generates those pairs itself
+        from ``names``, so no pair list is built or pickled. Each shard's
+        timing is logged and recorded in ``shard_timings``.
+
+        Args:
+            names: Comparison strings indexed by file position.
+            algorithm: Similarity algorithm name.
+            threshold: Similarity threshold.
+            blocking: Whether candidate pruning is enabled.
+            jobs: Number of worker processes.
+
+        Returns:
+            Tuple of (matching (i, j, similarity) triples sorted by file
+            indexes, number of pairs scored).
+        """
+        row_sizes = [
+            len(partners)
+            for _, partners in self._iter_rows(names, algorithm, threshold, blocking)
+        ]
+        shards = self._shard_rows(row_sizes, jobs)
+        matches: List[Tuple[int, int, float]] = []
+        if not shards:
+            return matches, 0
+
+        with ProcessPoolExecutor(max_workers=len(shards)) as executor:
+            futures = [
+                executor.submit(
+                    self._score_shard,
+                    names,
+                    algorithm,
+                    threshold,
+                    blocking,
+                    start,
+                    stop,
+                )
+                for start, stop, _ in shards
+            ]
+            for number, (shard, future) in enumerate(zip(shards, futures), 1):
+                shard_matches, elapsed = future.result()
+                pairs = shard[2]
+                matches.extend(shard_matches)
+                self.shard_timings.append(
+                    {
+                        "shard": number,
+                        "pairs": pairs,
+                        "matches": len(shard_matches),
+                        "seconds": elapsed,
+                    }
+                )
+                logger.info(
+                    f"Shard {number}/{len(shards)}: scored {pairs} pairs "
+                    f"in {elapsed:.2f}s ({len(shard_matches)} matches)"
+                )
+
+        matches.sort()
+        return matches, sum(row_sizes)
+
     def find_similar_files(self) -> None:
-        """Find files with similar names using configured algorithm."""
-        algorithm = self.config.get("similarity", {}).get(
-            "algorithm", "sequence"
-        )
-        threshold = self.config.get("similarity", {}).get("threshold", 0.8)
-        compare_by = self.config.get("similarity", {}).get(
-            "compare_by", "name"
-        )
+        """Find files with similar names using configured algorithm.
+
+        With ``similarity.jobs`` above 1, candidate rows are sharded by row
+        range across that many worker processes and the results merged.
+        """
+        similarity_config = self.config.get("similarity", {})
+        algorithm = similarity_config.get("algorithm", "sequence")
+        threshold = similarity_config.get("threshold", 0.8)
+        compare_by = similarity_config.get("compare_by", "name")
+        blocking = similarity_config.get("blocking", True)
+        jobs = int(similarity_config.get("jobs", 1))
+        if jobs <= 0:
+            jobs = os.cpu_count() or 1
 
         logger.info(
             f"Finding similar files using {algorithm} algorithm "
@@ -384,36 +1072,35 @@ class SimilarFileFinder:
 
         self.similar_pairs = []
 
-        for i in range(len(self.files)):
-            for j in range(i + 1, len(self.files)):
-                file1 = self.files[i]
-                file2 = self.files[j]
-
-                # Determine what to compare
-                if compare_by == "name":
-                    str1 = file1["name"]
-                    str2 = file2["name"]
-                elif compare_by == "full_name":
-                    str1 = file1["full_name"]
-                    str2 = file2["full_name"]
-                else:
-                    str1 = file1["name"]
-                    str2 = file2["name"]
-
-                # Calculate similarity
-                similarity = self._calculate_similarity(str1, str2, algorithm)
-
-                if similarity >= threshold:
-                    self.similar_pairs.append(
-                        {
-                            "file1": file1["path"],
-                            "file2": file2["path"],
-                            "name1": file1["name"],
-                            "name2": file2["name"],
-                            "similarity": similarity,
-                            "algorithm": algorithm,
-                        }
-                    )
+        names = [self._comparison_string(f, compare_by) for f in self.files]
+        count = len(names)
+
+        if jobs > 1 and count > jobs:
+            matches, compared = self._score_rows_parallel(
+                names, algorithm, threshold, blocking, jobs
+            )
+        else:
+            rows = self._iter_rows(names, algorithm, threshold, blocking)
+            matches, compared = self._score_rows(names, rows, algorithm, threshold)
+        self.stats["pairs_compared"] += compared
+
+        total_pairs = count * (count - 1) // 2
+        logger.info(f"Compared {compared} of {total_pairs} possible pairs")
+
+        for i, j, similarity in matches:
+            file1 = self.files[i]
+            file2 = self.files[j]
+
+            self.similar_pairs.append(
+                {
+                    "file1": file1["path"],
+                    "file2": file2["path"],
+                    "name1": file1["name"],
+                    "name2": file2["name"],
+                    "similarity": similarity,
+                    "algorithm": algorithm,
+                }
+            )
 
         # Sort by similarity (highest first)
         self.similar_pairs.sort(key=lambda x: x["similarity"], reverse=True)
@@ -455,10 +1142,19 @@ class SimilarFileFinder:
             f"Similar pairs found: {self.stats['similar_pairs_found']:,}",
             f"Errors encountered: {self.stats['errors']}",
             "",
-            "SIMILAR FILE PAIRS",
-            "-" * 80,
         ]
 
+        if self.shard_timings:
+            report_lines.extend(["SHARD TIMINGS", "-" * 80])
+            for timing in self.shard_timings:
+                report_lines.append(
+                    f"Shard {timing['shard']}: {timing['pairs']:,} pairs, "
+                    f"{timing['matches']:,} matches, {timing['seconds']:.2f}s"
+                )
+            report_lines.append("")
+
+        report_lines.extend(["SIMILAR FILE PAIRS", "-" * 80])
+
         if not self.similar_pairs:
             report_lines.append("No similar files found.")
         else:
@@ -520,11 +1216,20 @@ def main() -> None:
         "--output",
         help="Output path for report (overrides config)",
     )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        help="Worker processes for scoring pairs, 0 for all cores "
+        "(overrides config)",
+    )
 
     args = parser.parse_args()
 
     try:
         finder = SimilarFileFinder(config_path=args.config)
+        if args.jobs is not None:
+            finder.config.setdefault("similarity", {})["jobs"] = args.jobs
         finder.scan_directory(args.directory)
         finder.find_similar_files()
         finder.generate_report(output_path=args.output)
@@ -1,5 +1,6 @@
 """Unit tests for similar file finder module."""
 
+import random
 import tempfile
 from pathlib import Path
 from unittest.mock import patch
@@ -7,7 +8,7 @@ from unittest.mock import patch
 import pytest
 import yaml
 
-from src.main import SimilarFileFinder
+from src.main import SimilarFileFinder, levenshtein_distances
 
 
 class TestSimilarFileFinder:
@@ -94,6 +95,37 @@ class TestSimilarFileFinder:
         similarity = finder._levenshtein_similarity("test", "test1")
         assert 0.0 < similarity < 1.0
 
+    def test_levenshtein_distance_matches_dynamic_programming(self, finder):
+        """Test bit-parallel distance against the textbook recurrence."""
+
+        def reference(str1, str2):
+            previous = list(range(len(str2) + 1))
+            for i, c1 in enumerate(str1.lower()):
+                current = [i + 1]
+                for j, c2 in enumerate(str2.lower()):
+                    substitution = previous[j] + (c1 != c2)
+                    current.append(
+                        min(previous[j + 1] + 1, current[j] + 1, substitution)
+                    )
+                previous = current
+            return previous[-1]
+
+        rng = random.Random(0)
+        for _ in range(300):
+            str1 = "".join(rng.choice("abcAB_") for _ in range(rng.randint(0, 80)))
+            str2 = "".join(rng.choice("abcAB_") for _ in range(rng.randint(0, 80)))
+            distance = reference(str1, str2)
+            assert finder._levenshtein_distance(str1, str2) == distance
+            assert finder._levenshtein_distance(str1, str2, 3) == min(distance, 4)
+            assert levenshtein_distances(str1, [str2] * 20) == [distance] * 20
+
+    def test_levenshtein_similarity_threshold_cutoff(self, finder):
+        """Test that the threshold cutoff only changes rejected scores."""
+        assert finder._levenshtein_similarity("report", "reports", 0.8) == (
+            finder._levenshtein_similarity("report", "reports")
+        )
+        assert finder._levenshtein_similarity("report", "invoice", 0.8) < 0.8
+
     def test_jaro_winkler_similarity_identical(self, finder):
         """Test Jaro-Winkler similarity for identical strings."""
         similarity = finder._jaro_winkler_similarity("test", "test")
@@ -194,6 +226,71 @@ class TestSimilarFileFinder:
 
         assert finder.stats["similar_pairs_found"] == 0
 
+    @pytest.mark.parametrize("algorithm", ["sequence", "levenshtein", "jaro_winkler"])
+    def test_find_similar_files_blocking_matches_all_pairs(self, finder, algorithm):
+        """Test that candidate pruning gives the same result as all pairs."""
+        names = [
+            "report_2023", "report_2024", "Report-2024", "rep", "invoice",
+            "invoices", "photo_001", "photo_002", "summary", "", "x",
+        ]
+        finder.files = [
+            {"name": n, "full_name": n + ".txt", "path": f"/{i}/{n}.txt"}
+            for i, n in enumerate(names)
+        ]
+
+        for threshold in (0.5, 0.8, 0.9):
+            finder.config["similarity"] = {
+                "algorithm": algorithm,
+                "threshold": threshold,
+                "blocking": False,
+            }
+            finder.find_similar_files()
+            expected = finder.similar_pairs
+
+            finder.config["similarity"]["blocking"] = True
+            finder.stats["pairs_compared"] = 0
+            finder.find_similar_files()
+
+            assert finder.similar_pairs == expected
+            assert finder.stats["pairs_compared"] < len(names) * (len(names) - 1) // 2
+
+    def test_find_similar_files_jobs_matches_single_process(self, finder):
+        """Test that sharded scoring merges to the single-process result."""
+        names = [f"report_{i:03d}" for i in range(40)] + ["invoice", "invoices"]
+        finder.files = [
+            {"name": n, "full_name": n + ".txt", "path": f"/{i}/{n}.txt"}
+            for i, n in enumerate(names)
+        ]
+        finder.config["similarity"] = {"algorithm": "levenshtein", "threshold": 0.8}
+        finder.find_similar_files()
+        expected = finder.similar_pairs
+
+        finder.config["similarity"]["jobs"] = 3
+        finder.stats["pairs_compared"] = 0
+        finder.find_similar_files()
+
+        assert finder.similar_pairs == expected
+        assert len(finder.shard_timings) == 3
+        assert sum(t["pairs"] for t in finder.shard_timings) == (
+            finder.stats["pairs_compared"]
+        )
+
+    def test_shard_rows_balances_contiguous_ranges(self, finder):
+        """Test that shards cover every row once with balanced pair counts."""
+        row_sizes = [9 - i for i in range(10)]
+        shards = finder._shard_rows(row_sizes, 4)
+
+        assert shards == [(0, 2, 17), (2, 3, 7), (3, 5, 11), (5, 10, 10)]
+
+    def test_candidate_rows_range_matches_full_run(self, finder):
+        """Test that any row range generates the same rows as a full run."""
+        names = [f"report_{i:03d}" for i in range(30)] + ["", "Straße", "invoice"]
+        rows = list(finder._candidate_rows(names, "levenshtein", 0.8))
+
+        assert list(finder._candidate_rows(names, "levenshtein", 0.8, 2, 20)) == (
+            rows[2:20]
+        )
+
     def test_generate_report(self, finder, temp_dir):
         """Test report generation."""
         # Create files and find similarities
@@ -0,0 +1,107 @@
+"""Benchmark for text-pattern-search regex searches with the literal prefilter.
+
+Writes a synthetic corpus of log files in which only a few files contain the
+rare line the pattern targets, then searches it with the prefilter disabled
+and enabled, in line-by-line and mmap modes. The corpus is written once and
+reused, so later runs time warm or cold reads depending on the page cache.
+
+Usage:
+    python benchmarks/benchmark_prefilter.py [--gigabytes 10] [--corpus DIR]
+"""
+
+import argparse
+import logging
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.main import TextPatternSearch  # noqa: E402
+
+FILE_MEGABYTES = 64
+HIT_EVERY = 20
+RARE_LINE = "2024-05-17 ERROR disk /dev/sda1 full user=4242 took 9.999s\n"
+CASES = [
+    ("rare literal", r"ERROR disk \S+ full user=\d+"),
+    ("absent literal", r"FATAL oom user=\d+"),
+    ("alternation", r"(?:panic|segfault) at 0x[0-9a-f]+"),
+]
+
+
+def write_corpus(directory: Path, gigabytes: float, seed: int = 42) -> int:
+    """Write the synthetic corpus unless it already exists; return file count."""
+    count = max(1, int(gigabytes * 1024 / FILE_MEGABYTES))
+    existing = sorted(directory.glob("*.log"))
+    if len(existing) == count:
+        return count
+
+    rng = random.Random(seed)
+    lines = []
+    size = 0
+    while size < 4 * 1024 * 1024:
+        line = (
+            f"2024-05-{rng.randrange(1, 29):02d} "
+            f"{rng.choice(['DEBUG', 'INFO', 'INFO', 'WARNING'])} "
+            f"request id={rng.randrange(10**9)} user={rng.randrange(10**4)} "
+            f"took {rng.random():.3f}s\n"
+        )
+        lines.append(line)
+        size += len(line)
+    block = "".join(lines).encode("utf-8")
+
+    for index in range(count):
+        with open(directory / f"part{index:05d}.log", "wb") as f:
+            for _ in range(FILE_MEGABYTES // 4):
+                f.write(block)
+            if index % HIT_EVERY == 0:
+                f.write(RARE_LINE.encode("utf-8"))
+    return count
+
+
+def run(directory: Path, pattern: str, use_mmap: bool, prefilter: bool) -> Tuple[float, dict]:
+    """Search the corpus and return (seconds, stats)."""
+    searcher = TextPatternSearch(pattern, use_regex=True, use_mmap=use_mmap)
+    if not prefilter:
+        searcher.prefilter = None
+    start = time.perf_counter()
+    searcher.search_paths([directory])
+    return time.perf_counter() - start, searcher.stats
+
+
+def main() -> None:
+    """Run the benchmark and print a timing table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--gigabytes", type=float, default=10, help="Size of the synthetic corpus"
+    )
+    parser.add_argument(
+        "--corpus", type=str, default=None, help="Directory to write the corpus to"
+    )
+    args = parser.parse_args()
+    logging.getLogger().setLevel(logging.WARNING)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        directory = Path(args.corpus or temp_dir)
+        directory.mkdir(parents=True, exist_ok=True)
+        count = write_corpus(directory, args.gigabytes)
+        print(f"{count} files x {FILE_MEGABYTES} MB")
+
+        for label, pattern in CASES:
+            for use_mmap in (False, True):
+                for prefilter in (False, True):
+                    elapsed, stats = run(directory, pattern, use_mmap, prefilter)
+                    mode = "mmap" if use_mmap else "readlines"
+                    state = "prefilter" if prefilter else "regex only"
+                    print(
+                        f"  {label:<15} {mode:<10} {state:<11} {elapsed:8.2f}s  "
+                        f"{stats['total_matches']:>5} matches  "
+                        f"{stats['files_prefiltered']:>5} files skipped"
+                    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""Benchmark for text-pattern-search line-by-line vs mmap search.
+
+Writes a synthetic log file and searches it with ``readlines`` (the default)
+and with ``use_mmap``, for a literal that never matches, a rare literal and a
+regex. Reports wall time and the peak Python heap allocated while searching
+(mapped pages are file-backed and not counted).
+
+Usage:
+    python benchmarks/benchmark_search.py [--megabytes 200]
+"""
+
+import argparse
+import logging
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.main import TextPatternSearch  # noqa: E402
+
+LEVELS = ["DEBUG", "INFO", "INFO", "INFO", "WARNING"]
+CASES = [
+    ("absent literal", "no-such-token", False),
+    ("rare literal", "ERROR disk", False),
+    ("regex", r"user=\d+7 ", True),
+]
+
+
+def write_synthetic_log(path: Path, megabytes: int, seed: int = 42) -> int:
+    """Write a log file of roughly the given size and return its line count."""
+    rng = random.Random(seed)
+    target = megabytes * 1024 * 1024
+    written = lines = 0
+    with open(path, "w", encoding="utf-8") as f:
+        while written < target:
+            batch = []
+            for _ in range(10000):
+                level = "ERROR disk" if rng.random() < 0.0001 else rng.choice(LEVELS)
+                batch.append(
+                    f"2024-05-{rng.randrange(1, 29):02d} {level} "
+                    f"request id={rng.randrange(10**9)} user={rng.randrange(10**4)} "
+                    f"took {rng.random():.3f}s\n"
+                )
+            chunk = "".join(batch)
+            f.write(chunk)
+            written += len(chunk)
+            lines += len(batch)
+    return lines
+
+
+def run(path: Path, pattern: str, use_regex: bool, use_mmap: bool) -> Tuple[float, int, int]:
+    """Search the file and return (seconds, matches, peak heap bytes)."""
+    searcher = TextPatternSearch(pattern, use_regex=use_regex, use_mmap=use_mmap)
+    start = time.perf_counter()
+    matches = searcher.search_file(path)
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    searcher.search_file(path)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, len(matches), peak
+
+
+def main() -> None:
+    """Run the benchmark and print a timing and memory table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--megabytes", type=int, default=200, help="Size of the synthetic log"
+    )
+    args = parser.parse_args()
+    logging.getLogger().setLevel(logging.WARNING)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = Path(temp_dir) / "synthetic.log"
+        lines = write_synthetic_log(path, args.megabytes)
+        print(f"{args.megabytes} MB, {lines:,} lines")
+
+        for label, pattern, use_regex in CASES:
+            for use_mmap in (False, True):
+                elapsed, count, peak = run(path, pattern, use_regex, use_mmap)
+                mode = "mmap" if use_mmap else "readlines"
+                print(
+                    f"  {label:<15} {mode:<10} {elapsed:7.2f}s  "
+                    f"{count:>8,} matches  {peak / 2**20:8.1f} MB heap"
+                )
+
+
+if __name__ == "__main__":
+    main()
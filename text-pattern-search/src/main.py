@@ -5,14 +5,37 @@ listing all files containing the search terms with line numbers and context.
 """
 
 import argparse
+import io
 import logging
+import mmap
+import os
 import re
 import sys
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import (
+    Any,
+    AnyStr,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Pattern,
+    Set,
+    TextIO,
+    Tuple,
+    Union,
+)
 
 import yaml
 
+try:
+    from re import _parser as sre_parse
+except ImportError:  # Python < 3.11
+    import sre_parse
+
 logging.basicConfig(
     level=logging.INFO,
     format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
@@ -24,6 +47,226 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+# Parser opcodes of repeats; POSSESSIVE_REPEAT and ATOMIC_GROUP are 3.11+
+_REPEAT_OPCODES = tuple(
+    getattr(sre_parse, name)
+    for name in ("MAX_REPEAT", "MIN_REPEAT", "POSSESSIVE_REPEAT")
+    if hasattr(sre_parse, name)
+)
+_ATOMIC_GROUP = getattr(sre_parse, "ATOMIC_GROUP", None)
+
+
+class LiteralPrefilter:
+    """Rejects buffers that lack literals every match of a regex contains.
+
+    The pattern is reduced to requirements: groups of literal strings of
+    which at least one must occur in any text the pattern matches. Buffers
+    are checked with bytes.find, or with a literal-only bytes regex when
+    matching ignores case, which is far cheaper than running the regex.
+    """
+
+    # Shortest literal worth checking for
+    MIN_LITERAL_LENGTH = 3
+
+    # Most alternatives kept for one requirement drawn from an alternation
+    MAX_ALTERNATIVES = 16
+
+    # Non-ASCII characters that str patterns match case-insensitively for
+    # these ASCII letters, as UTF-8 bytes
+    CASE_FOLD_EXTRAS = {
+        "i": [b"\xc4\xb0", b"\xc4\xb1"],
+        "k": [b"\xe2\x84\xaa"],
+        "s": [b"\xc5\xbf"],
+    }
+
+    def __init__(
+        self, requirements: List[Union[Tuple[bytes, ...], Pattern[bytes]]]
+    ) -> None:
+        """Initialize the prefilter.
+
+        Args:
+            requirements: Each either a tuple of UTF-8 literals of which one
+                must occur, or a bytes pattern that must match, checked in
+                order
+        """
+        self.requirements = requirements
+
+    @classmethod
+    def from_pattern(cls, pattern: str, flags: int = 0) -> Optional["LiteralPrefilter"]:
+        """Build a prefilter for a regex.
+
+        Args:
+            pattern: Regex pattern
+            flags: Flags the pattern is compiled with
+
+        Returns:
+            Prefilter, or None if the pattern requires no usable literal
+        """
+        try:
+            parsed = sre_parse.parse(pattern, flags)
+        except re.error:
+            return None
+
+        ignore_case = bool(parsed.state.flags & re.IGNORECASE)
+        literal_sets = cls._required_literals(parsed, ignore_case)
+        literal_sets.sort(key=lambda literals: -min(map(len, literals)))
+
+        requirements: List[Union[Tuple[bytes, ...], Pattern[bytes]]] = []
+        for literals in literal_sets:
+            if not ignore_case:
+                requirements.append(tuple(text.encode("utf-8") for text in literals))
+                continue
+
+            compiled = [
+                cls.compile_literal(text, ignore_case=True) for text in literals
+            ]
+            if all(compiled):
+                requirements.append(
+                    re.compile(
+                        b"|".join(part.pattern for part in compiled), re.IGNORECASE
+                    )
+                )
+
+        return cls(requirements) if requirements else None
+
+    @classmethod
+    def compile_literal(
+        cls, text: str, ignore_case: bool = False
+    ) -> Optional[Pattern[bytes]]:
+        """Compile text for matching raw UTF-8 bytes the way a str pattern would.
+
+        Args:
+            text: Literal text
+            ignore_case: Whether the str pattern ignores case
+
+        Returns:
+            Compiled bytes pattern, or None if text has non-ASCII characters
+            and case is ignored
+        """
+        if not ignore_case:
+            return re.compile(re.escape(text.encode("utf-8")))
+
+        if not text.isascii():
+            return None
+
+        parts = []
+        for char in text:
+            escaped = re.escape(char.encode("ascii"))
+            extras = cls.CASE_FOLD_EXTRAS.get(char.lower())
+            if extras:
+                escaped = b"(?:" + b"|".join([escaped] + extras) + b")"
+            parts.append(escaped)
+        return re.compile(b"".join(parts), re.IGNORECASE)
+
+    @classmethod
+    def _required_literals(cls, items: Any, ignore_case: bool) -> List[Tuple[str, ...]]:
+        """Collect literal sets required by a parsed regex sequence.
+
+        Only constructs that must match at least once contribute; classes,
+        anchors, lookarounds and optional parts end the current literal.
+        Line breaks are excluded so that text-mode newline translation
+        cannot hide a literal.
+
+        Args:
+            items: Parsed sequence from the regex parser
+            ignore_case: Whether the whole pattern ignores case
+
+        Returns:
+            List of tuples of alternatives, one of which must occur
+        """
+        requirements: List[Tuple[str, ...]] = []
+        run: List[str] = []
+
+        def flush() -> None:
+            if len(run) >= cls.MIN_LITERAL_LENGTH:
+                requirements.append(("".join(run),))
+            run.clear()
+
+        for op, av in items:
+            if op is sre_parse.LITERAL and av not in (10, 13):
+                run.append(chr(av))
+                continue
+
+            flush()
+            if op is sre_parse.SUBPATTERN:
+                _, add_flags, _, sub = av
+                if ignore_case or not add_flags & re.IGNORECASE:
+                    requirements.extend(cls._required_literals(sub, ignore_case))
+            elif op in _REPEAT_OPCODES:
+                minimum, _, item = av
+                if minimum >= 1:
+                    requirements.extend(cls._required_literals(item, ignore_case))
+            elif op is _ATOMIC_GROUP:
+                requirements.extend(cls._required_literals(av, ignore_case))
+            elif op is sre_parse.BRANCH:
+                alternatives: Set[str] = set()
+                for branch in av[1]:
+                    options = cls._required_literals(branch, ignore_case)
+                    if not options:
+                        break
+                    alternatives.update(max(options, key=lambda o: min(map(len, o))))
+                else:
+                    if len(alternatives) <= cls.MAX_ALTERNATIVES:
+                        requirements.append(tuple(sorted(alternatives)))
+
+        flush()
+        return requirements
+
+    def might_match(self, buffer: Union[bytes, mmap.mmap]) -> bool:
+        """Check whether a buffer holds every required literal.
+
+        Args:
+            buffer: UTF-8 bytes or mapped file
+
+        Returns:
+            False if the pattern cannot match anywhere in buffer
+        """
+        for requirement in self.requirements:
+            if isinstance(requirement, tuple):
+                if all(buffer.find(literal) == -1 for literal in requirement):
+                    return False
+            elif requirement.search(buffer) is None:
+                return False
+        return True
+
+
+# Searcher copy owned by each worker process, set by _init_worker
+_worker_searcher: Optional["TextPatternSearch"] = None
+
+# Stats that search_file updates and workers report back
+_WORKER_STATS = ("errors", "files_prefiltered")
+
+
+def _init_worker(searcher: "TextPatternSearch") -> None:
+    """Store the searcher in a worker process.
+
+    Args:
+        searcher: Configured searcher, pickled once per worker
+    """
+    global _worker_searcher
+    _worker_searcher = searcher
+
+
+def _search_file_worker(
+    file_path: Path,
+) -> Tuple[List[Tuple[int, str, str]], Dict[str, int]]:
+    """Search one file in a worker process.
+
+    Module-level so that it can be shipped to a process pool.
+
+    Args:
+        file_path: Path to file to search
+
+    Returns:
+        Tuple of (matches, stats) where stats holds what the search added
+        to the worker's read error and prefiltered file counts
+    """
+    before = {key: _worker_searcher.stats[key] for key in _WORKER_STATS}
+    matches = _worker_searcher.search_file(file_path)
+    return matches, {
+        key: _worker_searcher.stats[key] - before[key] for key in _WORKER_STATS
+    }
+
 
 class TextPatternSearch:
     """Searches for text patterns in files with context."""
@@ -73,6 +316,19 @@ class TextPatternSearch:
         ".properties",
     }
 
+    # Valid values for result_order
+    RESULT_ORDERS = ("path", "completion")
+
+    # Files queued per worker process; bounds work wasted after max_matches
+    PENDING_PER_WORKER = 4
+
+    # Bytes scanned per decoded chunk when a mapped file needs a text pattern
+    MMAP_CHUNK_SIZE = 8 * 1024 * 1024
+
+    # Buffer pattern for regexes that must see one line at a time: every line
+    # start is a candidate, so each line is checked with the line pattern
+    EVERY_LINE_PATTERN = re.compile(r"^", re.MULTILINE)
+
     def __init__(
         self,
         pattern: str,
@@ -81,6 +337,10 @@ class TextPatternSearch:
         context_lines: int = 2,
         file_patterns: Optional[List[str]] = None,
         exclude_patterns: Optional[List[str]] = None,
+        use_mmap: bool = False,
+        workers: int = 1,
+        result_order: str = "path",
+        max_matches: Optional[int] = None,
     ) -> None:
         """Initialize the text pattern search.
 
@@ -91,16 +351,35 @@ class TextPatternSearch:
             context_lines: Number of context lines to show before and after matches
             file_patterns: List of file extensions or patterns to include
             exclude_patterns: List of file patterns to exclude
+            use_mmap: If True, map files into memory and search the whole
+                buffer instead of reading them line by line
+            workers: Number of worker processes searching files concurrently
+            result_order: "path" to yield results in the order files are
+                found, or "completion" to yield them as workers finish
+            max_matches: Stop searching after this many matches in total
 
         Raises:
             re.error: If pattern is invalid regex when use_regex is True
+            ValueError: If result_order or max_matches is invalid
         """
+        if result_order not in self.RESULT_ORDERS:
+            raise ValueError(
+                f"Invalid result order: {result_order} "
+                f"(expected one of {', '.join(self.RESULT_ORDERS)})"
+            )
+        if max_matches is not None and max_matches < 1:
+            raise ValueError(f"max_matches must be at least 1: {max_matches}")
+
         self.pattern = pattern
         self.use_regex = use_regex
         self.case_sensitive = case_sensitive
         self.context_lines = context_lines
         self.file_patterns = file_patterns or []
         self.exclude_patterns = exclude_patterns or []
+        self.use_mmap = use_mmap
+        self.workers = max(1, workers)
+        self.result_order = result_order
+        self.max_matches = max_matches
 
         flags = 0 if case_sensitive else re.IGNORECASE
         if use_regex:
@@ -112,10 +391,25 @@ class TextPatternSearch:
             escaped_pattern = re.escape(pattern)
             self.compiled_pattern = re.compile(escaped_pattern, flags)
 
+        # Buffer-wide patterns for mmap mode: a bytes pattern for literals that
+        # can be matched without decoding, otherwise a multiline text pattern,
+        # or every line when string anchors or lookbehinds would see other lines
+        self.byte_pattern = self._compile_byte_pattern()
+        self.prefilter = LiteralPrefilter.from_pattern(
+            self.compiled_pattern.pattern, flags
+        )
+        if self._needs_line_matching(self.compiled_pattern.pattern, flags):
+            self.buffer_pattern = self.EVERY_LINE_PATTERN
+        else:
+            self.buffer_pattern = re.compile(
+                self.compiled_pattern.pattern, flags | re.MULTILINE
+            )
+
         self.stats = {
             "files_searched": 0,
             "files_matched": 0,
             "total_matches": 0,
+            "files_prefiltered": 0,
             "errors": 0,
         }
 
@@ -180,6 +474,231 @@ class TextPatternSearch:
 
         return False
 
+    def _compile_byte_pattern(self) -> Optional[Pattern[bytes]]:
+        """Compile the literal pattern for matching raw UTF-8 bytes.
+
+        Returns:
+            Compiled bytes pattern, or None if byte matching could differ
+            from the text pattern (regexes, line breaks in the pattern, or
+            case-insensitive non-ASCII text)
+        """
+        if self.use_regex or "\n" in self.pattern or "\r" in self.pattern:
+            return None
+
+        return LiteralPrefilter.compile_literal(
+            self.pattern, ignore_case=not self.case_sensitive
+        )
+
+    @staticmethod
+    def _needs_line_matching(pattern: str, flags: int = 0) -> bool:
+        """Check whether a regex can only be matched one line at a time.
+
+        Over a multi-line buffer, \\A and \\Z match only at the ends of the
+        buffer and lookbehinds see the previous line, so such patterns would
+        miss lines that match on their own.
+
+        Args:
+            pattern: Regex pattern
+            flags: Flags the pattern is compiled with
+
+        Returns:
+            True if the pattern has string anchors or lookbehinds
+        """
+        try:
+            parsed = sre_parse.parse(pattern, flags)
+        except re.error:
+            return True
+
+        string_anchors = (sre_parse.AT_BEGINNING_STRING, sre_parse.AT_END_STRING)
+        pending = [parsed]
+        while pending:
+            for op, av in pending.pop():
+                if op is sre_parse.AT and av in string_anchors:
+                    return True
+                if op in (sre_parse.ASSERT, sre_parse.ASSERT_NOT) and av[0] < 0:
+                    return True
+
+                values = av if isinstance(av, (tuple, list)) else (av,)
+                for value in values:
+                    if isinstance(value, sre_parse.SubPattern):
+                        pending.append(value)
+                    elif isinstance(value, list):
+                        # Alternatives of a BRANCH
+                        pending.extend(
+                            item
+                            for item in value
+                            if isinstance(item, sre_parse.SubPattern)
+                        )
+        return False
+
+    @staticmethod
+    def _line_boundary(buffer: AnyStr, offset: int, lines: int) -> int:
+        """Move an offset at a line start by a number of lines.
+
+        Args:
+            buffer: Bytes, mapped file or text to walk
+            offset: Offset of a line start in buffer
+            lines: Lines to move; negative moves backwards
+
+        Returns:
+            Offset of the resulting line start, clamped to the buffer
+        """
+        newline = "\n" if isinstance(buffer, str) else b"\n"
+        for _ in range(-lines):
+            if offset == 0:
+                break
+            offset = buffer.rfind(newline, 0, offset - 1) + 1
+        for _ in range(lines):
+            if offset >= len(buffer):
+                break
+            index = buffer.find(newline, offset)
+            offset = len(buffer) if index == -1 else index + 1
+        return offset
+
+    def _chunk_bounds(self, mapped: mmap.mmap) -> Iterator[Tuple[int, int]]:
+        """Yield (start, end) offsets of line-aligned chunks of a mapped file.
+
+        Args:
+            mapped: Memory-mapped file
+
+        Yields:
+            Offsets of chunks of about MMAP_CHUNK_SIZE bytes that end after
+            a newline or at the end of the file
+        """
+        start = 0
+        size = len(mapped)
+        while start < size:
+            end = min(start + self.MMAP_CHUNK_SIZE, size)
+            if end < size:
+                index = mapped.find(b"\n", end - 1)
+                end = size if index == -1 else index + 1
+            yield start, end
+            start = end
+
+    @staticmethod
+    def _decode(data: bytes) -> str:
+        """Decode file bytes the way search_file reads text."""
+        return data.decode("utf-8", errors="ignore").replace("\r\n", "\n")
+
+    def _search_mapped(self, file_path: Path) -> List[Tuple[int, str, str]]:
+        """Search a memory-mapped file in one pass over its buffer.
+
+        Literal patterns are matched on the raw bytes, so a file without a
+        match is never decoded. Other patterns run over line-aligned chunks
+        decoded one at a time, skipping files and chunks that the literal
+        prefilter rejects. In both cases only lines holding a candidate
+        match are decoded and re-checked with the line pattern, and context
+        is cut from the buffer around them. Lines end at "\n" (or "\r\n").
+
+        Args:
+            file_path: Path to file to search
+
+        Returns:
+            List of tuples (line_number, line_content, match_context)
+        """
+        matches: List[Tuple[int, str, str]] = []
+
+        with open(file_path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return matches
+
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                if self.byte_pattern is not None:
+                    if not self.byte_pattern.search(mapped):
+                        return matches
+                    pattern = self.byte_pattern
+                else:
+                    if self.prefilter and not self.prefilter.might_match(mapped):
+                        self.stats["files_prefiltered"] += 1
+                        return matches
+                    pattern = self.buffer_pattern
+
+                line_number = 1
+                for start, end in self._chunk_bounds(mapped):
+                    before = self._line_boundary(mapped, start, -self.context_lines)
+                    after = self._line_boundary(mapped, end, self.context_lines)
+                    if pattern is not self.byte_pattern and self.prefilter:
+                        raw = mapped[before:after]
+                        if not self.prefilter.might_match(raw):
+                            line_number += raw.count(
+                                b"\n", start - before, end - before
+                            )
+                            continue
+
+                    if pattern is self.byte_pattern:
+                        buffer = mapped[before:after]
+                        decode = self._decode
+                        core_start, core_end = start - before, end - before
+                    else:
+                        lead = self._decode(mapped[before:start])
+                        core = self._decode(mapped[start:end])
+                        buffer = lead + core + self._decode(mapped[end:after])
+                        decode = str
+                        core_start, core_end = len(lead), len(lead) + len(core)
+
+                    line_number = self._collect_matches(
+                        buffer,
+                        pattern,
+                        core_start,
+                        core_end,
+                        line_number,
+                        decode,
+                        matches,
+                    )
+
+        return matches
+
+    def _collect_matches(
+        self,
+        buffer: AnyStr,
+        pattern: Pattern,
+        core_start: int,
+        core_end: int,
+        line_number: int,
+        decode: Callable[[AnyStr], str],
+        matches: List[Tuple[int, str, str]],
+    ) -> int:
+        """Append matches found in the core region of a chunk buffer.
+
+        Args:
+            buffer: Chunk with up to context_lines lines on either side
+            pattern: Buffer-wide pattern used to find candidate lines
+            core_start: Offset of the first line to search
+            core_end: Offset just past the last line to search
+            line_number: Line number of the line at core_start
+            decode: Converts a slice of buffer to text
+            matches: List that matches are appended to
+
+        Returns:
+            Line number of the line at core_end
+        """
+        newline = "\n" if isinstance(buffer, str) else b"\n"
+        position = counted = core_start
+
+        while position < core_end:
+            found = pattern.search(buffer, position)
+            if found is None or found.start() >= core_end:
+                break
+
+            line_start = buffer.rfind(newline, position, found.start()) + 1
+            line_start = max(line_start, position)
+            line_end = self._line_boundary(buffer, line_start, 1)
+            line_number += buffer.count(newline, counted, line_start)
+            counted = line_start
+
+            line = decode(buffer[line_start:line_end])
+            if self.compiled_pattern.search(line):
+                context_start = self._line_boundary(
+                    buffer, line_start, -self.context_lines
+                )
+                context_end = self._line_boundary(buffer, line_end, self.context_lines)
+                context = decode(buffer[context_start:context_end])
+                matches.append((line_number, line.rstrip("\n"), context))
+
+            position = line_end
+
+        return line_number + buffer.count(newline, counted, core_end)
+
     def search_file(self, file_path: Path) -> List[Tuple[int, str, str]]:
         """Search for pattern in a single file.
 
@@ -200,8 +719,24 @@ class TextPatternSearch:
                 logger.debug(f"Skipping binary file: {file_path}")
                 return matches
 
-            with open(file_path, "r", encoding="utf-8", errors="ignore") as f:
-                lines = f.readlines()
+            if self.use_mmap:
+                return self._search_mapped(file_path)
+
+            # Read raw bytes first so that files lacking the pattern's
+            # required literals are skipped without decoding or regex work
+            if self.prefilter is not None:
+                with open(file_path, "rb") as f:
+                    data = f.read()
+                if not self.prefilter.might_match(data):
+                    self.stats["files_prefiltered"] += 1
+                    return matches
+                text = io.TextIOWrapper(
+                    io.BytesIO(data), encoding="utf-8", errors="ignore"
+                )
+                lines = text.readlines()
+            else:
+                with open(file_path, "r", encoding="utf-8", errors="ignore") as f:
+                    lines = f.readlines()
 
             for line_num, line in enumerate(lines, start=1):
                 if self.compiled_pattern.search(line):
@@ -221,32 +756,30 @@ class TextPatternSearch:
 
         return matches
 
-    def search_directory(
+    def _iter_directory_files(
         self, directory: Path, recursive: bool = False
-    ) -> List[Tuple[Path, List[Tuple[int, str, str]]]]:
-        """Search for pattern in all files in a directory.
+    ) -> Iterator[Path]:
+        """Yield the files in a directory that should be searched.
 
         Args:
             directory: Directory path to search
             recursive: If True, search subdirectories recursively
 
-        Returns:
-            List of tuples (file_path, matches_list)
+        Yields:
+            Paths of included text files
         """
-        results: List[Tuple[Path, List[Tuple[int, str, str]]]] = []
-
         if not directory.exists():
             logger.warning(f"Directory does not exist: {directory}")
-            return results
+            return
 
         if not directory.is_dir():
             logger.warning(f"Path is not a directory: {directory}")
-            return results
+            return
 
         if recursive:
-            file_paths = list(directory.rglob("*"))
+            file_paths = directory.rglob("*")
         else:
-            file_paths = list(directory.glob("*"))
+            file_paths = directory.glob("*")
 
         for file_path in file_paths:
             if not file_path.is_file():
@@ -260,30 +793,20 @@ class TextPatternSearch:
                 logger.debug(f"Skipping non-text file: {file_path}")
                 continue
 
-            self.stats["files_searched"] += 1
-            matches = self.search_file(file_path)
-
-            if matches:
-                self.stats["files_matched"] += 1
-                self.stats["total_matches"] += len(matches)
-                results.append((file_path, matches))
-
-        return results
+            yield file_path
 
-    def search_paths(
-        self, paths: List[Path], recursive: bool = False
-    ) -> List[Tuple[Path, List[Tuple[int, str, str]]]]:
-        """Search for pattern in multiple paths (files or directories).
+    def _iter_path_files(
+        self, paths: Iterable[Path], recursive: bool = False
+    ) -> Iterator[Path]:
+        """Yield the files to search for a list of file or directory paths.
 
         Args:
-            paths: List of file or directory paths
+            paths: File or directory paths
             recursive: If True, search subdirectories recursively
 
-        Returns:
-            List of tuples (file_path, matches_list)
+        Yields:
+            Paths of included text files
         """
-        all_results: List[Tuple[Path, List[Tuple[int, str, str]]]] = []
-
         for path in paths:
             path = Path(path).expanduser().resolve()
 
@@ -294,54 +817,173 @@ class TextPatternSearch:
                 if not self._is_text_file(path):
                     continue
 
-                self.stats["files_searched"] += 1
-                matches = self.search_file(path)
-
-                if matches:
-                    self.stats["files_matched"] += 1
-                    self.stats["total_matches"] += len(matches)
-                    all_results.append((path, matches))
+                yield path
 
             elif path.is_dir():
-                results = self.search_directory(path, recursive=recursive)
-                all_results.extend(results)
+                yield from self._iter_directory_files(path, recursive=recursive)
 
             else:
                 logger.warning(f"Path does not exist: {path}")
 
-        return all_results
+    def _search_in_pool(
+        self, file_paths: Iterable[Path]
+    ) -> Iterator[Tuple[Path, List[Tuple[int, str, str]], Dict[str, int]]]:
+        """Search files in a process pool.
 
-    def format_results(
-        self, results: List[Tuple[Path, List[Tuple[int, str, str]]]]
-    ) -> str:
-        """Format search results as readable text.
+        At most PENDING_PER_WORKER files per worker are queued at a time, so
+        files are discovered lazily and closing the generator early leaves
+        little work to cancel.
 
         Args:
-            results: List of search results
+            file_paths: Files to search
+
+        Yields:
+            Tuples of (file_path, matches, stats) in result_order
+        """
+        paths = iter(file_paths)
+        pending: Dict[Future, Path] = {}
+        executor = ProcessPoolExecutor(
+            max_workers=self.workers, initializer=_init_worker, initargs=(self,)
+        )
+
+        def fill() -> None:
+            while len(pending) < self.workers * self.PENDING_PER_WORKER:
+                file_path = next(paths, None)
+                if file_path is None:
+                    return
+                pending[executor.submit(_search_file_worker, file_path)] = file_path
+
+        try:
+            fill()
+            while pending:
+                if self.result_order == "path":
+                    done = [next(iter(pending))]
+                else:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    file_path = pending.pop(future)
+                    matches, stats = future.result()
+                    yield file_path, matches, stats
+
+                fill()
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=True)
+
+    def iter_search_files(
+        self, file_paths: Iterable[Path]
+    ) -> Iterator[Tuple[Path, List[Tuple[int, str, str]]]]:
+        """Search files and yield results as they are produced.
+
+        Uses a process pool when workers > 1. Stats are updated as results
+        are yielded, and the search stops once max_matches is reached.
+
+        Args:
+            file_paths: Files to search
+
+        Yields:
+            Tuples (file_path, matches_list) for files with matches
+        """
+        if self.workers > 1:
+            outcomes = self._search_in_pool(file_paths)
+        else:
+            outcomes = (
+                (file_path, self.search_file(file_path), {}) for file_path in file_paths
+            )
+
+        remaining = self.max_matches
+        try:
+            for file_path, matches, stats in outcomes:
+                self.stats["files_searched"] += 1
+                for key, value in stats.items():
+                    self.stats[key] += value
+
+                if not matches:
+                    continue
+
+                if remaining is not None:
+                    matches = matches[:remaining]
+                    remaining -= len(matches)
+
+                self.stats["files_matched"] += 1
+                self.stats["total_matches"] += len(matches)
+                yield file_path, matches
+
+                if remaining == 0:
+                    logger.info(f"Stopping after {self.max_matches} matches")
+                    break
+        finally:
+            outcomes.close()
+
+    def iter_search_paths(
+        self, paths: Iterable[Path], recursive: bool = False
+    ) -> Iterator[Tuple[Path, List[Tuple[int, str, str]]]]:
+        """Search files and directories and yield results as they are produced.
+
+        Args:
+            paths: File or directory paths
+            recursive: If True, search subdirectories recursively
+
+        Yields:
+            Tuples (file_path, matches_list) for files with matches
+        """
+        return self.iter_search_files(self._iter_path_files(paths, recursive))
+
+    def search_directory(
+        self, directory: Path, recursive: bool = False
+    ) -> List[Tuple[Path, List[Tuple[int, str, str]]]]:
+        """Search for pattern in all files in a directory.
+
+        Args:
+            directory: Directory path to search
+            recursive: If True, search subdirectories recursively
 
         Returns:
-            Formatted string with search results
+            List of tuples (file_path, matches_list)
         """
-        if not results:
-            return f"No matches found for pattern: {self.pattern}"
+        return list(
+            self.iter_search_files(self._iter_directory_files(directory, recursive))
+        )
 
-        lines = [
-            f"Search Results for Pattern: {self.pattern}",
-            "=" * 80,
-            "",
-            f"Files searched: {self.stats['files_searched']}",
-            f"Files matched: {self.stats['files_matched']}",
-            f"Total matches: {self.stats['total_matches']}",
-            f"Errors: {self.stats['errors']}",
-            "",
-            "-" * 80,
-            "",
-        ]
+    def search_paths(
+        self, paths: List[Path], recursive: bool = False
+    ) -> List[Tuple[Path, List[Tuple[int, str, str]]]]:
+        """Search for pattern in multiple paths (files or directories).
+
+        Args:
+            paths: List of file or directory paths
+            recursive: If True, search subdirectories recursively
+
+        Returns:
+            List of tuples (file_path, matches_list)
+        """
+        return list(self.iter_search_paths(paths, recursive=recursive))
+
+    def iter_formatted_results(
+        self, results: Iterable[Tuple[Path, List[Tuple[int, str, str]]]]
+    ) -> Iterator[str]:
+        """Format search results as readable text, one file at a time.
+
+        Results may be a generator such as iter_search_paths; each file's
+        block is yielded as soon as it arrives, and the summary is yielded
+        last, once the stats are final.
+
+        Args:
+            results: Search results
+
+        Yields:
+            Text chunks, each ending with a newline
+        """
+        found = False
 
         for file_path, matches in results:
-            lines.append(f"File: {file_path}")
-            lines.append(f"Matches: {len(matches)}")
-            lines.append("")
+            if not found:
+                found = True
+                yield f"Search Results for Pattern: {self.pattern}\n{'=' * 80}\n\n"
+
+            lines = [f"File: {file_path}", f"Matches: {len(matches)}", ""]
 
             for line_num, line_content, context in matches:
                 lines.append(f"  Line {line_num}:")
@@ -354,8 +996,50 @@ class TextPatternSearch:
 
             lines.append("-" * 80)
             lines.append("")
+            yield "\n".join(lines) + "\n"
 
-        return "\n".join(lines)
+        if not found:
+            yield f"No matches found for pattern: {self.pattern}\n"
+            return
+
+        summary = [
+            f"Files searched: {self.stats['files_searched']}",
+            f"Files matched: {self.stats['files_matched']}",
+            f"Total matches: {self.stats['total_matches']}",
+            f"Errors: {self.stats['errors']}",
+        ]
+        yield "\n".join(summary) + "\n"
+
+    def write_results(
+        self,
+        results: Iterable[Tuple[Path, List[Tuple[int, str, str]]]],
+        stream: TextIO,
+    ) -> None:
+        """Write formatted results to a stream as they are produced.
+
+        The stream is flushed after every file, so matches show up while
+        the search is still running.
+
+        Args:
+            results: Search results
+            stream: Text stream such as sys.stdout or an open file
+        """
+        for chunk in self.iter_formatted_results(results):
+            stream.write(chunk)
+            stream.flush()
+
+    def format_results(
+        self, results: Iterable[Tuple[Path, List[Tuple[int, str, str]]]]
+    ) -> str:
+        """Format search results as readable text.
+
+        Args:
+            results: Search results
+
+        Returns:
+            Formatted string with search results
+        """
+        return "".join(self.iter_formatted_results(results))
 
 
 def load_config(config_path: Path) -> dict:
@@ -438,6 +1122,29 @@ def main() -> int:
         action="store_true",
         help="Recursively search subdirectories",
     )
+    parser.add_argument(
+        "--mmap",
+        action="store_true",
+        help="Memory-map files and search the whole buffer in one pass",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of worker processes searching files (default: 1)",
+    )
+    parser.add_argument(
+        "--order",
+        choices=TextPatternSearch.RESULT_ORDERS,
+        default="path",
+        help="Report files in path order or as workers finish (default: path)",
+    )
+    parser.add_argument(
+        "--max-matches",
+        type=int,
+        default=None,
+        help="Stop after this many matches",
+    )
     parser.add_argument(
         "--output",
         type=str,
@@ -461,6 +1168,10 @@ def main() -> int:
         file_patterns = args.file_patterns
         exclude_patterns = args.exclude or []
         recursive = args.recursive
+        use_mmap = args.mmap
+        workers = args.workers
+        result_order = args.order
+        max_matches = args.max_matches
 
         if args.config:
             config = load_config(Path(args.config))
@@ -476,6 +1187,14 @@ def main() -> int:
                 exclude_patterns = config["exclude_patterns"]
             if "recursive" in config:
                 recursive = config["recursive"]
+            if "use_mmap" in config:
+                use_mmap = config["use_mmap"]
+            if "workers" in config:
+                workers = config["workers"]
+            if "result_order" in config:
+                result_order = config["result_order"]
+            if "max_matches" in config:
+                max_matches = config["max_matches"]
 
         searcher = TextPatternSearch(
             pattern=pattern,
@@ -484,21 +1203,23 @@ def main() -> int:
             context_lines=context_lines,
             file_patterns=file_patterns,
             exclude_patterns=exclude_patterns,
+            use_mmap=use_mmap,
+            workers=workers,
+            result_order=result_order,
+            max_matches=max_matches,
         )
 
         file_paths = [Path(p) for p in args.paths]
-        results = searcher.search_paths(file_paths, recursive=recursive)
-
-        formatted_results = searcher.format_results(results)
+        results = searcher.iter_search_paths(file_paths, recursive=recursive)
 
         if args.output:
             output_path = Path(args.output)
             output_path.parent.mkdir(parents=True, exist_ok=True)
             with open(output_path, "w") as f:
-                f.write(formatted_results)
+                searcher.write_results(results, f)
             logger.info(f"Results saved to {output_path}")
         else:
-            print(formatted_results)
+            searcher.write_results(results, sys.stdout)
 
         return 0
 
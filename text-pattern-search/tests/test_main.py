@@ -1,5 +1,6 @@
 """Unit tests for text pattern search."""
 
+import io
 import re
 import tempfile
 from pathlib import Path
@@ -9,6 +10,7 @@ import pytest
 import yaml
 
 from src.main import (
+    LiteralPrefilter,
     TextPatternSearch,
     load_config,
 )
@@ -58,6 +60,36 @@ class TestLoadConfig:
             config_path.unlink()
 
 
+class TestLiteralPrefilter:
+    """Test required-literal extraction and buffer prefiltering."""
+
+    def test_required_literal(self):
+        """Test that a buffer without the required literal is rejected."""
+        prefilter = LiteralPrefilter.from_pattern(r"def\s+\w+_handler\(")
+        assert prefilter.might_match(b"x = 1\ndef on_click_handler(event):\n")
+        assert not prefilter.might_match(b"x = 1\ndef other(event):\n")
+
+    def test_alternation(self):
+        """Test that any branch of an alternation satisfies the requirement."""
+        prefilter = LiteralPrefilter.from_pattern(r"(?:ERROR|FATAL): \d+")
+        assert prefilter.might_match(b"FATAL: 3")
+        assert prefilter.might_match(b"ERROR: 3")
+        assert not prefilter.might_match(b"WARNING: 3")
+
+    def test_ignore_case(self):
+        """Test case-insensitive literals, including non-ASCII case folds."""
+        prefilter = LiteralPrefilter.from_pattern("disk", re.IGNORECASE)
+        assert prefilter.might_match(b"DISK full")
+        assert prefilter.might_match("DI\u017fK full".encode("utf-8"))
+        assert not prefilter.might_match(b"memory full")
+
+    def test_no_required_literal(self):
+        """Test that patterns without a required literal get no prefilter."""
+        assert LiteralPrefilter.from_pattern(r"\d+") is None
+        assert LiteralPrefilter.from_pattern(r"(?:error)?\d+") is None
+        assert LiteralPrefilter.from_pattern(r"error|\d+") is None
+
+
 class TestTextPatternSearch:
     """Test TextPatternSearch class."""
 
@@ -299,3 +331,170 @@ class TestTextPatternSearch:
 
             results = searcher.search_paths([dir_path])
             assert len(results) == 1
+
+    def test_search_file_mmap_matches_readlines(self):
+        """Test that mmap mode returns the same matches as line-by-line mode."""
+        content = "".join(f"line {i} {'test' if i % 7 == 0 else 'other'}\n" for i in range(60))
+
+        with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".log") as f:
+            f.write(content + "last TEST line")
+            test_file = Path(f.name)
+
+        try:
+            for pattern, use_regex, case_sensitive in [
+                ("test", False, True),
+                ("test", False, False),
+                (r"\d+ test$", True, True),
+            ]:
+                expected = TextPatternSearch(
+                    pattern, use_regex=use_regex, case_sensitive=case_sensitive
+                ).search_file(test_file)
+                searcher = TextPatternSearch(
+                    pattern,
+                    use_regex=use_regex,
+                    case_sensitive=case_sensitive,
+                    use_mmap=True,
+                )
+                searcher.MMAP_CHUNK_SIZE = 64
+                assert searcher.search_file(test_file) == expected
+        finally:
+            test_file.unlink()
+
+    def test_search_file_mmap_string_anchors_and_lookbehind(self):
+        """Test that mmap mode matches \\A and lookbehinds per line."""
+        with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".txt") as f:
+            f.write("foo\nbar baz\nqux bar\n")
+            test_file = Path(f.name)
+
+        try:
+            for pattern in (r"\Abar", r"(?<!\s)bar"):
+                for use_mmap in (False, True):
+                    searcher = TextPatternSearch(
+                        pattern, use_regex=True, use_mmap=use_mmap, context_lines=0
+                    )
+                    matches = searcher.search_file(test_file)
+                    assert [match[0] for match in matches] == [2]
+        finally:
+            test_file.unlink()
+
+    def test_search_file_mmap_no_match_skips_decoding(self):
+        """Test that a literal without a match returns before decoding."""
+        searcher = TextPatternSearch("missing", use_mmap=True)
+
+        with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".txt") as f:
+            f.write("line 1\nline 2\n")
+            test_file = Path(f.name)
+
+        try:
+            with patch.object(searcher, "_decode") as mock_decode:
+                assert searcher.search_file(test_file) == []
+                mock_decode.assert_not_called()
+        finally:
+            test_file.unlink()
+
+    def test_search_file_mmap_empty_file(self):
+        """Test that mmap mode handles empty files."""
+        searcher = TextPatternSearch("test", use_mmap=True)
+
+        with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".txt") as f:
+            test_file = Path(f.name)
+
+        try:
+            assert searcher.search_file(test_file) == []
+        finally:
+            test_file.unlink()
+
+    def test_init_invalid_result_order(self):
+        """Test that an unknown result order raises ValueError."""
+        with pytest.raises(ValueError):
+            TextPatternSearch("test", result_order="random")
+
+    def test_search_paths_workers_path_order(self):
+        """Test that a worker pool returns the sequential results in order."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            dir_path = Path(tmpdir)
+            for i in range(12):
+                (dir_path / f"file{i:02d}.txt").write_text(f"line {i} test\nother\n")
+            (dir_path / "nomatch.txt").write_text("other\n")
+
+            expected = TextPatternSearch("test").search_paths([dir_path])
+            searcher = TextPatternSearch("test", workers=3)
+            results = searcher.search_paths([dir_path])
+
+            assert results == expected
+            assert searcher.stats["files_searched"] == 13
+            assert searcher.stats["files_matched"] == 12
+
+    def test_search_paths_workers_completion_order(self):
+        """Test that completion order yields every matching file."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            dir_path = Path(tmpdir)
+            for i in range(6):
+                (dir_path / f"file{i}.txt").write_text("test\n")
+
+            searcher = TextPatternSearch("test", workers=2, result_order="completion")
+            results = searcher.search_paths([dir_path])
+
+            assert sorted(path for path, _ in results) == sorted(dir_path.glob("*"))
+
+    def test_search_paths_max_matches(self):
+        """Test that the search stops after max_matches matches."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            dir_path = Path(tmpdir)
+            for i in range(5):
+                (dir_path / f"file{i}.txt").write_text("test\ntest\n")
+
+            for workers in (1, 2):
+                searcher = TextPatternSearch("test", workers=workers, max_matches=3)
+                results = searcher.search_paths([dir_path])
+
+                assert sum(len(matches) for _, matches in results) == 3
+                assert searcher.stats["total_matches"] == 3
+                assert len(results) == 2
+
+    def test_format_results_generator(self):
+        """Test formatting results streamed from iter_search_paths."""
+        searcher = TextPatternSearch("test")
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            dir_path = Path(tmpdir)
+            (dir_path / "file1.txt").write_text("line with test\n")
+
+            formatted = searcher.format_results(searcher.iter_search_paths([dir_path]))
+
+            assert "Files matched: 1" in formatted
+            assert "line with test" in formatted
+
+    def test_write_results_streams_each_file(self):
+        """Test each file is written before the next result is produced."""
+        searcher = TextPatternSearch("test")
+        stream = io.StringIO()
+
+        def results():
+            yield Path("first.txt"), [(1, "first test", "")]
+            assert "first test" in stream.getvalue()
+            yield Path("second.txt"), [(2, "second test", "")]
+
+        searcher.write_results(results(), stream)
+
+        output = stream.getvalue()
+        assert output.startswith("Search Results for Pattern: test")
+        assert output.index("first.txt") < output.index("second.txt")
+        assert output.index("second.txt") < output.index("Files searched")
+
+    def test_search_file_prefilter_skips_file(self):
+        """Test that files lacking the required literal are not regex-searched."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            dir_path = Path(tmpdir)
+            (dir_path / "hit.log").write_text("ok\nuser=17 ERROR disk\n")
+            (dir_path / "miss.log").write_text("ok\nuser=17 INFO\n")
+
+            for use_mmap in (False, True):
+                searcher = TextPatternSearch(
+                    r"user=\d+ ERROR", use_regex=True, use_mmap=use_mmap
+                )
+                results = searcher.search_paths([dir_path])
+
+                assert [path.name for path, _ in results] == ["hit.log"]
+                assert results[0][1][0][0] == 2
+                assert searcher.stats["files_prefiltered"] == 1